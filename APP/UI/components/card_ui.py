@@ -1,9 +1,13 @@
 import pygame
 from APP.UI.styles import colors
-from APP.UI.styles.fonts import get_fonts
+from APP.UI.styles.fonts import get_fonts, render_texto
 from APP.domain.models.card_model import CardModel
 
 class CardUI:
+    # Sem arte no disco, a carta volta a procurar a imagem neste intervalo
+    # (o download em segundo plano pode entregá-la no meio da partida)
+    INTERVALO_NOVA_TENTATIVA_MS = 1000
+
     def __init__(self, card_model: CardModel, asset_manager, x: int, y: int, w: int = 75, h: int = 105):
         """
         Componente Visual da Carta corrigido para Suportar Zoom e Bloqueio Visual.
@@ -16,8 +20,10 @@ class CardUI:
         self.is_hovered = False
         self.is_disabled = False # PULO DO GATO: Flag para escurecer a carta
         
-        self._img_surface = None
-        self._img_tapped = None
+        # Só a imagem de reserva (carta sem arte) fica neste objeto; as
+        # variantes com arte vêm prontas do cache compartilhado do AssetManager
+        self._img_fallback = None
+        self._proxima_tentativa = 0 # pygame.time.get_ticks() da próxima busca pela arte
         self._last_size = (w, h) # Controle para atualizar o zoom
 
     def update_position(self, x: int, y: int):
@@ -36,50 +42,48 @@ class CardUI:
     def draw(self, screen):
         """Renderiza a carta com suporte a zoom dinâmico e filtro de bloqueio."""
         
-        # 1. Checagem de Redimensionamento (Zoom de Grupo)
-        # Se o tamanho mudou, precisamos limpar as imagens em cache para re-escalar
-        if (self.rect.width, self.rect.height) != self._last_size:
-            self._img_surface = None
-            self._img_tapped = None
-            self._last_size = (self.rect.width, self.rect.height)
-
-        # 2. Carregamento da Imagem
-        if self._img_surface is None:
-            caminho_direto = self.card.local_image_path
-            img_bruta = self.asset_manager.get_card_image(caminho_direto)
-            
-            if img_bruta:
-                self._img_surface = pygame.transform.smoothscale(img_bruta, (self.rect.width, self.rect.height))
-                self._img_tapped = pygame.transform.rotate(self._img_surface, -90)
-            else:
-                # Fallback se a imagem falhar
-                self._img_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        # 1. Imagem pronta do cache compartilhado (escalada, virada e escurecida uma única vez)
+        rotacao = -90 if self.card.is_tapped else 0
+        imagem_final = None
+        agora = pygame.time.get_ticks()
+        if agora >= self._proxima_tentativa:
+            imagem_final = self.asset_manager.get_card_variant(
+                self.card.local_image_path, self.rect.width, self.rect.height, rotacao, self.is_disabled
+            )
+            # Sem arte no disco: não insiste a cada frame, mas tenta de novo mais tarde
+            if imagem_final is None:
+                self._proxima_tentativa = agora + self.INTERVALO_NOVA_TENTATIVA_MS
+
+        # 2. Fallback se a imagem falhar (desenhado uma vez por tamanho)
+        if imagem_final is None:
+            if self._img_fallback is None or (self.rect.width, self.rect.height) != self._last_size:
+                self._last_size = (self.rect.width, self.rect.height)
+                self._img_fallback = pygame.Surface(self._last_size, pygame.SRCALPHA)
                 cor = (40, 80, 40) if self.card.is_land else (40, 40, 70)
-                pygame.draw.rect(self._img_surface, cor, self._img_surface.get_rect(), border_radius=5)
+                pygame.draw.rect(self._img_fallback, cor, self._img_fallback.get_rect(), border_radius=5)
                 txt_nome = self.fontes['status'].render(self.card.name[:12], True, (255, 255, 255))
-                self._img_surface.blit(txt_nome, (5, 5))
-
-        # 3. Define a Imagem Final (Normal ou Virada)
-        imagem_final = self._img_tapped if self.card.is_tapped and self._img_tapped else self._img_surface.copy()
+                self._img_fallback.blit(txt_nome, (5, 5))
 
-        # 4. FILTRO DE BLOQUEIO (Regra do Machete)
-        # Se a carta não puder ser jogada, desenha uma camada preta por cima
-        if self.is_disabled:
-            filtro_escuro = pygame.Surface(imagem_final.get_size(), pygame.SRCALPHA)
-            filtro_escuro.fill((0, 0, 0, 160)) # Preto semitransparente
-            imagem_final.blit(filtro_escuro, (0, 0))
+            imagem_final = self._img_fallback
+            # 3. FILTRO DE BLOQUEIO (Regra do Machete)
+            # Se a carta não puder ser jogada, desenha uma camada preta por cima
+            if self.is_disabled:
+                imagem_final = imagem_final.copy()
+                filtro_escuro = pygame.Surface(imagem_final.get_size(), pygame.SRCALPHA)
+                filtro_escuro.fill((0, 0, 0, 160)) # Preto semitransparente
+                imagem_final.blit(filtro_escuro, (0, 0))
 
         pos_desenho = imagem_final.get_rect(center=self.rect.center)
 
-        # 5. Sombra (Apenas se não estiver bloqueada)
+        # 4. Sombra (Apenas se não estiver bloqueada)
         if self.is_hovered and not self.is_disabled:
             sombra_rect = pos_desenho.move(4, 4)
             pygame.draw.rect(screen, (0, 0, 0, 80), sombra_rect, border_radius=5)
 
-        # 6. Desenha a Carta
+        # 5. Desenha a Carta
         screen.blit(imagem_final, pos_desenho.topleft)
 
-        # 7. Bordas e Destaques
+        # 6. Bordas e Destaques
         borda_cor = colors.TEXT_SEC
         borda_w = 1
 
@@ -91,7 +95,7 @@ class CardUI:
 
         pygame.draw.rect(screen, borda_cor, pos_desenho, borda_w, border_radius=5)
 
-        # 8. Marcadores
+        # 7. Marcadores
         if self.card.counters:
             self._draw_counters(screen, pos_desenho)
 
@@ -99,6 +103,6 @@ class CardUI:
         count_pos = [draw_rect.right - 12, draw_rect.bottom - 12]
         for tipo, qtd in self.card.counters.items():
             pygame.draw.circle(screen, (220, 20, 20), count_pos, 10)
-            txt = self.fontes['status'].render(str(qtd), True, (255, 255, 255))
+            txt = render_texto('status', str(qtd), (255, 255, 255))
             screen.blit(txt, (count_pos[0] - 5, count_pos[1] - 8))
             count_pos[1] -= 22
\ No newline at end of file
@@ -1,6 +1,7 @@
 import pygame
 import os
 from APP.UI.styles.colors import SUCCESS, TEXT_SEC
+from APP.UI.styles.fonts import render_texto
 
 class ManaBarUI:
     def __init__(self, fontes):
@@ -77,6 +78,6 @@ class ManaBarUI:
             
             # Desenha a quantidade ao lado do ícone
             cor_qtd = SUCCESS if qtd > 0 else TEXT_SEC
-            txt_qtd = self.fontes['label'].render(str(qtd), True, cor_qtd)
+            txt_qtd = render_texto('label', str(qtd), cor_qtd)
             # Alinhamento vertical centralizado com o ícone de 24px
             screen.blit(txt_qtd, (x + 28, y + (12 - txt_qtd.get_height() // 2)))
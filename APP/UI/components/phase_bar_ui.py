@@ -1,5 +1,6 @@
 import pygame
 from APP.UI.styles.colors import TEXT_SEC, ACCENT, SUCCESS
+from APP.UI.styles.fonts import render_texto
 
 class PhaseBarUI:
     def __init__(self, largura_tela, altura_tela, fontes):
@@ -20,7 +21,7 @@ class PhaseBarUI:
         pygame.draw.rect(screen, (50, 50, 60), (0, altura_barra - 2, self.largura, 2))
 
         # 2. Informação do Jogador Ativo (Canto esquerdo)
-        txt_turno = self.fontes['label'].render(f"TURNO DE: {jogador_ativo_nome.upper()}", True, SUCCESS)
+        txt_turno = render_texto('label', f"TURNO DE: {jogador_ativo_nome.upper()}", SUCCESS)
         screen.blit(txt_turno, (20, (altura_barra // 2) - (txt_turno.get_height() // 2)))
 
         # 3. Posicionamento das Fases (Centralizado)
@@ -37,12 +38,12 @@ class PhaseBarUI:
             
             if fase == fase_atual:
                 # Fase Ativa: Texto em destaque com sublinhado neon
-                txt = self.fontes['label'].render(fase, True, ACCENT)
+                txt = render_texto('label', fase, ACCENT)
                 screen.blit(txt, (x, y_texto))
                 
                 # Barra neon de progresso abaixo da fase atual
                 pygame.draw.rect(screen, ACCENT, (x, y_texto + 22, txt.get_width(), 3), border_radius=2)
             else:
                 # Fases Inativas: Texto cinza discreto
-                txt = self.fontes['status'].render(fase, True, TEXT_SEC)
+                txt = render_texto('status', fase, TEXT_SEC)
                 screen.blit(txt, (x, y_texto + 2))
\ No newline at end of file
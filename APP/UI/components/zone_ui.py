@@ -1,6 +1,6 @@
 import pygame
 from APP.UI.styles import colors
-from APP.UI.styles.fonts import get_fonts
+from APP.UI.styles.fonts import get_fonts, render_texto
 from APP.UI.layout.grid import LayoutEngine
 
 class ZoneUI:
@@ -16,13 +16,27 @@ class ZoneUI:
         self.fontes = get_fonts()
         
         self.cards_ui = [] # Lista de componentes CardUI
+        # Última revisão do modelo aplicada (controlada pelo GameUIManager)
+        self.revisao_modelo = None
 
     def clear_cards(self):
         self.cards_ui.clear()
+        self.revisao_modelo = None
 
     def add_card_ui(self, card_ui):
         self.cards_ui.append(card_ui)
 
+    def aplicar_cards(self, novos_cards_ui) -> bool:
+        """
+        Troca o conteúdo da zona mantendo a mesma lista (retained mode).
+        Só altera se alguma carta entrou, saiu ou mudou de posição.
+        """
+        atuais = self.cards_ui
+        if len(atuais) == len(novos_cards_ui) and all(a is b for a, b in zip(atuais, novos_cards_ui)):
+            return False
+        atuais[:] = novos_cards_ui
+        return True
+
     def draw(self, screen):
         """Renderiza a zona e organiza as cartas internamente."""
         # 1. Desenha o Fundo da Zona
@@ -30,7 +44,7 @@ class ZoneUI:
         pygame.draw.rect(screen, (80, 80, 100), self.rect, 2, border_radius=8)
         
         # 2. Título da Zona
-        txt = self.fontes['status'].render(self.title, True, (200, 200, 200))
+        txt = render_texto('status', self.title, (200, 200, 200))
         screen.blit(txt, (self.rect.x + 10, self.rect.y + 5))
 
         if not self.cards_ui:
@@ -1,13 +1,15 @@
 import pygame
-from pathlib import Path
 from APP.UI.screens.base_screens import BaseScreen
 from APP.UI.styles import colors
-from APP.UI.styles.fonts import get_fonts
+from APP.UI.styles.fonts import get_fonts, render_texto
 from APP.UI.components.button import MenuButton
 from APP.UI.components.label import Label
 from APP.UI.layout.grid import LayoutEngine 
 
 class DeckManagerView(BaseScreen):
+    # Capas que ainda não carregaram (arte baixando, arquivo ilegível) são pedidas de novo neste intervalo
+    INTERVALO_NOVA_TENTATIVA_MS = 1000
+
     def __init__(self, screen, controller, deck_ctrl):
         super().__init__(screen, controller)
         self.deck_ctrl = deck_ctrl
@@ -43,26 +45,38 @@ class DeckManagerView(BaseScreen):
         self.btn_prev = MenuButton(pygame.Rect(20, self.cy - 30, 50, 60), "<", self.fontes['menu'])
         self.btn_next = MenuButton(pygame.Rect(self.screen.get_width() - 70, self.cy - 30, 50, 60), ">", self.fontes['menu'])
         
-        self.img_cache_local = {}
+        # Capas em miniatura: geradas/lidas numa thread de fundo (AppController.thumbnails)
+        self.thumbnails = getattr(self.controller, 'thumbnails', None)
+        self._pagina_solicitada = None
+        self._proxima_solicitacao = 0 # pygame.time.get_ticks() do próximo pedido da mesma página
 
         if hasattr(self.deck_ctrl, 'reload_data'):
             self.deck_ctrl.reload_data()
 
+    def _solicitar_capas(self):
+        """
+        Pede as capas da página atual e, logo atrás na fila, as da próxima.
+        As que já chegaram são ignoradas pelo ThumbnailLoader; as que falharam
+        voltam para a fila no próximo pedido.
+        """
+        if self.thumbnails is None:
+            return
+        chave = (self.deck_ctrl.pagina_atual, len(self.deck_ctrl.decks_disponiveis))
+        agora = pygame.time.get_ticks()
+        if chave == self._pagina_solicitada and agora < self._proxima_solicitacao:
+            return
+        self._pagina_solicitada = chave
+        self._proxima_solicitacao = agora + self.INTERVALO_NOVA_TENTATIVA_MS
+
+        pagina = self.deck_ctrl.pagina_atual
+        decks = self.deck_ctrl.obter_decks_pagina(pagina) + self.deck_ctrl.obter_decks_pagina(pagina + 1)
+        self.thumbnails.solicitar(deck.get('cover_image_path') for deck in decks)
+
     def _get_local_image_small(self, caminho):
-        """Lê e redimensiona a imagem para o tamanho da grade."""
-        if not caminho: return None
-        if caminho in self.img_cache_local: return self.img_cache_local[caminho]
-        
-        try:
-            caminho_fisico = Path(caminho)
-            if caminho_fisico.exists():
-                surf = pygame.image.load(str(caminho_fisico)).convert_alpha()
-                surf = pygame.transform.smoothscale(surf, (self.deck_w, self.deck_h))
-                self.img_cache_local[caminho] = surf
-                return surf
-        except Exception:
+        """Miniatura da capa, ou None enquanto ela ainda está sendo preparada."""
+        if not caminho or self.thumbnails is None:
             return None
-        return None
+        return self.thumbnails.obter(caminho)
 
     def handle_events(self, events):
         mouse_pos = pygame.mouse.get_pos()
@@ -112,6 +126,7 @@ class DeckManagerView(BaseScreen):
         total_total = len(self.deck_ctrl.decks_disponiveis)
         Label(f"COLEÇÃO: {total_total} DECKS", (self.cx, 95), self.fontes['label'], colors.TEXT_SEC).draw(self.screen)
 
+        self._solicitar_capas()
         decks_pagina = self.deck_ctrl.obter_decks_pagina_atual()
         
         if not decks_pagina:
@@ -132,11 +147,15 @@ class DeckManagerView(BaseScreen):
                 if surf:
                     self.screen.blit(surf, rect_capa)
                 else:
+                    # Placeholder até a miniatura chegar da thread de fundo
                     pygame.draw.rect(self.screen, (40, 40, 45), rect_capa, border_radius=5)
-                    
+                    if deck.get('cover_image_path'):
+                        txt_carregando = render_texto('status', "...", colors.TEXT_SEC)
+                        self.screen.blit(txt_carregando, txt_carregando.get_rect(center=rect_capa.center))
+
                 pygame.draw.rect(self.screen, colors.INPUT_BORDER, rect_capa, 2, border_radius=5)
                 
-                txt_nome = self.fontes['status'].render(deck['name'][:18], True, colors.TEXT_PRIMARY)
+                txt_nome = render_texto('status', deck['name'][:18], colors.TEXT_PRIMARY)
                 self.screen.blit(txt_nome, (x + 5, y + self.deck_h + 8))
 
             if self.deck_ctrl.total_paginas() > 1:
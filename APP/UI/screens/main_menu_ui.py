@@ -1,7 +1,7 @@
 import pygame
 from pathlib import Path
 from APP.UI.styles import colors, settings
-from APP.UI.styles.fonts import get_fonts
+from APP.UI.styles.fonts import get_fonts, render_texto
 from APP.UI.components.button import MenuButton
 from APP.UI.components.label import Label
 from APP.UI.components.popup import Popup
@@ -118,7 +118,7 @@ class MainMenu:
 
         if deck_info:
             # 1. Título acima da carta (DECK PRONTO)
-            txt_status = self.fontes['label'].render("DECK PRONTO", True, colors.SUCCESS)
+            txt_status = render_texto('label', "DECK PRONTO", colors.SUCCESS)
             self.screen.blit(txt_status, (canto_x + 60 - txt_status.get_width()//2, canto_y - 25))
             
             # 2. Imagem da Carta
@@ -132,18 +132,18 @@ class MainMenu:
             
             # 4. Nome do Deck logo abaixo da imagem
             nome_display = deck_info['name'][:14] + "..." if len(deck_info['name']) > 14 else deck_info['name']
-            txt_nome = self.fontes['status'].render(nome_display.upper(), True, colors.TEXT_PRIMARY)
+            txt_nome = render_texto('status', nome_display.upper(), colors.TEXT_PRIMARY)
             self.screen.blit(txt_nome, (canto_x + 60 - txt_nome.get_width()//2, canto_y + 175))
             
         else:
             # Se não tiver deck selecionado, desenha um slot vazio em vermelho
-            txt_status = self.fontes['label'].render("SEM DECK", True, colors.DANGER)
+            txt_status = render_texto('label', "SEM DECK", colors.DANGER)
             self.screen.blit(txt_status, (canto_x + 60 - txt_status.get_width()//2, canto_y - 25))
             
             pygame.draw.rect(self.screen, (30, 30, 35), rect_capa, border_radius=5)
             pygame.draw.rect(self.screen, colors.DANGER, rect_capa, 2, border_radius=5)
             
-            txt_aviso = self.fontes['status'].render("Vá em Meus Decks", True, colors.TEXT_SEC)
+            txt_aviso = render_texto('status', "Vá em Meus Decks", colors.TEXT_SEC)
             self.screen.blit(txt_aviso, (canto_x + 60 - txt_aviso.get_width()//2, canto_y + 70))
         # -------------------------------------------------------------
 
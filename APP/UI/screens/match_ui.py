@@ -4,7 +4,7 @@ import math
 import os
 from APP.UI.screens.base_screens import BaseScreen
 from APP.UI.styles.colors import BG, TEXT_PRIMARY, TEXT_SEC, ACCENT, SUCCESS, DANGER
-from APP.UI.styles.fonts import get_fonts
+from APP.UI.styles.fonts import get_fonts, render_texto
 from APP.UI.components.card_ui import CardUI
 from APP.UI.components.zone_ui import ZoneUI
 from APP.UI.layout.grid import LayoutEngine
@@ -197,7 +197,7 @@ class MatchView(BaseScreen):
         area = self._get_area_jogador(id_v, 2)
         pygame.draw.rect(self.screen, (30, 30, 45) if id_v==1 else (25, 25, 35), area)
         
-        txt = self.fontes['label'].render(f"{player.name.upper()} | {player.life} PV", True, TEXT_PRIMARY)
+        txt = render_texto('label', f"{player.name.upper()} | {player.life} PV", TEXT_PRIMARY)
         self.screen.blit(txt, (area.centerx - txt.get_width()//2, area.y + 10))
         
         self.mana_bar_ui.draw(self.screen, player, area)
@@ -211,7 +211,7 @@ class MatchView(BaseScreen):
         if id_v == 1: 
             self._renderizar_mao(player.hand, area)
         else:
-            txt_m = self.fontes['label'].render(f"Mão: {len(player.hand)} cartas", True, TEXT_SEC)
+            txt_m = render_texto('label', f"Mão: {len(player.hand)} cartas", TEXT_SEC)
             self.screen.blit(txt_m, (area.centerx - txt_m.get_width()//2, area.bottom - 25))
 
     def _renderizar_mao(self, h_m, area):
@@ -258,14 +258,14 @@ class MatchView(BaseScreen):
         for i in range(5):
             self._render_verso_simples(pygame.Rect(cx - w//2 - dist - (i*6), cy - h//2, w, h))
             self._render_verso_simples(pygame.Rect(cx - w//2 + dist + (i*6), cy - h//2, w, h))
-        txt = self.fontes['titulo'].render(f"EMBARALHANDO{'.' * ((t // 300) % 4)}", True, ACCENT)
+        txt = render_texto('titulo', f"EMBARALHANDO{'.' * ((t // 300) % 4)}", ACCENT)
         self.screen.blit(txt, (cx - txt.get_width()//2, cy + h + 20))
 
     def _desenhar_painel_mulligan(self, cx, cy):
         caixa = pygame.Rect(cx - 200, cy - 80, 400, 160)
         pygame.draw.rect(self.screen, (30, 30, 35), caixa, border_radius=10)
         pygame.draw.rect(self.screen, ACCENT, caixa, 2, border_radius=10)
-        txt = self.fontes['label'].render("MÃO INICIAL ESTÁ BOA?", True, TEXT_PRIMARY)
+        txt = render_texto('label', "MÃO INICIAL ESTÁ BOA?", TEXT_PRIMARY)
         self.screen.blit(txt, (cx - txt.get_width()//2, cy - 60))
         self.btn_manter_mao.draw(self.screen); self.btn_trocar_mao.draw(self.screen)
 
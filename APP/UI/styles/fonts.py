@@ -1,15 +1,48 @@
 # fonts.py
 import pygame
+from collections import OrderedDict
+
+# Registro único do processo: as SysFont são criadas uma vez e compartilhadas
+_FONTES = None
+
+# Cache dos textos já renderizados: {(estilo, texto, cor, antialias): Surface}
+_TEXTOS = OrderedDict()
+LIMITE_TEXTOS = 512
 
 def get_fonts():
-    """Retorna as fontes instaladas no sistema."""
-    if not pygame.font.get_init():
-        pygame.font.init()
-
-    return {
-        'titulo': pygame.font.SysFont("Georgia", 60, bold=True),
-        'menu':   pygame.font.SysFont("Verdana", 22),             
-        'label':  pygame.font.SysFont("Verdana", 16, bold=True), 
-        'status': pygame.font.SysFont("Arial", 14),             
-        'popup':  pygame.font.SysFont("Georgia", 24, italic=True)
-    }
\ No newline at end of file
+    """Retorna as fontes instaladas no sistema (sempre o mesmo dicionário)."""
+    global _FONTES
+    if _FONTES is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+
+        _FONTES = {
+            'titulo': pygame.font.SysFont("Georgia", 60, bold=True),
+            'menu':   pygame.font.SysFont("Verdana", 22),
+            'label':  pygame.font.SysFont("Verdana", 16, bold=True),
+            'status': pygame.font.SysFont("Arial", 14),
+            'popup':  pygame.font.SysFont("Georgia", 24, italic=True)
+        }
+    return _FONTES
+
+def render_texto(estilo: str, texto: str, cor, antialias: bool = True):
+    """
+    Renderiza um texto com a fonte do registro, reaproveitando a Surface
+    quando o mesmo texto/cor já foi desenhado (títulos de zona, vida, contadores).
+    A Surface devolvida é compartilhada: use só para blit, nunca altere.
+    """
+    chave = (estilo, texto, tuple(cor), antialias)
+    surface = _TEXTOS.get(chave)
+    if surface is not None:
+        _TEXTOS.move_to_end(chave)
+        return surface
+
+    surface = get_fonts()[estilo].render(texto, antialias, cor)
+    _TEXTOS[chave] = surface
+    if len(_TEXTOS) > LIMITE_TEXTOS:
+        _TEXTOS.popitem(last=False)
+    return surface
+
+def limpar_cache_textos():
+    """Esquece os textos renderizados (ex: troca de tela)."""
+    _TEXTOS.clear()
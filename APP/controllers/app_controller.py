@@ -9,9 +9,11 @@ from APP.controllers.match_controller import MatchController
 from APP.controllers.game_ui_manager import GameUIManager 
 
 from APP.infrastructure.storage.deck_repository import DeckRepository
+from APP.infrastructure.storage.card_repository import CardRepository
 from APP.infrastructure.services.scryfall_service import ScryfallService
 from APP.infrastructure.services.image_downloader import ImageDownloader
 from APP.infrastructure.services.asset_manager import AssetManager
+from APP.infrastructure.services.thumbnail_loader import ThumbnailLoader
 from APP.domain.models.deck_model import DeckModel
 
 # --- Importação das Telas (Views) ---
@@ -33,10 +35,12 @@ class AppController:
         self.screen_manager = ScreenManager()
 
         # 2. Injeção de dependências (Serviços e Repositórios)
-        self.deck_repo = DeckRepository()
-        self.scryfall = ScryfallService()
+        self.card_repo = CardRepository()
+        self.deck_repo = DeckRepository(card_repo=self.card_repo)
+        self.scryfall = ScryfallService(card_repo=self.card_repo)
         self.downloader = ImageDownloader()
         self.asset_manager = AssetManager()
+        self.thumbnails = ThumbnailLoader()
         self.deck_model = DeckModel()
 
         # 3. Inicialização dos Sub-Controladores
@@ -69,6 +73,12 @@ class AppController:
     def run(self):
         """Inicia o loop principal do jogo."""
         self.engine.run(self.screen_manager, self._handle_transitions)
+        self._encerrar_partida()
+
+    def _encerrar_partida(self):
+        """Libera o que a partida em andamento mantém vivo (ex: workers do bot)."""
+        if self.match_ctrl:
+            self.match_ctrl.encerrar()
 
     def _handle_transitions(self, action):
         """
@@ -78,6 +88,7 @@ class AppController:
         if action == "MENU":
             # Limpa cache de partida ao voltar ao menu para liberar RAM
             if self.match_ctrl:
+                self._encerrar_partida()
                 self.asset_manager.limpar_cache()
             
             # CORREÇÃO: Enviando o deck_ctrl aqui também na transição de volta
@@ -109,6 +120,7 @@ class AppController:
                     ui_manager = GameUIManager(self.asset_manager)
                     
                     # 2. Injeta o ui_manager no MatchController (Árbitro)
+                    self._encerrar_partida()
                     self.match_ctrl = MatchController(ui_manager)
                     
                     # 3. Prepara os dados (Grimório, Mão, Vida)
@@ -126,4 +138,5 @@ class AppController:
 
         # 5. FINALIZAR APLICAÇÃO
         elif action in ["QUIT", "SAIR"]:
+            self._encerrar_partida()
             self.engine.running = False
\ No newline at end of file
@@ -1,6 +1,3 @@
-import json
-import re  # ADICIONADO: Para limpar o nome do arquivo corretamente
-from pathlib import Path
 import math
 
 class DeckController:
@@ -30,7 +27,7 @@ class DeckController:
     def reload_data(self):
         """
         Lê o 'profiler.json' e carrega os metadados dos decks salvos.
-        Busca a imagem do comandante para servir de capa na galeria.
+        A capa (imagem do comandante) e a contagem vêm do índice da galeria.
         """
         self.decks_disponiveis.clear()
         
@@ -42,33 +39,15 @@ class DeckController:
             print(f"[AVISO] Erro ao ler perfil na Galeria: {e}")
             lista_decks_perfil = []
 
-        for ref_deck in lista_decks_perfil:
-            nome_deck = ref_deck.get("name", "Sem Nome")
-            nome_comandante = ref_deck.get("commander", "Desconhecido")
-            caminho_capa = ""
-            
-            # PULO DO GATO 2: Limpeza idêntica à do DeckRepository
-            nome_bruto = nome_deck.strip().lower().replace(" ", "_")
-            nome_limpo = re.sub(r'[^a-z0-9_]', '', nome_bruto)
-            
-            caminho_arquivo = Path("data/decks") / f"{nome_limpo}.json"
-            
-            if caminho_arquivo.exists():
-                try:
-                    with open(caminho_arquivo, 'r', encoding='utf-8') as f:
-                        dados_fisicos = json.load(f)
-                        # Busca a referência da imagem do comandante
-                        for carta in dados_fisicos.get("cards", []):
-                            if carta.get("name") == nome_comandante:
-                                caminho_capa = carta.get("ref_image", "")
-                                break
-                except Exception as e:
-                    print(f"Erro ao carregar capa de {nome_deck}: {e}")
+        # O índice da galeria só relê os decks cujo arquivo mudou desde a última vez
+        resumos = self.deck_repo.resumos_galeria([ref.get("name", "Sem Nome") for ref in lista_decks_perfil])
 
+        for ref_deck, resumo in zip(lista_decks_perfil, resumos):
             self.decks_disponiveis.append({
-                "name": nome_deck,
-                "commander": nome_comandante,
-                "cover_image_path": caminho_capa
+                "name": ref_deck.get("name", "Sem Nome"),
+                "commander": ref_deck.get("commander", "Desconhecido"),
+                "cover_image_path": resumo["cover_image_path"] if resumo else "",
+                "total_cards": resumo["total_cards"] if resumo else 0
             })
             
         # Reseta para a primeira página após recarregar
@@ -76,12 +55,18 @@ class DeckController:
 
     # --- Lógica de Paginação ---
 
-    def obter_decks_pagina_atual(self):
-        """Retorna a fatia da lista de decks correspondente à página atual."""
-        inicio = self.pagina_atual * self.decks_por_pagina
+    def obter_decks_pagina(self, pagina):
+        """Retorna a fatia da lista de decks de uma página qualquer (vazia se não existir)."""
+        if pagina < 0:
+            return []
+        inicio = pagina * self.decks_por_pagina
         fim = inicio + self.decks_por_pagina
         return self.decks_disponiveis[inicio:fim]
 
+    def obter_decks_pagina_atual(self):
+        """Retorna a fatia da lista de decks correspondente à página atual."""
+        return self.obter_decks_pagina(self.pagina_atual)
+
     def total_paginas(self):
         """Calcula o número total de páginas baseado na quantidade de decks."""
         return max(1, math.ceil(len(self.decks_disponiveis) / self.decks_por_pagina))
@@ -60,13 +60,11 @@ class DeckRegisterController:
                 nomes_lista.append(nome)
                 mapa_quantidades[nome] = qtd
 
-            cartas_retornadas = []
-            for i in range(0, len(nomes_lista), 75):
-                lote = nomes_lista[i:i+75]
-                resultados = self.scryfall.buscar_lote_cartas(lote)
-                if resultados:
-                    cartas_retornadas.extend(resultados)
-                self.progresso = 15 + int((i / len(nomes_lista)) * 60)
+            def ao_progredir(concluidos, total):
+                self.progresso = 15 + int((concluidos / total) * 60)
+
+            # Lotes de 75 em paralelo; cartas já conhecidas não vão para a rede
+            cartas_retornadas = self.scryfall.buscar_lote_cartas(nomes_lista, ao_progredir)
 
             for dados in cartas_retornadas:
                 if not dados or not isinstance(dados, dict): continue
@@ -140,14 +138,15 @@ class DeckRegisterController:
         Isso permite que o simulador saiba que mana o terreno gera sem consultar a web.
         """
         cartas_estruturadas = []
-        total = len(deck_final['cards'])
+
+        def ao_progredir(concluidas, total, nome_carta):
+            self.carta_atual_nome = nome_carta
+            self.progresso = int((concluidas / total) * 100)
+
+        # Downloads em paralelo; os resultados voltam na ordem do deck
+        resultados = self.image_downloader.garantir_lote(deck_final['cards'], ao_progredir)
         
-        for index, carta_data in enumerate(deck_final['cards']):
-            self.carta_atual_nome = carta_data.get('name', 'Desconhecido')
-            self.progresso = int(((index + 1) / total) * 100)
-            
-            dados_locais = self.image_downloader.garantir_imagem_e_dados(carta_data)
-            
+        for carta_data, dados_locais in zip(deck_final['cards'], resultados):
             if dados_locais:
                 # 🔥 AQUI ESTÁ A MUDANÇA: Extraímos o 'produced_mana' direto dos dados da Scryfall
                 # que foram coletados no método _processar_lista_batch.
@@ -13,44 +13,82 @@ class GameUIManager:
         # Isso garante que cada carta física tenha apenas UM objeto visual na RAM
         self.ui_cards_cache = {}
 
-    def sincronizar_zona_visual(self, zona_ui, lista_modelos_cards):
+        # Revisões das mãos na última fixação de imagens no AssetManager
+        self._revisao_fixados = None
+
+    # Zona visual -> zonas do PlayerModel que ela mostra (o CAMPO junta duas)
+    MAPA_ZONAS = {
+        "MANA": ("battlefield_lands",),
+        "CAMPO": ("battlefield_creatures", "battlefield_other"),
+        "CEMITERIO": ("graveyard",),
+        "EXILIO": ("exile",),
+        "COMANDANTE": ("commander_zone",),
+    }
+
+    def sincronizar_zona_visual(self, zona_ui, *zonas_modelo) -> bool:
         """
-        Pega as cartas do Modelo (dados) e as injeta na Zona da Interface.
+        Aplica na Zona da Interface apenas o que mudou no Modelo.
         :param zona_ui: Instância de ZoneUI (Campo, Mana, etc)
-        :param lista_modelos_cards: Lista de objetos CardModel vindo do PlayerModel
+        :param zonas_modelo: Uma ou mais listas de CardModel vindas do PlayerModel
+        :return: True se a zona visual foi alterada.
         """
-        zona_ui.clear_cards()
-        
-        for model in lista_modelos_cards:
-            # Usamos o ID único do objeto na memória como chave do cache
-            card_id = id(model)
-            
-            if card_id not in self.ui_cards_cache:
-                # Se a carta é nova, criamos o componente visual dela
-                # O tamanho (w, h) aqui é o padrão, a ZoneUI pode ajustar depois
-                novo_card_ui = CardUI(model, self.asset_manager, 0, 0)
-                self.ui_cards_cache[card_id] = novo_card_ui
-            
-            # Adiciona o componente visual na zona correspondente
-            zona_ui.add_card_ui(self.ui_cards_cache[card_id])
+        # Revisões das ZoneModel (listas comuns não têm revisão e sempre sincronizam)
+        revisoes = tuple((id(z), getattr(z, 'revisao', None)) for z in zonas_modelo)
+        if None not in (r for _, r in revisoes) and zona_ui.revisao_modelo == revisoes:
+            return False
+        zona_ui.revisao_modelo = revisoes
 
-    def preparar_mesa_inicial(self, match_model, zonas_por_jogador):
+        novos = []
+        for lista in zonas_modelo:
+            for model in lista:
+                # Usamos o ID único do objeto na memória como chave do cache
+                card_id = id(model)
+                
+                if card_id not in self.ui_cards_cache:
+                    # Se a carta é nova, criamos o componente visual dela
+                    # O tamanho (w, h) aqui é o padrão, a ZoneUI pode ajustar depois
+                    self.ui_cards_cache[card_id] = CardUI(model, self.asset_manager, 0, 0)
+                novos.append(self.ui_cards_cache[card_id])
+
+        # Só mexe na lista da zona se entrou, saiu ou trocou de lugar alguma carta
+        return zona_ui.aplicar_cards(novos)
+
+    def sincronizar_mesa(self, match_model, zonas_por_jogador):
         """
-        Faz a primeira sincronização de todas as zonas da mesa.
+        Chamado a cada frame: só as zonas cujo modelo mudou são refeitas.
         :param zonas_por_jogador: O dicionário de zonas que criamos na MatchView
         """
+        mudou = False
         for p_id, zonas in zonas_por_jogador.items():
             player = match_model.players[p_id]
-            
-            # Sincroniza cada parte do campo
-            self.sincronizar_zona_visual(zonas["CAMPO"], player.battlefield_creatures)
-            self.sincronizar_zona_visual(zonas["MANA"], player.battlefield_lands)
-            self.sincronizar_zona_visual(zonas["CEMITERIO"], player.graveyard)
-            self.sincronizar_zona_visual(zonas["EXILIO"], player.exile)
-            
-            # Comandante (Tratado como uma lista de 1 carta para reaproveitar a lógica)
-            if player.deck.commander_card:
-                self.sincronizar_zona_visual(zonas["COMANDANTE"], [player.deck.commander_card])
+            for nome_zona, atributos in self.MAPA_ZONAS.items():
+                mudou |= self.sincronizar_zona_visual(zonas[nome_zona], *(getattr(player, a) for a in atributos))
+
+        revisao_maos = tuple((id(p.hand), getattr(p.hand, 'revisao', None)) for p in match_model.players.values())
+        if mudou or revisao_maos != self._revisao_fixados:
+            self._revisao_fixados = revisao_maos
+            self._fixar_imagens_visiveis(match_model, zonas_por_jogador)
+
+    def _fixar_imagens_visiveis(self, match_model, zonas_por_jogador):
+        """Protege do LRU do AssetManager as imagens das cartas que estão na tela."""
+        caminhos = set()
+        for zonas in zonas_por_jogador.values():
+            for zona_ui in zonas.values():
+                caminhos.update(cui.card.local_image_path for cui in zona_ui.cards_ui)
+        for player in match_model.players.values():
+            caminhos.update(card.local_image_path for card in player.hand)
+        self.asset_manager.definir_fixados(caminhos)
+
+    def preparar_mesa_inicial(self, match_model, zonas_por_jogador):
+        """
+        Faz a primeira sincronização de todas as zonas da mesa.
+        :param zonas_por_jogador: O dicionário de zonas que criamos na MatchView
+        """
+        for zonas in zonas_por_jogador.values():
+            for zona_ui in zonas.values():
+                zona_ui.revisao_modelo = None
+        self._revisao_fixados = None
+        self.sincronizar_mesa(match_model, zonas_por_jogador)
 
     def limpar_cache_obsoleto(self, match_model):
         """
@@ -58,4 +96,4 @@ class GameUIManager:
         para liberar memória em partidas muito longas.
         """
         # Futura implementação de limpeza de RAM
-        pass
\ No newline at end of file
+        pass
@@ -3,6 +3,9 @@ from APP.domain.models.player_model import PlayerModel
 from APP.domain.services.deck_builder import DeckBuilderService
 from APP.domain.services.rule_engine import RuleEngine
 from APP.domain.services.mana_manager import ManaManager 
+from APP.domain.services.headless_match import HeadlessMatch
+from APP.domain.services.bot_ai_service import BotAIService
+from APP.core.settings import BOT_TEMPO_POR_DECISAO, BOT_WORKERS
 
 class MatchController:
     def __init__(self, ui_manager):
@@ -10,6 +13,15 @@ class MatchController:
         self.ui_manager = ui_manager 
         self.total_players = 2
 
+        # Última assinatura de regras vista por jogador: {player_id: tupla}
+        # Se nada mudou desde a última validação, a mão não é revalidada.
+        self._assinaturas_playables = {}
+
+        # Oponente da máquina: decide as fases principais por MCTS com tempo fixo por jogada.
+        # Com BOT_WORKERS > 1 o pool sobe na primeira jogada do bot e vive até encerrar()
+        self.bot_id = "P2"
+        self.bot = BotAIService(tempo_por_decisao=BOT_TEMPO_POR_DECISAO, workers=BOT_WORKERS)
+
     # =========================================================
     # CONFIGURAÇÃO E INÍCIO
     # =========================================================
@@ -23,6 +35,7 @@ class MatchController:
         player_2 = PlayerModel(player_id="P2", name="Oponente 1", deck=deck_p2)
         
         self.match_model = MatchModel(player1=player_1, player2=player_2)
+        self.invalidar_playables()
         print(f"[OK] Mesa montada. Aguardando rolagem de iniciativa.")
 
     def iniciar_partida(self, primeiro_jogador_id: str):
@@ -33,32 +46,58 @@ class MatchController:
         p1.draw_cards(7)
         p2.draw_cards(7)
         
-        self._simular_mesa_bot(p2)
-        
         self.match_model.state.iniciar_jogo(primeiro_jogador_id)
         self.match_model.starting_player_id = primeiro_jogador_id
         
         primeiro_nome = self.match_model.players[primeiro_jogador_id].name
         print(f"\n[TURNO 1] {primeiro_nome} começa na fase {self.match_model.phase}!")
+        self._jogar_vez_do_bot()
         self.atualizar_playables()
 
     # =========================================================
     # LÓGICA DE REGRAS E GESTÃO DE MANA
     # =========================================================
 
-    def atualizar_playables(self):
+    def atualizar_playables(self, forcar: bool = False):
+        """
+        Revalida a jogabilidade das cartas na mão, mas só dos jogadores cujo
+        estado relevante (fase, jogador ativo, pool, terrenos desvirados, mão) mudou.
+        Chamado a cada frame pela view: sem mudanças, custa uma tupla por jogador.
+        """
         if not self.match_model: return
         for p_id, player in self.match_model.players.items():
+            assinatura = self._assinatura_playables(player)
+            if not forcar and self._assinaturas_playables.get(p_id) == assinatura:
+                continue
+            self._assinaturas_playables[p_id] = assinatura
+
             for card in player.hand:
-                tipo = getattr(card, 'type_line', "").lower()
-                is_land = "land" in tipo or getattr(card, 'is_land', False)
-                
-                if is_land:
+                if card.is_land:
                     pode, _ = RuleEngine.validar_descida_terreno(self.match_model, p_id, card)
                 else:
-                    pode, _ = RuleEngine.validar_conjuracao(self.match_model, p_id, card)
+                    # Mana em potencial: destaca o que os terrenos desvirados pagam
+                    pode, _ = RuleEngine.validar_conjuracao(self.match_model, p_id, card, com_terrenos=True)
                 card.playable = pode
 
+    def invalidar_playables(self, player_id: str = None):
+        """Força a revalidação na próxima atualização (ex: regra externa alterou uma carta)."""
+        if player_id is None:
+            self._assinaturas_playables.clear()
+        else:
+            self._assinaturas_playables.pop(player_id, None)
+
+    def _assinatura_playables(self, player: PlayerModel) -> tuple:
+        """Tudo o que o RuleEngine consulta para decidir se uma carta da mão é jogável."""
+        return (
+            self.match_model.phase,
+            self.match_model.active_player_id,
+            tuple(player.mana_pool.values()),
+            player.lands_played_this_turn,
+            player.hand.revisao,
+            ManaManager.assinatura_terrenos(player.battlefield_lands),
+            player.life,  # Phyrexianos podem ser pagos com vida
+        )
+
     def virar_terreno_para_mana(self, player_id: str, card):
         player = self.match_model.players.get(player_id)
         if not player or not card.is_land or card.is_tapped:
@@ -69,6 +108,28 @@ class MatchController:
             print(f"[MANA] {player.name} virou {card.name} (+1 {cor_gerada})")
             self.atualizar_playables()
 
+    def auto_pagar(self, player_id: str, card, atualizar: bool = True) -> bool:
+        """
+        Vira de uma vez só os terrenos escolhidos pelo solucionador de pagamento
+        (na cor que a carta pede) e deixa a mana na reserva para o custo.
+        :param atualizar: False quando quem chama já vai revalidar a mão depois.
+        """
+        player = self.match_model.players.get(player_id)
+        if not player:
+            return False
+
+        plano = ManaManager.planejar_pagamento(player, card)
+        if not plano.viavel:
+            return False
+
+        ManaManager.virar_terrenos(player, plano)
+        if plano.terrenos:
+            nomes = ", ".join(f"{t.name} ({cor})" for t, cor in plano.terrenos)
+            print(f"[MANA] {player.name} virou para {card.name}: {nomes}")
+        if atualizar:
+            self.atualizar_playables()
+        return True
+
     # =========================================================
     # AÇÕES DE JOGO E MUDANÇA DE FASE
     # =========================================================
@@ -91,6 +152,10 @@ class MatchController:
                 print(f"[BLOQUEADO] {card.name}: {motivo}")
         else:
             pode, motivo = RuleEngine.validar_conjuracao(self.match_model, player_id, card)
+            if not pode and RuleEngine.validar_conjuracao(self.match_model, player_id, card, com_terrenos=True)[0]:
+                # Um clique só: vira os terrenos do plano e paga (uma revalidação no fim)
+                self.auto_pagar(player_id, card, atualizar=False)
+                pode, motivo = RuleEngine.validar_conjuracao(self.match_model, player_id, card)
             if pode:
                 ManaManager.descontar_custo(player, card)
                 if is_creature:
@@ -121,6 +186,7 @@ class MatchController:
             todas_cartas = player.battlefield_lands + player.battlefield_creatures + player.battlefield_other
             for c in todas_cartas:
                 c.untap()
+                c.summoning_sickness = False
             
             player.lands_played_this_turn = 0
             player.mana_pool = {k: 0 for k in player.mana_pool}
@@ -138,6 +204,9 @@ class MatchController:
 
         # 4. LIMPEZA DE MANA (Sempre ocorre ao mudar de qualquer fase)
         player.mana_pool = {k: 0 for k in player.mana_pool}
+
+        # 5. Se a fase é do bot, ele joga agora (terreno/mágicas ou ataque)
+        self._jogar_vez_do_bot()
         
         self.atualizar_playables()
         print(f"[TURNO] Fase atual: {fase_atual}")
@@ -149,15 +218,8 @@ class MatchController:
     def sincronizar_view(self, zones_view):
         if not self.match_model or not self.ui_manager: return
         self.atualizar_playables()
-        for p_id, player in self.match_model.players.items():
-            for zona in zones_view[p_id].values():
-                zona.clear_cards() 
-            self.ui_manager.sincronizar_zona_visual(zones_view[p_id]["MANA"], player.battlefield_lands)
-            campo_total = player.battlefield_creatures + player.battlefield_other
-            self.ui_manager.sincronizar_zona_visual(zones_view[p_id]["CAMPO"], campo_total)
-            self.ui_manager.sincronizar_zona_visual(zones_view[p_id]["CEMITERIO"], player.graveyard)
-            self.ui_manager.sincronizar_zona_visual(zones_view[p_id]["EXILIO"], player.exile)
-            self.ui_manager.sincronizar_zona_visual(zones_view[p_id]["COMANDANTE"], player.commander_zone)
+        # Retained mode: as zonas guardam seus CardUI e só recebem o que mudou
+        self.ui_manager.sincronizar_mesa(self.match_model, zones_view)
 
     def executar_mulligan(self, player_id: str):
         player = self.match_model.players.get(player_id)
@@ -173,7 +235,13 @@ class MatchController:
             if quantidade > 0: player.life += quantidade
             else: player.take_damage(abs(quantidade))
 
-    def _simular_mesa_bot(self, bot: PlayerModel):
-        if len(bot.hand) >= 3:
-            bot.battlefield_lands.append(bot.hand.pop())
-            bot.battlefield_creatures.append(bot.hand.pop())
+    def encerrar(self):
+        """Chamado quando a partida sai da tela: derruba os processos do bot, se houver."""
+        self.bot.encerrar()
+
+    def _jogar_vez_do_bot(self):
+        """Joga a fase atual pelo bot quando ele é o jogador ativo, direto no MatchModel da mesa."""
+        if not self.match_model or self.match_model.active_player_id != self.bot_id:
+            return
+        partida = HeadlessMatch.de_partida(self.match_model, politicas={self.bot_id: self.bot})
+        partida.jogar_fase_atual()
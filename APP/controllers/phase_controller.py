@@ -67,8 +67,8 @@ class PhaseController:
         
         for zona in zonas_de_campo:
             for card in zona:
-                # CardModel usa o atributo 'tapped' (booleano)
-                card.tapped = False
+                # CardModel usa __slots__: o estado é 'is_tapped', alterado via untap()
+                card.untap()
 
     def _pass_turn(self):
         """Alterna o ID do jogador ativo no modelo e incrementa o turno global."""
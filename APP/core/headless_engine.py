@@ -0,0 +1,55 @@
+# APP/core/headless_engine.py
+import contextlib
+import random
+from APP.infrastructure.storage.deck_repository import DeckRepository
+from APP.domain.services.headless_match import HeadlessMatch, ResultadoPartida
+
+
+class HeadlessEngine:
+    def __init__(self, deck_repo: DeckRepository = None, max_turnos: int = 40, silencioso: bool = True):
+        """
+        Motor sem janela: roda partidas completas para simulação em servidor.
+        Não importa pygame, então um worker sobe em milissegundos.
+        :param silencioso: Desliga os prints de depuração dos Models durante a partida.
+        """
+        self.deck_repo = deck_repo or DeckRepository()
+        self.max_turnos = max_turnos
+        self.silencioso = silencioso
+
+    def carregar_deck(self, nome_deck: str) -> dict:
+        """
+        Lê o deck do disco e completa cada carta com os dados do acervo local,
+        que guarda os campos que o arquivo do deck não repete (oracle, power...).
+        """
+        dados_deck = self.deck_repo.carregar_deck_completo(nome_deck)
+        if not dados_deck:
+            return None
+
+        refs = dados_deck.get("cards", [])
+        cartas_completas = []
+        for ref, dados_carta in zip(refs, self.deck_repo.obter_dados_cartas(refs)):
+            # Os campos do deck (quantidade, produced_mana, cmc) têm prioridade
+            cartas_completas.append({**dados_carta, **ref})
+
+        return {**dados_deck, "cards": cartas_completas}
+
+    def jogar_partida(self, deck_p1: dict, deck_p2: dict = None, seed: int = None, bots: dict = None) -> ResultadoPartida:
+        """
+        Monta e joga uma partida inteira, devolvendo apenas o resultado compacto.
+        :param bots: {player_id: BotAIService} para os lados que decidem por busca
+                     (os dois, para bot contra bot). Os demais usam a política gulosa.
+        """
+        if seed is not None:
+            # DeckModel.embaralhar usa o random global; semear aqui torna a partida reproduzível
+            random.seed(seed)
+
+        with self._saida():
+            partida = HeadlessMatch(deck_p1, deck_p2, max_turnos=self.max_turnos, politicas=bots)
+            partida.iniciar()
+            return partida.jogar_ate_o_fim()
+
+    def _saida(self):
+        # Com sys.stdout = None o print() retorna sem escrever nada (custo quase zero)
+        if self.silencioso:
+            return contextlib.redirect_stdout(None)
+        return contextlib.nullcontext()
@@ -0,0 +1,92 @@
+# APP/core/monte_carlo.py
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+from APP.core.headless_engine import HeadlessEngine
+from APP.domain.services.headless_match import ResultadoPartida
+
+# Estado de cada processo worker (montado uma única vez pelo initializer)
+_engine_worker = None
+_decks_worker = None
+
+
+def _inicializar_worker(deck_p1: dict, deck_p2: dict, max_turnos: int):
+    """Roda uma vez por processo: os decks viajam pelo pipe só aqui, não a cada partida."""
+    global _engine_worker, _decks_worker
+    _engine_worker = HeadlessEngine(max_turnos=max_turnos)
+    _decks_worker = (deck_p1, deck_p2)
+
+
+def _jogar_lote(seed_inicial: int, quantidade: int) -> List[ResultadoPartida]:
+    """Joga 'quantidade' partidas seguidas, cada uma com a sua própria seed."""
+    deck_p1, deck_p2 = _decks_worker
+    return [
+        _engine_worker.jogar_partida(deck_p1, deck_p2, seed=seed_inicial + i)
+        for i in range(quantidade)
+    ]
+
+
+class MonteCarloRunner:
+    def __init__(self, workers: int = None, max_turnos: int = 40, tamanho_lote: int = 200):
+        """
+        Executa N partidas headless espalhadas por todos os núcleos da CPU.
+        :param workers: Número de processos (padrão: todos os núcleos).
+        :param tamanho_lote: Máximo de partidas por tarefa enviada a um worker.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_turnos = max_turnos
+        self.tamanho_lote = tamanho_lote
+
+    def executar(self, deck_p1: dict, deck_p2: dict, total_partidas: int, seed: int = 0) -> List[ResultadoPartida]:
+        """
+        Joga 'total_partidas' e devolve os resultados na ordem das seeds.
+        A partida i usa a seed (seed + i), então o resultado não depende do número de workers.
+        """
+        if total_partidas <= 0:
+            return []
+
+        lotes = self._dividir_lotes(total_partidas, seed)
+
+        # Um único worker não compensa o custo de subir processos
+        if self.workers == 1:
+            _inicializar_worker(deck_p1, deck_p2, self.max_turnos)
+            return [r for inicio, qtd in lotes for r in _jogar_lote(inicio, qtd)]
+
+        resultados = []
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_inicializar_worker,
+            initargs=(deck_p1, deck_p2, self.max_turnos)
+        ) as pool:
+            inicios, quantidades = zip(*lotes)
+            for lote in pool.map(_jogar_lote, inicios, quantidades):
+                resultados.extend(lote)
+        return resultados
+
+    def _dividir_lotes(self, total_partidas: int, seed: int):
+        # Lotes pequenos o bastante para balancear a carga, grandes o bastante para diluir o IPC
+        tamanho = max(1, min(self.tamanho_lote, total_partidas // (self.workers * 4) or 1))
+        return [
+            (seed + inicio, min(tamanho, total_partidas - inicio))
+            for inicio in range(0, total_partidas, tamanho)
+        ]
+
+    @staticmethod
+    def resumir(resultados: List[ResultadoPartida]) -> dict:
+        """Agrega os registros em taxas de vitória e duração média (sempre com todas as chaves)."""
+        total = len(resultados)
+        vitorias_p1 = sum(1 for r in resultados if r.vencedor == "P1")
+        vitorias_p2 = sum(1 for r in resultados if r.vencedor == "P2")
+        empates = total - vitorias_p1 - vitorias_p2
+
+        # Sem partidas, as taxas e a média ficam em zero em vez de dividir por zero
+        divisor = total or 1
+        return {
+            "partidas": total,
+            "vitorias_p1": vitorias_p1,
+            "vitorias_p2": vitorias_p2,
+            "empates": empates,
+            "taxa_vitoria_p1": vitorias_p1 / divisor,
+            "taxa_vitoria_p2": vitorias_p2 / divisor,
+            "turnos_medios": sum(r.turnos for r in resultados) / divisor
+        }
@@ -3,4 +3,16 @@
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 FPS = 60
-GAME_TITLE = "Machete MTG Simulator"
\ No newline at end of file
+GAME_TITLE = "Machete MTG Simulator"
+
+# Teto de RAM para as imagens de cartas decodificadas (AssetManager)
+IMAGE_CACHE_MB = 256
+
+# Teto de RAM para as variantes prontas (escaladas, viradas, escurecidas)
+IMAGE_VARIANT_CACHE_MB = 64
+
+# Bot da partida: segundos de busca por jogada e processos da busca paralela.
+# Cada worker é um processo novo que importa o app (e o pygame) de novo,
+# então o padrão é buscar no próprio processo.
+BOT_TEMPO_POR_DECISAO = 0.2
+BOT_WORKERS = 1
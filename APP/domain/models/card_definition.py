@@ -0,0 +1,258 @@
+from pydantic import BaseModel, ConfigDict
+from functools import cached_property
+from types import MappingProxyType
+from typing import ClassVar, Dict, Mapping, NamedTuple, Optional, Tuple
+import os
+import re
+
+# =========================================================
+# MÁSCARA DE TIPOS (Um bit por tipo; uma carta pode ter vários)
+# =========================================================
+TIPO_TERRENO = 1 << 0
+TIPO_CRIATURA = 1 << 1
+TIPO_INSTANTANEA = 1 << 2
+TIPO_FEITICO = 1 << 3
+TIPO_ARTEFATO = 1 << 4
+TIPO_ENCANTAMENTO = 1 << 5
+TIPO_PLANESWALKER = 1 << 6
+
+# (bit, termos procurados no type_line, termos procurados na categoria)
+_REGRAS_DE_TIPO = (
+    (TIPO_TERRENO, ("land", "terreno"), ("terreno",)),
+    (TIPO_CRIATURA, ("creature", "criatura"), ("criatura",)),
+    (TIPO_INSTANTANEA, ("instant",), ("mágica instantânea", "instantanea")),
+    (TIPO_FEITICO, ("sorcery",), ("feitiço", "feitico")),
+    (TIPO_ARTEFATO, ("artifact",), ("artefato",)),
+    (TIPO_ENCANTAMENTO, ("enchantment",), ("encantamento",)),
+    (TIPO_PLANESWALKER, ("planeswalker",), ("planeswalker",)),
+)
+
+def calcular_tipos(type_line: str, categoria: str = "") -> int:
+    """Máscara de tipos a partir do type_line (inglês) e da categoria (português)."""
+    tl = (type_line or "").lower()
+    cat = (categoria or "").lower()
+
+    mascara = 0
+    for bit, termos_tl, termos_cat in _REGRAS_DE_TIPO:
+        if any(t in tl for t in termos_tl) or any(t in cat for t in termos_cat):
+            mascara |= bit
+    return mascara
+
+# =========================================================
+# CUSTO DE MANA (Parse único, usado pelo ManaManager e pelos bots)
+# =========================================================
+# Cores que existem na mana_pool do jogador
+CORES_MANA = ("W", "U", "B", "R", "G", "C")
+
+
+class CustoAnalisado(NamedTuple):
+    """Custo de mana quebrado em símbolos que o solucionador entende."""
+    simbolos: Tuple[frozenset, ...]     # Coloridos e híbridos: cores aceitas por símbolo
+    phyrexian: Tuple[frozenset, ...]    # {G/P}: a cor ou 2 de vida
+    bifurcados: Tuple[Tuple[frozenset, int], ...]  # {2/W}: a cor ou N genéricos
+    generico: int
+
+
+def analisar_custo(mana_cost: str) -> CustoAnalisado:
+    """
+    '{2}{W/U}{G/P}{R}' -> símbolos [{W,U}, {R}], phyrexian [{G}], genérico 2.
+    X/Y/Z contam como zero; neve ({S}) conta como genérico.
+    """
+    simbolos, phyrexian, bifurcados, generico = [], [], [], 0
+
+    for s in re.findall(r'\{(.*?)\}', mana_cost or ""):
+        s = s.upper()
+        if s.isdigit():
+            generico += int(s)
+        elif s in ("X", "Y", "Z"):
+            continue
+        elif s == "S":
+            generico += 1
+        elif s in CORES_MANA:
+            simbolos.append(frozenset((s,)))
+        elif "/" in s:
+            partes = s.split("/")
+            cores = frozenset(p for p in partes if p in CORES_MANA)
+            if "P" in partes:
+                phyrexian.append(cores)
+            elif partes[0].isdigit():
+                bifurcados.append((cores, int(partes[0])))
+            elif cores:
+                simbolos.append(cores)
+
+    return CustoAnalisado(tuple(simbolos), tuple(phyrexian), tuple(bifurcados), generico)
+
+
+class CardDefinition(BaseModel):
+    """
+    Dados ESTÁTICOS de uma carta (o "Oracle"): iguais para todas as cópias.
+    Imutável e internada por nome: 30 Montanhas no grimório apontam para a
+    MESMA definição, validada pelo Pydantic uma única vez por processo.
+    """
+
+    model_config = ConfigDict(extra='ignore', populate_by_name=True, frozen=True)
+
+    name: str
+    printed_name: Optional[str] = ""
+    type_line: Optional[str] = ""
+    categoria: Optional[str] = ""  # Captura a categoria em português do seu JSON
+    mana_cost: Optional[str] = ""
+    cmc: float = 0.0
+    oracle_text: Optional[str] = ""
+
+    # Tuplas em vez de listas: a definição é compartilhada e não pode ser alterada
+    colors: Tuple[str, ...] = ()
+    color_identity: Tuple[str, ...] = ()
+    produced_mana: Tuple[str, ...] = ()
+
+    power: Optional[str] = None
+    toughness: Optional[str] = None
+    loyalty: Optional[str] = None
+
+    # Imagens e Raridade
+    image_url: Optional[str] = ""
+    rarity: Optional[str] = ""
+    local_image_path: Optional[str] = None
+
+    # Registro global de definições já validadas: {nome: CardDefinition}
+    _registro: ClassVar[Dict[str, "CardDefinition"]] = {}
+
+    # =========================================================
+    # 1. INTERNAMENTO (Flyweight)
+    # =========================================================
+    @classmethod
+    def buscar(cls, nome: str) -> Optional["CardDefinition"]:
+        """Consulta barata no registro, sem validar nada."""
+        return cls._registro.get(nome)
+
+    @classmethod
+    def obter(cls, dados: dict) -> "CardDefinition":
+        """Devolve a definição já registrada para o nome, ou valida e registra uma nova."""
+        definicao = cls._registro.get(dados.get("name"))
+        if definicao is None:
+            definicao = cls(**dados)
+            cls._registro[definicao.name] = definicao
+        return definicao
+
+    @classmethod
+    def limpar_registro(cls):
+        """Esquece todas as definições (usado ao reimportar dados das cartas)."""
+        cls._registro.clear()
+
+    def __reduce__(self):
+        # O pickle volta pelo registro: no outro processo a definição é internada de novo
+        return (CardDefinition.obter, (self.model_dump(),))
+
+    def __copy__(self):
+        # Imutável e compartilhada: copiar uma partida nunca duplica a definição
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    # =========================================================
+    # 2. PRÉ-CÁLCULO (Feito uma única vez, na validação)
+    # =========================================================
+    def model_post_init(self, __context):
+        """
+        Calcula a máscara de tipos e o custo de mana assim que a definição nasce.
+        Os cached_property gravam o valor no __dict__, então as leituras seguintes
+        (RuleEngine, atualizar_playables a cada frame) são uma consulta simples.
+        """
+        self.tipos
+        self.custo
+        self.mana_cost_map
+
+    @cached_property
+    def tipos(self) -> int:
+        """Máscara de bits com os tipos da carta (TIPO_TERRENO | TIPO_CRIATURA...)."""
+        return calcular_tipos(self.type_line, self.categoria)
+
+    # =========================================================
+    # 3. HELPERS DE MANA
+    # =========================================================
+    @cached_property
+    def custo(self) -> CustoAnalisado:
+        """
+        O custo de mana já quebrado em símbolos (coloridos, híbridos, phyrexianos,
+        genéricos). É o único parse do custo: o ManaManager paga a partir dele.
+        """
+        return analisar_custo(self.mana_cost)
+
+    @cached_property
+    def mana_cost_map(self) -> Mapping[str, int]:
+        """
+        Transforma '{1}{W}{B}' em {'Generic': 1, 'W': 1, 'B': 1}.
+        Derivado do custo analisado (os híbridos viram 'W/U', '2/W', 'G/P').
+        Somente leitura: o mesmo mapa é compartilhado por todas as cópias.
+        """
+        cost_dict = {}
+        if self.custo.generico:
+            cost_dict["Generic"] = self.custo.generico
+
+        def chave(cores):
+            return "/".join(c for c in CORES_MANA if c in cores)
+
+        for cores in self.custo.simbolos:
+            cost_dict[chave(cores)] = cost_dict.get(chave(cores), 0) + 1
+        for cores, n in self.custo.bifurcados:
+            simbolo = f"{n}/{chave(cores)}"
+            cost_dict[simbolo] = cost_dict.get(simbolo, 0) + 1
+        for cores in self.custo.phyrexian:
+            simbolo = f"{chave(cores)}/P"
+            cost_dict[simbolo] = cost_dict.get(simbolo, 0) + 1
+
+        return MappingProxyType(cost_dict)
+
+    # =========================================================
+    # 4. HELPERS DE TIPO (Blindados: Inglês e Português)
+    # =========================================================
+    @cached_property
+    def is_land(self) -> bool:
+        return bool(self.tipos & TIPO_TERRENO)
+
+    @cached_property
+    def is_creature(self) -> bool:
+        return bool(self.tipos & TIPO_CRIATURA)
+
+    @cached_property
+    def is_instant(self) -> bool:
+        return bool(self.tipos & TIPO_INSTANTANEA)
+
+    @cached_property
+    def is_sorcery(self) -> bool:
+        return bool(self.tipos & TIPO_FEITICO)
+
+    @cached_property
+    def is_artifact(self) -> bool:
+        return bool(self.tipos & TIPO_ARTEFATO)
+
+    @cached_property
+    def is_enchantment(self) -> bool:
+        return bool(self.tipos & TIPO_ENCANTAMENTO)
+
+    @cached_property
+    def is_planeswalker(self) -> bool:
+        return bool(self.tipos & TIPO_PLANESWALKER)
+
+    # =========================================================
+    # 5. ASSET HELPERS
+    # =========================================================
+    def get_image_filename(self) -> str:
+        """Extrai o nome do arquivo sem extensão."""
+        if self.local_image_path:
+            base = os.path.basename(self.local_image_path)
+            return os.path.splitext(base)[0]
+        return self.name.lower().replace(" ", "_")
+
+    def get_category(self) -> str:
+        """Retorna a categoria limpa para uso do AssetManager."""
+        if self.categoria:
+            return self.categoria
+        if self.is_land: return "Terrenos"
+        if self.is_creature: return "Criaturas"
+        if self.is_artifact: return "Artefatos"
+        if self.is_enchantment: return "Encantamentos"
+        if self.is_instant: return "Instantaneas"
+        if self.is_sorcery: return "Feiticos"
+        return "Outros"
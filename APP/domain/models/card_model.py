@@ -1,170 +1,122 @@
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict
-import os
-import re
+from typing import Dict
+from APP.domain.models.card_definition import CardDefinition, CustoAnalisado
 
-class CardModel(BaseModel):
+class CardModel:
     """
     Representa uma única carta física na mesa de jogo.
-    Molde feito sob medida para o JSON do MTG Simulator.
+    Guarda apenas o ESTADO DA PARTIDA desta cópia; os dados estáticos
+    (nome, custo, tipo, imagem...) vivem na CardDefinition compartilhada.
     """
-    
-    # Ignora campos extras do JSON para evitar quebras
-    model_config = ConfigDict(extra='ignore', populate_by_name=True)
 
-    # =========================================================
-    # 1. DADOS ESTÁTICOS (Exatamente como no seu JSON)
-    # =========================================================
-    name: str
-    printed_name: Optional[str] = ""
-    type_line: Optional[str] = "" 
-    categoria: Optional[str] = ""  # Captura a categoria em português do seu JSON
-    mana_cost: Optional[str] = ""
-    cmc: float = 0.0  
-    oracle_text: Optional[str] = ""
-    
-    colors: List[str] = Field(default_factory=list)
-    color_identity: List[str] = Field(default_factory=list)
-    produced_mana: List[str] = Field(default_factory=list)
-    
-    power: Optional[str] = None
-    toughness: Optional[str] = None
-    loyalty: Optional[str] = None
-    
-    # Imagens e Raridade
-    image_url: Optional[str] = ""
-    rarity: Optional[str] = ""
-    local_image_path: Optional[str] = None
-    
-    is_commander: bool = False
+    # __slots__: sem __dict__ por cópia, cada carta ocupa poucos bytes na RAM
+    __slots__ = (
+        "definicao",
+        "is_commander",
+        "is_tapped",
+        "is_face_down",
+        "counters",
+        "summoning_sickness",
+        "playable",
+    )
+
+    def __init__(self, definicao: CardDefinition, is_commander: bool = False):
+        self.definicao = definicao
+        self.is_commander = is_commander
+
+        # =========================================================
+        # 1. ESTADO DA PARTIDA (Mutável durante o jogo)
+        # =========================================================
+        self.is_tapped: bool = False
+        self.is_face_down: bool = False
+        self.counters: Dict[str, int] = {}
+        # Garante que criaturas entrem com enjoo de invocação
+        self.summoning_sickness: bool = definicao.is_creature
+
+        # PULO DO GATO: A flag que conecta a Regra com o Visual sem misturar código!
+        self.playable: bool = False
+
+    def __getattr__(self, nome):
+        """Qualquer dado estático (oracle_text, rarity, colors...) é lido da definição."""
+        # Nomes especiais e a própria 'definicao' nunca são delegados (evita recursão no pickle/copy)
+        if nome.startswith("__") or nome == "definicao":
+            raise AttributeError(nome)
+        return getattr(self.definicao, nome)
+
+    def __repr__(self):
+        return f"CardModel({self.definicao.name!r}, tapped={self.is_tapped})"
+
+    def __deepcopy__(self, memo):
+        # Clones da partida (bots): copia só o estado, a definição segue compartilhada.
+        # Bem mais rápido que o deepcopy genérico dos __slots__ (centenas de cartas por clone)
+        clone = CardModel.__new__(CardModel)
+        clone.definicao = self.definicao
+        clone.is_commander = self.is_commander
+        clone.is_tapped = self.is_tapped
+        clone.is_face_down = self.is_face_down
+        clone.counters = dict(self.counters)
+        clone.summoning_sickness = self.summoning_sickness
+        clone.playable = self.playable
+        memo[id(self)] = clone
+        return clone
 
     # =========================================================
-    # 2. ESTADO DA PARTIDA (Mutável durante o jogo)
-    # =========================================================
-    is_tapped: bool = False
-    is_face_down: bool = False
-    counters: Dict[str, int] = Field(default_factory=dict) 
-    summoning_sickness: bool = False
-    
-    # PULO DO GATO: A flag que conecta a Regra com o Visual sem misturar código!
-    playable: bool = False 
-
-    def model_post_init(self, __context):
-        """Garante que criaturas entrem com enjoo de invocação."""
-        if self.is_creature:
-            self.summoning_sickness = True
-
+    # 2. ATALHOS QUENTES (Lidos pelo RuleEngine e pela UI a cada frame)
     # =========================================================
-    # 3. MÉTODOS DE AÇÃO
-    # =========================================================
-    def tap(self):
-        if not self.is_tapped:
-            self.is_tapped = True
-            return True
-        return False
-
-    def untap(self):
-        if self.is_tapped:
-            self.is_tapped = False
-            return True
-        return False
-
-    def add_counter(self, counter_type: str, amount: int = 1):
-        self.counters[counter_type] = self.counters.get(counter_type, 0) + amount
-        if self.counters[counter_type] <= 0:
-            del self.counters[counter_type]
-
-    def remove_all_counters(self):
-        self.counters.clear()
+    @property
+    def name(self) -> str:
+        return self.definicao.name
 
-    # =========================================================
-    # 4. HELPERS DE MANA (NOVIDADE VERSÃO A4)
-    # =========================================================
     @property
-    def mana_cost_map(self) -> Dict[str, int]:
-        """
-        Transforma '{1}{W}{B}' em {'Generic': 1, 'W': 1, 'B': 1}.
-        Essencial para a validação de custos da Versão A4.
-        """
-        cost_dict = {}
-        if not self.mana_cost:
-            return cost_dict
-
-        # Encontra tudo que está entre chaves { }
-        symbols = re.findall(r'\{(.*?)\}', self.mana_cost)
-        
-        for s in symbols:
-            if s.isdigit():
-                cost_dict["Generic"] = cost_dict.get("Generic", 0) + int(s)
-            else:
-                # Trata símbolos como W, U, B, R, G, C
-                cost_dict[s] = cost_dict.get(s, 0) + 1
-        
-        return cost_dict
+    def custo(self) -> CustoAnalisado:
+        return self.definicao.custo
 
-    # =========================================================
-    # 5. HELPERS DE TIPO (Blindados: Inglês e Português)
-    # =========================================================
     @property
     def is_land(self) -> bool:
-        tl = (self.type_line or "").lower()
-        cat = (self.categoria or "").lower()
-        return "land" in tl or "terreno" in cat or "terreno" in tl
+        return self.definicao.is_land
 
     @property
     def is_creature(self) -> bool:
-        tl = (self.type_line or "").lower()
-        cat = (self.categoria or "").lower()
-        return "creature" in tl or "criatura" in cat or "criatura" in tl
+        return self.definicao.is_creature
 
     @property
     def is_instant(self) -> bool:
-        tl = (self.type_line or "").lower()
-        cat = (self.categoria or "").lower()
-        return "instant" in tl or "mágica instantânea" in cat or "instantanea" in cat
+        return self.definicao.is_instant
 
     @property
     def is_sorcery(self) -> bool:
-        tl = (self.type_line or "").lower()
-        cat = (self.categoria or "").lower()
-        return "sorcery" in tl or "feitiço" in cat or "feitico" in cat
+        return self.definicao.is_sorcery
 
     @property
     def is_artifact(self) -> bool:
-        tl = (self.type_line or "").lower()
-        cat = (self.categoria or "").lower()
-        return "artifact" in tl or "artefato" in cat
+        return self.definicao.is_artifact
 
     @property
     def is_enchantment(self) -> bool:
-        tl = (self.type_line or "").lower()
-        cat = (self.categoria or "").lower()
-        return "enchantment" in tl or "encantamento" in cat
+        return self.definicao.is_enchantment
 
     @property
     def is_planeswalker(self) -> bool:
-        tl = (self.type_line or "").lower()
-        cat = (self.categoria or "").lower()
-        return "planeswalker" in tl or "planeswalker" in cat
+        return self.definicao.is_planeswalker
 
     # =========================================================
-    # 6. ASSET HELPERS
+    # 3. MÉTODOS DE AÇÃO
     # =========================================================
-    def get_image_filename(self) -> str:
-        """Extrai o nome do arquivo sem extensão."""
-        if self.local_image_path:
-            base = os.path.basename(self.local_image_path)
-            return os.path.splitext(base)[0]
-        return self.name.lower().replace(" ", "_")
-
-    def get_category(self) -> str:
-        """Retorna a categoria limpa para uso do AssetManager."""
-        if self.categoria:
-            return self.categoria
-        if self.is_land: return "Terrenos"
-        if self.is_creature: return "Criaturas"
-        if self.is_artifact: return "Artefatos"
-        if self.is_enchantment: return "Encantamentos"
-        if self.is_instant: return "Instantaneas"
-        if self.is_sorcery: return "Feiticos"
-        return "Outros"
+    def tap(self):
+        if not self.is_tapped:
+            self.is_tapped = True
+            return True
+        return False
+
+    def untap(self):
+        if self.is_tapped:
+            self.is_tapped = False
+            return True
+        return False
+
+    def add_counter(self, counter_type: str, amount: int = 1):
+        self.counters[counter_type] = self.counters.get(counter_type, 0) + amount
+        if self.counters[counter_type] <= 0:
+            del self.counters[counter_type]
+
+    def remove_all_counters(self):
+        self.counters.clear()
@@ -1,6 +1,7 @@
 from typing import List, Dict, Optional
 from APP.domain.models.deck_model import DeckModel
 from APP.domain.models.card_model import CardModel
+from APP.domain.models.zone_model import ZoneModel
 
 class PlayerModel:
     def __init__(self, player_id: str, name: str, deck: DeckModel, starting_life: int = 40):
@@ -33,16 +34,17 @@ class PlayerModel:
         self.lands_played_this_turn: int = 0
 
         # ZONAS DE JOGO (Sincronizadas com o MatchController e ZoneUI)
-        self.hand: List[CardModel] = []
-        self.battlefield_creatures: List[CardModel] = []
-        self.battlefield_lands: List[CardModel] = []
-        self.battlefield_other: List[CardModel] = [] # Artefatos/Encantamentos
+        # ZoneModel conta as mudanças: a UI só refaz a zona quando a revisão muda
+        self.hand: ZoneModel = ZoneModel()
+        self.battlefield_creatures: ZoneModel = ZoneModel()
+        self.battlefield_lands: ZoneModel = ZoneModel()
+        self.battlefield_other: ZoneModel = ZoneModel() # Artefatos/Encantamentos
         
-        self.graveyard: List[CardModel] = []
-        self.exile: List[CardModel] = []
+        self.graveyard: ZoneModel = ZoneModel()
+        self.exile: ZoneModel = ZoneModel()
         
         # O Comandante fica em uma lista para facilitar o render na zona de Comandante
-        self.commander_zone: List[CardModel] = []
+        self.commander_zone: ZoneModel = ZoneModel()
         if self.deck.commander_card:
             self.commander_zone.append(self.deck.commander_card)
 
@@ -104,6 +106,14 @@ class PlayerModel:
             return card
         return None
 
+    def resolve_spell(self, card_index: int):
+        """Mágicas instantâneas e feitiços resolvem e vão direto para o cemitério."""
+        if 0 <= card_index < len(self.hand):
+            card = self.hand.pop(card_index)
+            self.graveyard.append(card)
+            return card
+        return None
+
     # =========================================================
     # GESTÃO DE VIDA E MANA
     # =========================================================
@@ -0,0 +1,78 @@
+from copy import deepcopy
+
+class ZoneModel(list):
+    """
+    Uma zona de jogo (mão, campo, cemitério...) que se comporta como lista de CardModel,
+    mas avisa quando muda: toda entrada, saída ou troca de ordem incrementa
+    'revisao'. A interface compara só esse número para saber se precisa
+    refazer a zona, em vez de reconstruir tudo a cada frame.
+    """
+
+    __slots__ = ("revisao",)
+
+    def __init__(self, cartas=()):
+        super().__init__(cartas)
+        self.revisao: int = 0
+
+    def _mudou(self):
+        self.revisao += 1
+
+    def __reduce__(self):
+        # Pickle/deepcopy (clones da partida) recriam a zona já cheia, mantendo a revisão
+        return (self.__class__, (list(self),), (None, {"revisao": self.revisao}))
+
+    def __deepcopy__(self, memo):
+        # Atalho do deepcopy: evita o caminho genérico do __reduce__ carta a carta
+        clone = self.__class__([deepcopy(card, memo) for card in self])
+        clone.revisao = self.revisao
+        memo[id(self)] = clone
+        return clone
+
+    # =========================================================
+    # OPERAÇÕES QUE ALTERAM A ZONA (Todas emitem a mudança)
+    # =========================================================
+    def append(self, card):
+        super().append(card)
+        self._mudou()
+
+    def extend(self, cards):
+        super().extend(cards)
+        self._mudou()
+
+    def insert(self, index, card):
+        super().insert(index, card)
+        self._mudou()
+
+    def pop(self, index=-1):
+        card = super().pop(index)
+        self._mudou()
+        return card
+
+    def remove(self, card):
+        super().remove(card)
+        self._mudou()
+
+    def clear(self):
+        super().clear()
+        self._mudou()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._mudou()
+
+    def reverse(self):
+        super().reverse()
+        self._mudou()
+
+    def __setitem__(self, index, valor):
+        super().__setitem__(index, valor)
+        self._mudou()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._mudou()
+
+    def __iadd__(self, cards):
+        resultado = super().__iadd__(cards)
+        self._mudou()
+        return resultado
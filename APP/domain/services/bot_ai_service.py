@@ -0,0 +1,260 @@
+import contextlib
+import copy
+import math
+import multiprocessing
+import pickle
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from APP.domain.models.player_model import PlayerModel
+from APP.domain.services.headless_match import Acao, HeadlessMatch, PASSAR
+
+
+class _No:
+    """Nó da árvore de busca: a sequência de jogadas do bot dentro da fase principal."""
+    __slots__ = ("acao", "pai", "filhos", "pendentes", "visitas", "valor")
+
+    def __init__(self, acao: Optional[Acao], pai: "_No", pendentes: List[Acao]):
+        self.acao = acao
+        self.pai = pai
+        self.filhos: List["_No"] = []
+        self.pendentes = pendentes   # Jogadas legais ainda não expandidas
+        self.visitas = 0
+        self.valor = 0.0             # Soma das recompensas (do ponto de vista do bot)
+
+    def selecionar(self, exploracao: float) -> "_No":
+        """UCT: média das recompensas + bônus para os filhos pouco visitados."""
+        log_pai = math.log(self.visitas)
+        return max(
+            self.filhos,
+            key=lambda f: f.valor / f.visitas + exploracao * math.sqrt(log_pai / f.visitas)
+        )
+
+
+class BotAIService:
+    """
+    Oponente controlado pela máquina.
+    A cada decisão da fase principal, enumera as jogadas legais (RuleEngine, via
+    HeadlessMatch.acoes_legais) e faz uma Busca em Árvore de Monte Carlo (MCTS)
+    com orçamento fixo de tempo de relógio. Cada iteração joga o resto da
+    partida (até um horizonte de turnos) num clone headless da mesa, com a
+    política gulosa padrão para os dois lados.
+
+    O bot não espia: no clone, a mão do oponente e os dois grimórios são
+    reembaralhados (determinização), então cada iteração sorteia um mundo
+    compatível com o que ele vê.
+
+    Com workers > 1 a busca é paralela na raiz: cada processo cresce a sua
+    própria árvore com uma seed diferente e, no fim, as visitas de cada jogada
+    da raiz são somadas. O pool de processos fica de pé entre as decisões.
+    """
+
+    def __init__(self, tempo_por_decisao: float = 0.2, max_iteracoes: int = None,
+                 exploracao: float = 1.4, horizonte_turnos: int = 6, seed: int = None,
+                 workers: int = 1):
+        """
+        :param tempo_por_decisao: Orçamento em segundos para cada jogada escolhida.
+        :param max_iteracoes: Teto de iterações (por árvore); com ele e uma seed, a escolha
+                              é reproduzível (o relógio deixa de decidir quando a busca para).
+        :param horizonte_turnos: Turnos simulados em cada rollout antes de avaliar a mesa.
+        :param workers: Árvores independentes em processos separados (1 = busca no próprio processo).
+        """
+        self.tempo_por_decisao = tempo_por_decisao
+        self.max_iteracoes = max_iteracoes
+        self.exploracao = exploracao
+        self.horizonte_turnos = horizonte_turnos
+        self.workers = max(1, workers)
+        self.rng = random.Random(seed)
+        self.ultimas_iteracoes = 0
+        self._pool = None  # Criado na primeira decisão paralela (ou em aquecer)
+
+    def __getstate__(self):
+        # O pool não atravessa processos: um bot enviado a um worker busca sozinho
+        estado = self.__dict__.copy()
+        estado["_pool"] = None
+        return estado
+
+    # =========================================================
+    # INTERFACE DE POLÍTICA (usada pelo HeadlessMatch e pelo MatchController)
+    # =========================================================
+    def jogar_fase_principal(self, partida: HeadlessMatch, player: PlayerModel):
+        """Escolhe e executa jogadas até o bot decidir passar (ou nada mais ser possível)."""
+        while not partida.encerrada:
+            acao = self.escolher_acao(partida, player)
+            if acao == PASSAR or not partida.aplicar_acao(player, acao):
+                return
+            print(f"[BOT] {player.name}: {acao.tipo} {acao.carta} ({self.ultimas_iteracoes} simulações)")
+
+    def escolher_acao(self, partida: HeadlessMatch, player: PlayerModel) -> Acao:
+        """Roda a MCTS dentro do orçamento e devolve a jogada mais visitada da raiz."""
+        acoes = partida.acoes_legais(player)
+        self.ultimas_iteracoes = 0
+        if len(acoes) == 1:
+            return acoes[0]
+
+        if self.workers > 1:
+            visitas = self._buscar_em_paralelo(partida, player.player_id)
+        else:
+            visitas, self.ultimas_iteracoes = self._buscar(partida, player.player_id)
+
+        # Empates ficam com a primeira jogada da lista legal (não depende de qual worker terminou antes)
+        return max(acoes, key=lambda a: visitas.get(a, 0))
+
+    # =========================================================
+    # PARALELISMO NA RAIZ (pool de processos mantido aquecido)
+    # =========================================================
+    def aquecer(self):
+        """
+        Sobe os processos antes da primeira decisão, sem esperar por eles
+        (a partida segue enquanto os workers importam os módulos).
+        """
+        if self.workers > 1:
+            pool = self._obter_pool()
+            for _ in range(self.workers):
+                pool.submit(_aquecer_worker)
+
+    def encerrar(self):
+        """Derruba o pool de processos (o bot continua utilizável; o pool volta sob demanda)."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _obter_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # 'spawn': a UI tem threads vivas (miniaturas, downloads) que um fork herdaria pela metade
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def _buscar_em_paralelo(self, partida: HeadlessMatch, jogador_id: str) -> Dict[Acao, int]:
+        """Uma árvore por worker, cada uma com a sua seed; soma as visitas da raiz."""
+        # Seeds tiradas do rng do bot: mesma seed inicial, mesmas árvores
+        seeds = [self.rng.getrandbits(64) for _ in range(self.workers)]
+        # A mesa é serializada uma vez só e os mesmos bytes vão para todos os workers
+        mesa = pickle.dumps(partida.match, protocol=pickle.HIGHEST_PROTOCOL)
+        pool = self._obter_pool()
+        futuros = [
+            pool.submit(_buscar_em_worker, self, mesa, partida.max_turnos, jogador_id, seed)
+            for seed in seeds
+        ]
+
+        visitas: Dict[Acao, int] = {}
+        for futuro in futuros:
+            parciais, iteracoes = futuro.result()
+            self.ultimas_iteracoes += iteracoes
+            for acao, n in parciais.items():
+                visitas[acao] = visitas.get(acao, 0) + n
+        return visitas
+
+    # =========================================================
+    # MCTS
+    # =========================================================
+    def _buscar(self, partida: HeadlessMatch, jogador_id: str):
+        """Uma árvore dentro do orçamento. :return: ({jogada da raiz: visitas}, iterações)."""
+        raiz = _No(None, None, partida.acoes_legais(partida.match.players[jogador_id]))
+        prazo = time.perf_counter() + self.tempo_por_decisao
+        iteracoes = 0
+
+        # Os rollouts imprimiriam cada compra e cada mágica dos clones
+        with contextlib.redirect_stdout(None):
+            # Pelo menos uma visita por jogada, mesmo com orçamento mínimo
+            while raiz.pendentes or (
+                time.perf_counter() < prazo
+                and (self.max_iteracoes is None or iteracoes < self.max_iteracoes)
+            ):
+                self._iterar(raiz, partida, jogador_id)
+                iteracoes += 1
+
+        return {filho.acao: filho.visitas for filho in raiz.filhos}, iteracoes
+
+    def _iterar(self, raiz: _No, partida: HeadlessMatch, jogador_id: str):
+        simulada = self._clonar(partida, jogador_id)
+        jogador = simulada.match.players[jogador_id]
+        no = raiz
+
+        # 1. Seleção: desce pelos nós totalmente expandidos repetindo as jogadas no clone
+        while not no.pendentes and no.filhos:
+            no = no.selecionar(self.exploracao)
+            simulada.aplicar_acao(jogador, no.acao)
+
+        # 2. Expansão: uma jogada nova por iteração
+        if no.pendentes:
+            acao = no.pendentes.pop(self.rng.randrange(len(no.pendentes)))
+            simulada.aplicar_acao(jogador, acao)
+            proximas = [] if acao == PASSAR or simulada.encerrada else simulada.acoes_legais(jogador)
+            filho = _No(acao, no, proximas)
+            no.filhos.append(filho)
+            no = filho
+
+        # 3. Simulação e 4. Retropropagação
+        recompensa = self._simular(simulada, jogador_id, passou=no.acao == PASSAR)
+        while no is not None:
+            no.visitas += 1
+            no.valor += recompensa
+            no = no.pai
+
+    def _clonar(self, partida: HeadlessMatch, jogador_id: str) -> HeadlessMatch:
+        """Cópia da mesa com as informações ocultas sorteadas de novo."""
+        # CardDefinition é compartilhada (flyweight): só o estado vivo das cartas é copiado
+        match = copy.deepcopy(partida.match)
+
+        for player in match.players.values():
+            grimorio = player.deck.library
+            if player.player_id == jogador_id:
+                self.rng.shuffle(grimorio)
+                continue
+            # A mão do oponente é tão desconhecida quanto o grimório dele
+            escondidas = list(player.hand) + grimorio
+            self.rng.shuffle(escondidas)
+            tamanho_mao = len(player.hand)
+            player.hand[:] = escondidas[:tamanho_mao]
+            grimorio[:] = escondidas[tamanho_mao:]
+
+        # Sem políticas: dentro do rollout os dois lados jogam na gulosa
+        return HeadlessMatch.de_partida(match, max_turnos=partida.max_turnos)
+
+    def _simular(self, simulada: HeadlessMatch, jogador_id: str, passou: bool) -> float:
+        """Rollout guloso até o fim da partida ou do horizonte; devolve a recompensa em [0, 1]."""
+        if passou:
+            # O bot encerrou a fase: a gulosa não pode jogar o resto por ele
+            simulada.concluir_fase()
+
+        limite = simulada.match.state.turn_number + self.horizonte_turnos
+        while not simulada.encerrada and simulada.match.state.turn_number < limite:
+            simulada.executar_fase()
+        return self._avaliar(simulada, jogador_id)
+
+    @staticmethod
+    def _avaliar(simulada: HeadlessMatch, jogador_id: str) -> float:
+        state = simulada.match.state
+        if state.is_game_over:
+            if state.winner_id is None:
+                return 0.5
+            return 1.0 if state.winner_id == jogador_id else 0.0
+
+        # Partida em aberto: vida, poder na mesa e terrenos viram uma nota suave
+        eu = simulada.match.players[jogador_id]
+        oponente = next(p for p in simulada.match.players.values() if p.player_id != jogador_id)
+
+        def forca(p: PlayerModel) -> float:
+            poder = sum(HeadlessMatch._poder(c) for c in p.battlefield_creatures)
+            return p.life + 2 * poder + len(p.battlefield_lands)
+
+        return 0.5 + 0.5 * math.tanh((forca(eu) - forca(oponente)) / 20)
+
+
+# =========================================================
+# FUNÇÕES DOS WORKERS (nível de módulo para o pickle do ProcessPoolExecutor)
+# =========================================================
+def _aquecer_worker():
+    return True
+
+
+def _buscar_em_worker(bot: BotAIService, mesa: bytes, max_turnos: int, jogador_id: str, seed: int):
+    """Roda uma árvore com a configuração do bot, mas com rng próprio semeado pelo processo principal."""
+    bot.rng = random.Random(seed)
+    partida = HeadlessMatch.de_partida(pickle.loads(mesa), max_turnos=max_turnos)
+    return bot._buscar(partida, jogador_id)
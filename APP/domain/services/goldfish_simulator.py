@@ -0,0 +1,121 @@
+import time
+import numpy as np
+from APP.domain.services.deck_builder import DeckBuilderService
+
+
+class GoldfishSimulator:
+    """
+    Modo "Goldfish": joga sozinho contra um peixinho que não faz nada.
+    Sorteia milhões de mãos iniciais e compras dos primeiros turnos para medir
+    a consistência de mana do deck antes de decidir um Mulligan.
+
+    O grimório vira um array NumPy de índices (um por cópia física) e o
+    embaralhamento é feito em bloco para todas as mãos de uma vez.
+    """
+
+    TAMANHO_MAO = 7
+
+    def __init__(self, deck_data: dict, seed: int = None):
+        deck = DeckBuilderService.build_from_json(deck_data)
+
+        # Cada nome distinto ganha um índice; as cópias repetem o índice no grimório
+        indices_por_nome = {}
+        eh_terreno, cmc = [], []
+        grimorio = []
+        for card in deck.library:
+            if card.name not in indices_por_nome:
+                indices_por_nome[card.name] = len(indices_por_nome)
+                eh_terreno.append(card.is_land)
+                cmc.append(int(card.cmc))
+            grimorio.append(indices_por_nome[card.name])
+
+        self.nomes = list(indices_por_nome.keys())
+        # Tabela de consulta por índice: -1 para terreno, CMC para as mágicas
+        self.custo_por_indice = np.where(eh_terreno, -1, cmc).astype(np.int16)
+
+        dtype = np.int8 if len(self.nomes) < 128 else np.int16
+        self.grimorio = np.array(grimorio, dtype=dtype)
+        self.rng = np.random.default_rng(seed)
+
+    def simular(self, total_maos: int = 1_000_000, turnos: int = 5, na_jogada: bool = True,
+                terrenos_min: int = 2, terrenos_max: int = 5, tamanho_lote: int = 50_000) -> dict:
+        """
+        Sorteia 'total_maos' aberturas e as compras até o turno 'turnos'.
+        :param na_jogada: True se começa jogando (não compra no turno 1).
+        :param terrenos_min/terrenos_max: Regra de "manter" a mão inicial.
+        :return: Distribuição de terrenos, taxa de manter e probabilidades por turno.
+        :raises ValueError: Sem mãos ou turnos para sortear, ou grimório menor que a mão inicial.
+        """
+        if total_maos < 1 or turnos < 1:
+            raise ValueError(f"Precisa de pelo menos 1 mão e 1 turno (recebido: {total_maos} mãos, {turnos} turnos).")
+        if len(self.grimorio) < self.TAMANHO_MAO:
+            raise ValueError(
+                f"O grimório tem {len(self.grimorio)} cartas; a mão inicial precisa de {self.TAMANHO_MAO}."
+            )
+
+        inicio = time.perf_counter()
+        # Cartas vistas até o fim da compra do turno t
+        vistas = [self.TAMANHO_MAO + t - (1 if na_jogada else 0) for t in range(1, turnos + 1)]
+        k = min(max(vistas), len(self.grimorio))
+
+        dist_terrenos = np.zeros(self.TAMANHO_MAO + 1, dtype=np.int64)
+        terreno_na_curva = np.zeros(turnos, dtype=np.int64)
+        jogada_na_curva = np.zeros(turnos, dtype=np.int64)
+        mantidas = 0
+
+        restantes = total_maos
+        while restantes > 0:
+            n = min(tamanho_lote, restantes)
+            topo = self._sortear_topos(n, k)
+
+            custos = self.custo_por_indice[topo]
+            terrenos_acum = np.cumsum(custos == -1, axis=1, dtype=np.int16)
+
+            na_mao = terrenos_acum[:, min(self.TAMANHO_MAO, k) - 1]
+            dist_terrenos += np.bincount(na_mao, minlength=self.TAMANHO_MAO + 1)[:self.TAMANHO_MAO + 1]
+            mantidas += np.count_nonzero((na_mao >= terrenos_min) & (na_mao <= terrenos_max))
+
+            for t in range(1, turnos + 1):
+                qtd_vistas = min(vistas[t - 1], k)
+                tem_terrenos = terrenos_acum[:, qtd_vistas - 1] >= t
+                tem_magica = (custos[:, :qtd_vistas] == t).any(axis=1)
+                terreno_na_curva[t - 1] += np.count_nonzero(tem_terrenos)
+                jogada_na_curva[t - 1] += np.count_nonzero(tem_terrenos & tem_magica)
+
+            restantes -= n
+
+        return {
+            "maos": total_maos,
+            "distribuicao_terrenos": {q: float(dist_terrenos[q] / total_maos) for q in range(self.TAMANHO_MAO + 1)},
+            "taxa_manter": float(mantidas / total_maos),
+            "por_turno": [
+                {
+                    "turno": t,
+                    "terreno_na_curva": float(terreno_na_curva[t - 1] / total_maos),
+                    "jogada_na_curva": float(jogada_na_curva[t - 1] / total_maos)
+                }
+                for t in range(1, turnos + 1)
+            ],
+            "segundos": time.perf_counter() - inicio
+        }
+
+    def _sortear_topos(self, n: int, k: int) -> np.ndarray:
+        """
+        Fisher-Yates parcial vetorizado: embaralha só as k primeiras posições
+        de n cópias do grimório. Devolve uma matriz (n, k) com os índices do topo.
+        """
+        tamanho = len(self.grimorio)
+        baralhos = np.tile(self.grimorio, n)
+        base = np.arange(n, dtype=np.intp) * tamanho
+        sorteios = self.rng.random((k, n), dtype=np.float32)
+
+        for j in range(k):
+            # O minimum protege contra o arredondamento do float32 chegar em (tamanho - j)
+            deslocamento = np.minimum((sorteios[j] * (tamanho - j)).astype(np.intp), tamanho - j - 1)
+            escolhida = base + j + deslocamento
+            atual = base + j
+            temp = baralhos[escolhida]
+            baralhos[escolhida] = baralhos[atual]
+            baralhos[atual] = temp
+
+        return baralhos.reshape(n, tamanho)[:, :k]
@@ -0,0 +1,294 @@
+import random
+from typing import List, NamedTuple, Optional
+from APP.domain.models.match_model import MatchModel
+from APP.domain.models.player_model import PlayerModel
+from APP.domain.models.card_model import CardModel
+from APP.domain.services.deck_builder import DeckBuilderService
+from APP.domain.services.rule_engine import RuleEngine
+from APP.domain.services.mana_manager import ManaManager
+
+
+class ResultadoPartida(NamedTuple):
+    """Registro compacto de uma partida simulada (barato de serializar entre processos)."""
+    vencedor: Optional[str]
+    turnos: int
+    vida_p1: int
+    vida_p2: int
+
+
+class Acao(NamedTuple):
+    """Uma jogada da fase principal. As cartas vão pelo nome: cópias iguais são a mesma jogada."""
+    tipo: str               # "TERRENO", "CONJURAR" ou "PASSAR"
+    carta: Optional[str] = None
+
+
+PASSAR = Acao("PASSAR")
+
+
+class HeadlessMatch:
+    """
+    Partida completa sem interface gráfica.
+    Dirige o MatchModel com o RuleEngine e o ManaManager, do mesmo jeito que o
+    MatchController faz, mas sem pygame, sem View e sem esperar cliques.
+    """
+
+    FASES_PRINCIPAIS = ("PRINCIPAL 1", "PRINCIPAL 2")
+
+    def __init__(self, deck_data_p1: dict, deck_data_p2: dict = None, max_turnos: int = 40, politicas: dict = None):
+        """
+        :param deck_data_p1: Dicionário bruto do deck (formato do DeckRepository).
+        :param deck_data_p2: Deck do oponente. Se None, é um espelho do P1.
+        :param max_turnos: Limite de segurança; ao estourar, a partida termina empatada.
+        :param politicas: {player_id: bot} para quem não usa a política gulosa padrão.
+                          O bot precisa de um método jogar_fase_principal(partida, player).
+        """
+        deck_p1 = DeckBuilderService.build_from_json(deck_data_p1)
+        deck_p2 = DeckBuilderService.build_from_json(deck_data_p2 or deck_data_p1)
+
+        player_1 = PlayerModel(player_id="P1", name=deck_p1.name, deck=deck_p1)
+        player_2 = PlayerModel(player_id="P2", name=deck_p2.name, deck=deck_p2)
+
+        self.match = MatchModel(player1=player_1, player2=player_2)
+        self.max_turnos = max_turnos
+        self.politicas = politicas or {}
+
+    @classmethod
+    def de_partida(cls, match: MatchModel, max_turnos: int = 40, politicas: dict = None) -> "HeadlessMatch":
+        """Envolve um MatchModel já montado (a mesa da UI ou um clone dela) sem reconstruir os decks."""
+        partida = cls.__new__(cls)
+        partida.match = match
+        partida.max_turnos = max_turnos
+        partida.politicas = politicas or {}
+        return partida
+
+    # =========================================================
+    # CICLO DA PARTIDA
+    # =========================================================
+    def iniciar(self, primeiro_jogador_id: str = None):
+        """Embaralha, compra as mãos iniciais e passa o relógio para o turno 1."""
+        if primeiro_jogador_id is None:
+            primeiro_jogador_id = random.choice(list(self.match.players.keys()))
+
+        for player in self.match.players.values():
+            player.deck.embaralhar()
+            player.draw_cards(7)
+
+        self.match.state.iniciar_jogo(primeiro_jogador_id)
+        self.match.starting_player_id = primeiro_jogador_id
+
+    @property
+    def encerrada(self) -> bool:
+        return self.match.state.is_game_over
+
+    def jogar_ate_o_fim(self) -> ResultadoPartida:
+        """Executa fase após fase até alguém perder ou o limite de turnos estourar."""
+        while not self.encerrada:
+            self.executar_fase()
+        return self.resultado()
+
+    def executar_fase(self):
+        """Joga a fase atual do jogador ativo e avança o relógio."""
+        self.jogar_fase_atual()
+        self.concluir_fase()
+
+    def jogar_fase_atual(self):
+        """Faz as jogadas do jogador ativo na fase atual, sem mexer no relógio."""
+        player = self.match.get_active_player()
+        fase = self.match.phase
+
+        if fase in self.FASES_PRINCIPAIS:
+            politica = self.politicas.get(player.player_id)
+            if politica:
+                politica.jogar_fase_principal(self, player)
+            else:
+                self._jogar_fase_principal(player)
+        elif fase == "COMBATE":
+            self._declarar_ataque(player)
+
+    def concluir_fase(self):
+        """Confere o fim da partida e, se ela continua, passa para a próxima fase."""
+        self._verificar_fim()
+        if not self.encerrada:
+            self.avancar_fase()
+
+    def avancar_fase(self):
+        """Mesma sequência do MatchController.next_phase, sem a sincronização visual."""
+        self.match.next_phase()
+        player = self.match.get_active_player()
+
+        if self.match.phase == "INICIAL":
+            self._etapa_inicial(player)
+
+        # A mana flutuante se perde em toda troca de fase
+        player.reset_mana_pool()
+        self._verificar_fim()
+
+    def resultado(self) -> ResultadoPartida:
+        p1 = self.match.players["P1"]
+        p2 = self.match.players["P2"]
+        return ResultadoPartida(
+            vencedor=self.match.state.winner_id,
+            turnos=self.match.state.turn_number,
+            vida_p1=p1.life,
+            vida_p2=p2.life
+        )
+
+    # =========================================================
+    # ETAPAS AUTOMÁTICAS
+    # =========================================================
+    def _etapa_inicial(self, player: PlayerModel):
+        """Desvira, remove o enjoo de invocação, zera os terrenos e compra a carta do turno."""
+        for card in player.battlefield_lands + player.battlefield_creatures + player.battlefield_other:
+            card.untap()
+            card.summoning_sickness = False
+
+        player.lands_played_this_turn = 0
+
+        if self.match.state.turn_number == 1 and player.player_id == self.match.starting_player_id:
+            return
+        player.draw_cards(1)
+
+    def _verificar_fim(self):
+        """Encerra a partida por eliminação ou pelo limite de turnos."""
+        state = self.match.state
+        if state.is_game_over:
+            return
+
+        vivos = [p for p in self.match.players.values() if p.is_alive]
+        if len(vivos) < len(self.match.players):
+            state.is_game_over = True
+            state.winner_id = vivos[0].player_id if len(vivos) == 1 else None
+        elif state.turn_number > self.max_turnos:
+            state.is_game_over = True
+            state.winner_id = None
+
+    # =========================================================
+    # JOGADAS LEGAIS (usadas pelos bots)
+    # =========================================================
+    def acoes_legais(self, player: PlayerModel) -> List[Acao]:
+        """
+        Jogadas que o RuleEngine permite agora na fase principal: um terreno,
+        uma mágica que a reserva + terrenos desvirados pagam, ou passar.
+        """
+        acoes = [PASSAR]
+        if self.encerrada:
+            return acoes
+
+        vistas = set()
+        for card in player.hand:
+            if card.name in vistas:
+                continue
+            if card.is_land:
+                pode, _ = RuleEngine.validar_descida_terreno(self.match, player.player_id, card)
+                tipo = "TERRENO"
+            else:
+                pode, _ = RuleEngine.validar_conjuracao(self.match, player.player_id, card, com_terrenos=True)
+                tipo = "CONJURAR"
+            if pode:
+                vistas.add(card.name)
+                acoes.append(Acao(tipo, card.name))
+        return acoes
+
+    def aplicar_acao(self, player: PlayerModel, acao: Acao) -> bool:
+        """Executa uma jogada de acoes_legais. PASSAR não faz nada (quem chama encerra a fase)."""
+        if acao.tipo == "PASSAR":
+            return True
+
+        for index, card in enumerate(player.hand):
+            if card.name != acao.carta:
+                continue
+            if acao.tipo == "TERRENO" and card.is_land:
+                pode, _ = RuleEngine.validar_descida_terreno(self.match, player.player_id, card)
+                if pode:
+                    player.play_land(index)
+                    player.lands_played_this_turn += 1
+                return pode
+            if acao.tipo == "CONJURAR" and not card.is_land:
+                return self._pagar_e_conjurar(player, card)
+        return False
+
+    # =========================================================
+    # POLÍTICA PADRÃO (Gulosa: terreno, depois a mágica mais cara possível)
+    # =========================================================
+    def _jogar_fase_principal(self, player: PlayerModel):
+        self._jogar_terreno(player)
+
+        conjurou = True
+        while conjurou and not self.encerrada:
+            conjurou = self._conjurar_mais_cara(player)
+
+    def _jogar_terreno(self, player: PlayerModel):
+        for index, card in enumerate(player.hand):
+            if not card.is_land:
+                continue
+            pode, _ = RuleEngine.validar_descida_terreno(self.match, player.player_id, card)
+            if pode:
+                player.play_land(index)
+                player.lands_played_this_turn += 1
+            return
+
+    def _conjurar_mais_cara(self, player: PlayerModel) -> bool:
+        """Tenta conjurar a carta de maior CMC que caiba nos terrenos disponíveis."""
+        desvirados = [c for c in player.battlefield_lands if not c.is_tapped]
+        mana_disponivel = sum(player.mana_pool.values()) + len(desvirados)
+
+        candidatas = sorted(
+            (c for c in player.hand
+             if not c.is_land and c.cmc <= mana_disponivel and ManaManager.castavel(player, c)),
+            key=lambda c: c.cmc,
+            reverse=True
+        )
+
+        for card in candidatas:
+            if self._pagar_e_conjurar(player, card):
+                return True
+        return False
+
+    def _pagar_e_conjurar(self, player: PlayerModel, card: CardModel) -> bool:
+        """Paga com a reserva ou, se faltar, vira só os terrenos do plano ótimo (na cor que a carta pede)."""
+        pode, _ = RuleEngine.validar_conjuracao(self.match, player.player_id, card)
+        if not pode:
+            plano = ManaManager.planejar_pagamento(player, card)
+            if not plano.viavel or not plano.terrenos:
+                return False
+            ManaManager.virar_terrenos(player, plano)
+            pode, _ = RuleEngine.validar_conjuracao(self.match, player.player_id, card)
+
+        if pode:
+            self._conjurar(player, card)
+        return pode
+
+    def _conjurar(self, player: PlayerModel, card: CardModel):
+        index = player.hand.index(card)
+        ManaManager.descontar_custo(player, card)
+
+        if card.is_creature:
+            player.cast_creature(index)
+        elif card.is_instant or card.is_sorcery:
+            player.resolve_spell(index)
+        else:
+            player.cast_other(index)
+
+    def _declarar_ataque(self, player: PlayerModel):
+        """Sem bloqueadores: toda criatura apta ataca e o dano vai direto no oponente."""
+        oponente = self.match.get_opponent()
+        dano_total = 0
+
+        for creature in player.battlefield_creatures:
+            if creature.summoning_sickness:
+                continue
+            pode, _ = RuleEngine.pode_atacar(self.match, player.player_id, creature)
+            if pode:
+                creature.tap()
+                dano_total += self._poder(creature)
+
+        if dano_total > 0 and oponente:
+            oponente.take_damage(dano_total)
+
+    @staticmethod
+    def _poder(card: CardModel) -> int:
+        """Converte o 'power' textual ('3', '*', None) em inteiro seguro."""
+        try:
+            return max(0, int(card.power))
+        except (TypeError, ValueError):
+            return 0
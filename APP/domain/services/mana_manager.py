@@ -1,5 +1,37 @@
 # APP/domain/services/mana_manager.py
 
+from functools import lru_cache
+from itertools import product
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+from APP.domain.models.card_definition import CORES_MANA, CustoAnalisado
+
+_QUALQUER_COR = frozenset(CORES_MANA)
+
+# Custo de usar cada fonte (menor = gasta primeiro). A mana já na reserva
+# vem antes dos terrenos; entre terrenos, os de menos cores vão antes,
+# guardando os flexíveis (duais, tri-lands) para as próximas mágicas.
+_CUSTO_POOL_INCOLOR = (0, 0)
+_CUSTO_POOL_COLORIDA = (0, 1)
+
+
+class Pagamento(NamedTuple):
+    """Plano de pagamento devolvido pelo ManaManager.planejar_pagamento."""
+    viavel: bool
+    da_pool: Dict[str, int]                  # Quanto sai de cada cor da reserva
+    terrenos: Tuple[Tuple[object, str], ...] # (terreno a virar, cor que ele gera)
+    vida: int                                # Vida paga em símbolos phyrexianos
+
+
+class _Fonte(NamedTuple):
+    cores: frozenset
+    custo: tuple
+    terreno: object     # CardModel do terreno, ou None para mana da reserva
+    cor_pool: Optional[str]
+
+
+_PAGAMENTO_IMPOSSIVEL = Pagamento(False, {}, (), 0)
+
+
 class ManaManager:
     """
     Especialista em gerir a economia de mana.
@@ -7,65 +39,200 @@ class ManaManager:
     """
 
     @staticmethod
-    def gerar_mana(player, card):
+    def gerar_mana(player, card, cor: str = None):
         """
         Lê o 'produced_mana' da carta e injeta na pool do jogador.
+        :param cor: Cor escolhida para terrenos de várias cores (padrão: a primeira).
         """
         # 1. Verifica se a carta tem o dado de produção que salvamos no JSON
         producao = getattr(card, 'produced_mana', [])
-        
+
         if not producao:
             # Se for um terreno sem dado, assume Incolor (C) por segurança
             producao = ["C"]
 
         # 2. No Magic básico, terrenos geram 1 mana.
-        # Em terrenos duplos, pegamos a primeira cor (futuramente abriremos um menu)
-        cor_gerada = producao[0]
+        # Sem escolha explícita, terrenos duplos geram a primeira cor
+        cor_gerada = cor if cor in producao else producao[0]
 
         # 3. Alimenta a reserva do jogador
         if cor_gerada in player.mana_pool:
             player.mana_pool[cor_gerada] += 1
             return cor_gerada
-        
+
         return None
 
     @staticmethod
     def descontar_custo(player, card):
         """
-        [PASSO 2 - VERSÃO A4]
         Consome os recursos da mana_pool do jogador para pagar a carta.
-        Prioriza pagar cores específicas e usa o saldo restante para o custo genérico.
+        Usa o mesmo plano do solucionador: a reserva que sobra é a mais útil
+        para as próximas mágicas (híbridos e genéricos não queimam cores à toa).
+        """
+        plano = ManaManager.planejar_pagamento(player, card, usar_terrenos=False)
+        if not plano.viavel:
+            print(f"[MANA] Reserva de {player.name} não cobre {card.name}; nada foi descontado.")
+            return False
+
+        ManaManager._aplicar(player, plano)
+        print(f"[MANA] Custo de {card.name} descontado da pool de {player.name}.")
+        return True
+
+    # =========================================================
+    # SOLUCIONADOR DE PAGAMENTO
+    # =========================================================
+    @staticmethod
+    def planejar_pagamento(player, card, usar_terrenos: bool = True, permitir_vida: bool = True) -> Pagamento:
         """
-        custo = card.mana_cost_map  # Pega o dicionário ex: {'W': 1, 'Generic': 2}
-        pool = player.mana_pool
+        Escolhe como pagar a carta com a reserva e (opcionalmente) os terrenos desvirados.
+        Cada símbolo do custo precisa de uma fonte distinta que gere uma cor aceita:
+        é um emparelhamento bipartido símbolos x fontes. As fontes entram da mais
+        barata para a mais flexível, então o plano gasta o mínimo de flexibilidade.
+        """
+        terrenos = [t for t in player.battlefield_lands if not t.is_tapped] if usar_terrenos else ()
+        vida_disponivel = player.life - 1 if permitir_vida else 0
+        return ManaManager.resolver(card.custo, player.mana_pool, terrenos, vida_disponivel)
+
+    @staticmethod
+    def pode_pagar(player, card, usar_terrenos: bool = True) -> bool:
+        """A carta cabe na reserva + terrenos desvirados?"""
+        return ManaManager.planejar_pagamento(player, card, usar_terrenos).viavel
+
+    @staticmethod
+    def castavel(player, card) -> bool:
+        """
+        "Mana em potencial": a carta seria paga com a reserva + terrenos desvirados?
+        Não vira nada. A resposta é memorizada por (custo, reserva, cores dos
+        terrenos desvirados), então varrer a mão inteira a cada decisão é barato.
+        """
+        custo = card.custo
+        # A vida só importa até o que os phyrexianos poderiam cobrar
+        vida = min(max(player.life - 1, 0), 2 * len(custo.phyrexian))
+        reserva = tuple(item for item in player.mana_pool.items() if item[1] > 0)
+        return _castavel_memorizado(custo, reserva, ManaManager.assinatura_terrenos(player.battlefield_lands), vida)
+
+    @staticmethod
+    def assinatura_terrenos(terrenos) -> tuple:
+        """Cores dos terrenos desvirados como multiconjunto ordenado: ('R', 'R', 'UW')."""
+        return tuple(sorted(
+            "".join(sorted(getattr(t, 'produced_mana', ()) or ("C",)))
+            for t in terrenos if not t.is_tapped
+        ))
 
-        # 1. Pagar os custos coloridos específicos (W, U, B, R, G, C)
-        for cor, qtd in custo.items():
-            if cor == "Generic":
+    @staticmethod
+    def virar_terrenos(player, plano: Pagamento):
+        """Vira os terrenos escolhidos no plano, colocando a cor certa de cada um na reserva."""
+        for terreno, cor in plano.terrenos:
+            if terreno.tap():
+                ManaManager.gerar_mana(player, terreno, cor)
+
+    @staticmethod
+    def resolver(custo: CustoAnalisado, pool: Mapping[str, int], terrenos=(), vida_disponivel: int = 0) -> Pagamento:
+        """Núcleo do solucionador, sem depender do PlayerModel (usado também pelos bots)."""
+        fontes = ManaManager._montar_fontes(pool, terrenos)
+
+        for vida, exigencias, generico in _alternativas(custo):
+            if vida > vida_disponivel:
                 continue
-            
-            # Subtrai da pool (a validação no RuleEngine já garantiu que existe saldo)
-            if cor in pool:
-                pool[cor] = max(0, pool[cor] - qtd)
-
-        # 2. Pagar o custo Genérico (números como {1}, {2}, etc.)
-        # Pode ser pago por qualquer cor restante na pool.
-        custo_generico = custo.get("Generic", 0)
-        
-        if custo_generico > 0:
-            # Lista de cores para tentar descontar (priorizando Incolor 'C' primeiro)
-            ordem_desconto = ["C", "W", "U", "B", "R", "G"]
-            
-            for cor in ordem_desconto:
-                if custo_generico <= 0:
-                    break
-                
-                if pool.get(cor, 0) > 0:
-                    saldo_na_pool = pool[cor]
-                    # Vê quanto pode tirar dessa cor
-                    gasto = min(saldo_na_pool, custo_generico)
-                    
-                    pool[cor] -= gasto
-                    custo_generico -= gasto
+            escolha = ManaManager._emparelhar(list(exigencias), generico, fontes)
+            if escolha is not None:
+                break
+        else:
+            return _PAGAMENTO_IMPOSSIVEL
 
-        print(f"[MANA] Custo de {card.name} descontado da pool de {player.name}.")
+        da_pool, usados_terrenos = {}, []
+        for i in sorted(escolha):
+            fonte = fontes[i]
+            if fonte.terreno is None:
+                da_pool[fonte.cor_pool] = da_pool.get(fonte.cor_pool, 0) + 1
+            else:
+                aceitas = escolha[i] & fonte.cores
+                cor = next(c for c in CORES_MANA if c in aceitas)
+                usados_terrenos.append((fonte.terreno, cor))
+        return Pagamento(True, da_pool, tuple(usados_terrenos), vida)
+
+    @staticmethod
+    def _montar_fontes(pool: Mapping[str, int], terrenos) -> List[_Fonte]:
+        fontes = []
+        for cor, qtd in pool.items():
+            if qtd > 0 and cor in _QUALQUER_COR:
+                custo = _CUSTO_POOL_INCOLOR if cor == "C" else _CUSTO_POOL_COLORIDA
+                fontes.extend([_Fonte(frozenset((cor,)), custo, None, cor)] * qtd)
+        for terreno in terrenos:
+            cores = frozenset(getattr(terreno, 'produced_mana', ()) or ()) & _QUALQUER_COR or frozenset(("C",))
+            fontes.append(_Fonte(cores, (1, len(cores)), terreno, None))
+        fontes.sort(key=lambda f: f.custo)
+        return fontes
+
+    @staticmethod
+    def _emparelhar(exigencias: List[frozenset], generico: int, fontes: List[_Fonte]) -> Optional[Dict[int, frozenset]]:
+        """
+        Guloso sobre um matroide transversal: testa as fontes da mais barata para
+        a mais cara e só fica com a fonte se ainda existir um emparelhamento
+        (caminho aumentante de Kuhn). O conjunto final é o de menor custo que
+        cobre todos os símbolos. :return: {índice_da_fonte: cores aceitas pelo símbolo} ou None.
+        """
+        exigencias = exigencias + [_QUALQUER_COR] * generico
+        if not exigencias:
+            return {}
+        if len(fontes) < len(exigencias):
+            return None
+
+        dono = [None] * len(exigencias)  # exigência -> fonte
+
+        def aumentar(i, visitadas):
+            cores = fontes[i].cores
+            for j, aceitas in enumerate(exigencias):
+                if j in visitadas or not (cores & aceitas):
+                    continue
+                visitadas.add(j)
+                if dono[j] is None or aumentar(dono[j], visitadas):
+                    dono[j] = i
+                    return True
+            return False
+
+        pendentes = len(exigencias)
+        for i in range(len(fontes)):
+            if aumentar(i, set()):
+                pendentes -= 1
+                if pendentes == 0:
+                    return {i: exigencias[j] for j, i in enumerate(dono)}
+        return None
+
+    @staticmethod
+    def _aplicar(player, plano: Pagamento):
+        for cor, qtd in plano.da_pool.items():
+            player.mana_pool[cor] -= qtd
+        if plano.vida:
+            player.take_damage(plano.vida)
+
+
+class _TerrenoVirtual(NamedTuple):
+    """Terreno reconstruído a partir da assinatura (só as cores importam)."""
+    produced_mana: str
+
+
+@lru_cache(maxsize=1024)
+def _alternativas(custo: CustoAnalisado) -> Tuple[Tuple[int, Tuple[frozenset, ...], int], ...]:
+    """
+    Formas de pagar os símbolos de escolha: cada phyrexiano com mana ou 2 de vida,
+    cada {2/W} com a cor ou com genéricos. :return: (vida, exigências coloridas, genérico),
+    da menos vida para a mais e, empatando, do menos genérico para o mais.
+    """
+    alternativas = []
+    for com_mana in product((True, False), repeat=len(custo.phyrexian)):
+        vida = 2 * com_mana.count(False)
+        phyrexian = [cores for cores, pago in zip(custo.phyrexian, com_mana) if pago]
+        for com_cor in product((True, False), repeat=len(custo.bifurcados)):
+            bifurcados = [cores for (cores, _), pago in zip(custo.bifurcados, com_cor) if pago]
+            generico = custo.generico + sum(n for (_, n), pago in zip(custo.bifurcados, com_cor) if not pago)
+            alternativas.append((vida, custo.simbolos + tuple(bifurcados + phyrexian), generico))
+    # sort é estável: dentro de um empate, a ordem do product já põe as cores primeiro
+    alternativas.sort(key=lambda a: (a[0], a[2]))
+    return tuple(alternativas)
+
+
+@lru_cache(maxsize=16384)
+def _castavel_memorizado(custo: CustoAnalisado, reserva: tuple, assinatura: tuple, vida: int) -> bool:
+    terrenos = [_TerrenoVirtual(cores) for cores in assinatura]
+    return ManaManager.resolver(custo, dict(reserva), terrenos, vida).viavel
@@ -1,6 +1,7 @@
 from typing import Tuple
 from APP.domain.models.match_model import MatchModel
 from APP.domain.models.card_model import CardModel
+from APP.domain.services.mana_manager import ManaManager
 
 class RuleEngine:
     @staticmethod
@@ -24,9 +25,11 @@ class RuleEngine:
         return True, "Jogada permitida."
 
     @staticmethod
-    def validar_conjuracao(match: MatchModel, player_id: str, card: CardModel) -> Tuple[bool, str]:
+    def validar_conjuracao(match: MatchModel, player_id: str, card: CardModel, com_terrenos: bool = False) -> Tuple[bool, str]:
         """
-        [VERSÃO A4] Regra: Verifica se o jogador possui as CORES de mana exatas na pool.
+        [VERSÃO A4] Regra: Verifica se a mana da pool paga o custo da carta.
+        :param com_terrenos: Conta também a mana em potencial dos terrenos desvirados
+                             (sem virá-los): é o que destaca as cartas jogáveis na mão.
         """
         player = match.players[player_id]
 
@@ -37,31 +40,14 @@ class RuleEngine:
         if match.phase not in ["PRINCIPAL 1", "PRINCIPAL 2"]:
             return False, f"Fora da Fase Principal (Atual: {match.phase})."
 
-        # 2. Checagem de Custo de Mana Específico (Passo 1 da A4)
-        # Requisito da carta (ex: {"W": 1, "B": 1, "Generic": 1})
-        custo_requisito = getattr(card, 'mana_cost_map', {})
-        # Pool atual do jogador (ex: {"W": 1, "R": 5})
-        pool_simulada = player.mana_pool.copy()
-
-        # A) Validar Manas Coloridas primeiro
-        for cor, qtd_necessaria in custo_requisito.items():
-            if cor == "Generic":
-                continue # Deixamos para o final
-            
-            qtd_na_pool = pool_simulada.get(cor, 0)
-            if qtd_na_pool < qtd_necessaria:
-                return False, f"Falta mana {cor}! Você tem {qtd_na_pool} e precisa de {qtd_necessaria}."
-            
-            # Removemos da pool simulada para saber o que sobra para o custo genérico
-            pool_simulada[cor] -= qtd_necessaria
-
-        # B) Validar Mana Genérica (Custo numérico)
-        # Pode ser pago por qualquer cor que sobrou na pool
-        custo_generico = custo_requisito.get("Generic", 0)
-        total_restante = sum(pool_simulada.values())
-
-        if total_restante < custo_generico:
-            return False, f"Mana genérica insuficiente! Sobrou {total_restante} e precisa de {custo_generico}."
+        # 2. Checagem de Custo: a reserva cobre todos os símbolos? (coloridos,
+        # híbridos, phyrexianos e genéricos, pelo solucionador do ManaManager)
+        if com_terrenos:
+            if not ManaManager.castavel(player, card):
+                return False, f"Nem virando todos os terrenos dá para pagar {card.mana_cost or 'o custo'}."
+        elif not ManaManager.pode_pagar(player, card, usar_terrenos=False):
+            total = sum(player.mana_pool.values())
+            return False, f"Mana insuficiente! Sua reserva ({total}) não paga {card.mana_cost or 'o custo'}."
 
         return True, "Mana disponível!"
 
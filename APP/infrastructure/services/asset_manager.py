@@ -1,14 +1,125 @@
 import pygame
+from collections import OrderedDict
 from pathlib import Path
+from APP.core.settings import IMAGE_CACHE_MB, IMAGE_VARIANT_CACHE_MB
+
+class CacheSuperficies:
+    """
+    Cache LRU de Surfaces com teto de bytes.
+    As menos usadas saem da RAM primeiro, exceto as chaves fixadas.
+    """
+
+    def __init__(self, limite_mb: int):
+        self.limite_bytes = int(limite_mb * 1024 * 1024)
+
+        # {chave: Surface} em ordem de uso (a mais recente no fim)
+        self.itens = OrderedDict()
+        self._tamanhos = {}
+        self.bytes_em_uso = 0
+        self.fixados = set()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, chave):
+        return chave in self.itens
+
+    def __len__(self):
+        return len(self.itens)
+
+    @staticmethod
+    def medir_surface(surface) -> int:
+        """Bytes reais de uma Surface decodificada (linha com padding x altura)."""
+        return surface.get_pitch() * surface.get_height()
+
+    def obter(self, chave):
+        """Devolve a Surface (marcando como usada agora) ou None, contando acerto/falta."""
+        surface = self.itens.get(chave)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.itens.move_to_end(chave)
+        return surface
+
+    def guardar(self, chave, surface):
+        self.remover(chave)
+        tamanho = self.medir_surface(surface)
+        self.itens[chave] = surface
+        self._tamanhos[chave] = tamanho
+        self.bytes_em_uso += tamanho
+        self._liberar_excesso()
+
+    def remover(self, chave):
+        self.itens.pop(chave, None)
+        self.bytes_em_uso -= self._tamanhos.pop(chave, 0)
+
+    def _liberar_excesso(self):
+        """Descarta os itens menos usados até caber no teto. Fixados nunca saem."""
+        if self.bytes_em_uso <= self.limite_bytes:
+            return
+        for chave in list(self.itens):
+            if self.bytes_em_uso <= self.limite_bytes:
+                break
+            if chave in self.fixados:
+                continue
+            self.remover(chave)
+            self.evictions += 1
+
+    def definir_limite(self, limite_mb: int):
+        """Ajusta o teto de RAM em tempo de execução (descarta o excesso na hora)."""
+        self.limite_bytes = int(limite_mb * 1024 * 1024)
+        self._liberar_excesso()
+
+    def definir_fixados(self, chaves):
+        self.fixados = {c for c in chaves if c}
+        self._liberar_excesso()
+
+    def estatisticas(self) -> dict:
+        """Contadores do cache para diagnóstico (acertos, faltas, descartes e RAM)."""
+        consultas = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "taxa_acerto": self.hits / consultas if consultas else 0.0,
+            "itens": len(self.itens),
+            "fixados": len(self.fixados),
+            "bytes": self.bytes_em_uso,
+            "limite_bytes": self.limite_bytes
+        }
+
+    def limpar(self):
+        self.itens.clear()
+        self._tamanhos.clear()
+        self.fixados.clear()
+        self.bytes_em_uso = 0
+
 
 class AssetManager:
-    def __init__(self, base_assets="assets/cards"):
+    # As variantes são arredondadas para múltiplos deste passo (em pixels),
+    # assim tamanhos quase iguais reaproveitam a mesma Surface escalada
+    PASSO_TAMANHO = 2
+
+    # Camada preta semitransparente das cartas bloqueadas
+    ALPHA_ESCURECIDA = 160
+
+    def __init__(self, base_assets="assets/cards", limite_mb: int = IMAGE_CACHE_MB,
+                 limite_variantes_mb: int = IMAGE_VARIANT_CACHE_MB):
         """
         Gestor central de mídia para o simulador.
         Focado em carregar caminhos diretos vindos do banco de dados (JSON).
+        Guarda as imagens originais (com fixação das cartas visíveis) e as
+        variantes prontas para desenhar (escaladas, viradas, escurecidas).
         """
         self.base_assets = Path(base_assets)
-        self.image_cache = {}
+        self.image_cache = CacheSuperficies(limite_mb)
+        self.variant_cache = CacheSuperficies(limite_variantes_mb)
+
+        # Caminhos já avisados como ausentes: as cartas tentam de novo
+        # periodicamente (a arte pode chegar do download) sem repetir o log
+        self._ausentes_avisados = set()
 
     def get_card_image(self, local_path: str):
         """
@@ -18,27 +129,103 @@ class AssetManager:
             return None
 
         # 1. Verifica se a imagem já está no cache (RAM) para economizar CPU
-        if local_path in self.image_cache:
-            return self.image_cache[local_path]
-            
+        img_surface = self.image_cache.obter(local_path)
+        if img_surface is not None:
+            return img_surface
+
         # 2. Se não estiver no cache, tenta carregar do HD
         # O Path garante que funcione tanto no Windows quanto no Linux
         caminho_img = Path(local_path)
-        
+
         if caminho_img.exists():
             try:
                 # convert_alpha() é vital: aumenta o FPS e aceita transparência
                 img_surface = pygame.image.load(str(caminho_img)).convert_alpha()
-                self.image_cache[local_path] = img_surface
+                self.image_cache.guardar(local_path, img_surface)
+                self._ausentes_avisados.discard(local_path)
                 return img_surface
             except Exception as e:
                 print(f"[ERRO ASSET] Falha técnica ao ler {caminho_img}: {e}")
-        else:
-            # Se cair aqui, o arquivo não está onde o JSON diz que está
+        elif local_path not in self._ausentes_avisados:
+            # Se cair aqui, o arquivo não está onde o JSON diz que está (ou ainda não foi baixado)
+            self._ausentes_avisados.add(local_path)
             print(f"[DEBUG ASSET] Arquivo não encontrado no caminho do JSON: {local_path}")
-        
+
         return None
 
+    def get_card_variant(self, local_path: str, w: int, h: int, rotacao: int = 0, escurecida: bool = False):
+        """
+        Devolve a imagem da carta já pronta para o blit: escalada para (w, h),
+        girada (ex: -90 para virada) e/ou escurecida (carta bloqueada).
+        Cada variante é produzida uma única vez por processo e compartilhada
+        por todos os CardUI da mesma carta.
+        """
+        if not local_path:
+            return None
+
+        w, h = self.arredondar_tamanho(w, h)
+        chave = (local_path, w, h, rotacao, escurecida)
+        variante = self.variant_cache.obter(chave)
+        if variante is not None:
+            return variante
+
+        # Monta a partir da variante "mais simples" anterior (também cacheada)
+        if escurecida:
+            base = self.get_card_variant(local_path, w, h, rotacao, False)
+            if base is None:
+                return None
+            variante = base.copy()
+            filtro_escuro = pygame.Surface(variante.get_size(), pygame.SRCALPHA)
+            filtro_escuro.fill((0, 0, 0, self.ALPHA_ESCURECIDA))
+            variante.blit(filtro_escuro, (0, 0))
+        elif rotacao:
+            base = self.get_card_variant(local_path, w, h, 0, False)
+            if base is None:
+                return None
+            variante = pygame.transform.rotate(base, rotacao)
+        else:
+            img_bruta = self.get_card_image(local_path)
+            if img_bruta is None:
+                return None
+            variante = pygame.transform.smoothscale(img_bruta, (w, h))
+
+        self.variant_cache.guardar(chave, variante)
+        return variante
+
+    @classmethod
+    def arredondar_tamanho(cls, w: int, h: int):
+        """Agrupa tamanhos próximos no mesmo balde (nunca menor que 1 passo)."""
+        passo = cls.PASSO_TAMANHO
+        return (max(passo, int(round(w / passo)) * passo),
+                max(passo, int(round(h / passo)) * passo))
+
+    # =========================================================
+    # ORÇAMENTO DE MEMÓRIA E DIAGNÓSTICO
+    # =========================================================
+    def definir_limite(self, limite_mb: int):
+        """Ajusta o teto de RAM das imagens originais."""
+        self.image_cache.definir_limite(limite_mb)
+
+    def fixar(self, local_path: str):
+        if local_path:
+            self.image_cache.fixados.add(local_path)
+
+    def soltar(self, local_path: str):
+        self.image_cache.fixados.discard(local_path)
+        self.image_cache._liberar_excesso()
+
+    def definir_fixados(self, caminhos):
+        """Troca o conjunto de imagens fixadas pelas cartas que estão na tela agora."""
+        self.image_cache.definir_fixados(caminhos)
+
+    def estatisticas(self) -> dict:
+        """Contadores dos dois caches (originais e variantes)."""
+        return {
+            "imagens": self.image_cache.estatisticas(),
+            "variantes": self.variant_cache.estatisticas()
+        }
+
     def limpar_cache(self):
         """Libera a memória RAM, limpando as superfícies carregadas."""
-        self.image_cache.clear()
\ No newline at end of file
+        self.image_cache.limpar()
+        self.variant_cache.limpar()
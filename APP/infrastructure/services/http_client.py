@@ -0,0 +1,77 @@
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+
+# Respostas que valem uma nova tentativa (limite de taxa e falhas do servidor)
+STATUS_RETENTAVEIS = {429, 500, 502, 503, 504}
+
+class LimitadorTaxa:
+    """
+    Balde de fichas compartilhado pelas threads que falam com o mesmo servidor.
+    Permite rajadas curtas de até 'capacidade' pedidos e, na média,
+    no máximo 'taxa' pedidos por segundo.
+    """
+
+    def __init__(self, taxa: float = 10.0, capacidade: int = 10):
+        self.taxa = taxa
+        self.capacidade = capacidade
+        self._fichas = float(capacidade)
+        self._ultimo = time.monotonic()
+        self._lock = threading.Lock()
+
+    def aguardar(self):
+        while True:
+            with self._lock:
+                agora = time.monotonic()
+                self._fichas = min(self.capacidade, self._fichas + (agora - self._ultimo) * self.taxa)
+                self._ultimo = agora
+                if self._fichas >= 1:
+                    self._fichas -= 1
+                    return
+                espera = (1 - self._fichas) / self.taxa
+            time.sleep(espera)
+
+
+def criar_sessao(conexoes: int, user_agent: str = 'MTK-Simulador/1.0'):
+    """Session com pool de conexões do tamanho do número de threads que vão usá-la."""
+    sessao = requests.Session()
+    sessao.headers.update({'User-Agent': user_agent})
+    adaptador = HTTPAdapter(pool_connections=conexoes, pool_maxsize=conexoes)
+    sessao.mount("https://", adaptador)
+    sessao.mount("http://", adaptador)
+    return sessao
+
+
+def requisitar(sessao, metodo: str, url: str, limitador: LimitadorTaxa = None,
+               tentativas: int = 4, espera_base: float = 0.5, **kwargs):
+    """
+    Faz a requisição respeitando o limitador e repete com espera exponencial
+    (+ um pouco de aleatoriedade) em 429/5xx e quedas de conexão.
+    Um 'Retry-After' do servidor tem prioridade sobre a espera calculada.
+    :return: A última Response recebida (o chamador confere o status).
+    :raises requests.RequestException: Se a conexão falhar em todas as tentativas.
+    """
+    for tentativa in range(tentativas):
+        if limitador:
+            limitador.aguardar()
+
+        ultima = tentativa == tentativas - 1
+        try:
+            resp = sessao.request(metodo, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if ultima:
+                raise
+            resp = None
+
+        if resp is not None and (resp.status_code not in STATUS_RETENTAVEIS or ultima):
+            return resp
+
+        espera = espera_base * (2 ** tentativa) + random.uniform(0, espera_base)
+        if resp is not None:
+            retry_after = resp.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                espera = float(retry_after)
+            resp.close()
+        time.sleep(espera)
@@ -1,17 +1,177 @@
-import requests
 import json
-import time
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from APP.infrastructure.storage.card_index import CardIndex
+from .http_client import LimitadorTaxa, criar_sessao, requisitar
 
 class ImageDownloader:
-    def __init__(self, base_assets="assets/cards", base_data="data/cards"):
+    # Tamanho dos blocos gravados durante o download da arte
+    TAMANHO_CHUNK = 64 * 1024
+
+    def __init__(self, base_assets="assets/cards", base_data="data/cards",
+                 workers: int = 8, requisicoes_por_segundo: float = 10.0, sessao=None):
         """
         Inicializa o gerenciador com separação ESTRITA: 
         Mídia EXCLUSIVAMENTE para 'assets', Dados EXCLUSIVAMENTE para 'data'.
+
+        Os downloads usam uma única requests.Session (conexões reaproveitadas)
+        e um limitador de taxa compartilhado entre as threads do lote.
+        :param sessao: Session já configurada (ex: apontando para um servidor local de teste).
         """
         self.base_img_path = Path(base_assets)
         self.base_data_path = Path(base_data)
+        self.indice = CardIndex.para(self.base_data_path)
+        self._lock_indice = threading.Lock()
+
+        self.workers = max(1, workers)
+        self.limitador = LimitadorTaxa(requisicoes_por_segundo, capacidade=self.workers)
+        self.sessao = sessao or criar_sessao(self.workers)
+
+    def garantir_lote(self, cartas, ao_progredir=None):
+        """
+        Baixa as artes e salva os JSONs de várias cartas em paralelo.
+        :param ao_progredir: Callback (concluidas, total, nome_carta) chamado a cada carta pronta.
+        :return: Resultados de garantir_imagem_e_dados na mesma ordem das cartas.
+        """
+        cartas = list(cartas)
+        resultados = [None] * len(cartas)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="download") as pool:
+            futuros = {pool.submit(self.garantir_imagem_e_dados, carta): i for i, carta in enumerate(cartas)}
+            for concluidas, futuro in enumerate(as_completed(futuros), start=1):
+                i = futuros[futuro]
+                try:
+                    resultados[i] = futuro.result()
+                except Exception as e:
+                    print(f"[ERRO IMG] Falha ao preparar {cartas[i].get('name', 'unk_card')}: {e}")
+                if ao_progredir:
+                    ao_progredir(concluidas, len(cartas), cartas[i].get('name', 'Desconhecido'))
+        return resultados
+
+    # =========================================================
+    # DOWNLOAD SEGURO (.part + Range + verificação + rename atômico)
+    # =========================================================
+    def _baixar_imagem(self, url, destino: Path) -> bool:
+        """
+        Baixa para '<arquivo>.part', retomando de onde parou com HTTP Range,
+        confere tamanho e decodificação e só então renomeia para o destino.
+        :return: True se o destino agora tem uma imagem válida.
+        """
+        parcial = destino.with_name(destino.name + ".part")
+        ja_baixado = parcial.stat().st_size if parcial.exists() else 0
+        headers = {"Range": f"bytes={ja_baixado}-"} if ja_baixado else {}
+
+        # Respeito ao limite da API da Scryfall (429/5xx são repetidos com espera)
+        resp = requisitar(self.sessao, "GET", url, self.limitador, headers=headers, stream=True, timeout=10)
+        with resp:
+            if resp.status_code == 416 and ja_baixado:
+                # O .part já tinha tudo: a queda foi entre o download e o rename
+                tamanho_esperado = ja_baixado
+            elif resp.status_code in (200, 206):
+                if resp.status_code == 200:
+                    ja_baixado = 0  # Servidor ignorou o Range: recomeça do zero
+                tamanho_esperado = self._tamanho_total(resp, ja_baixado)
+                with open(parcial, 'ab' if ja_baixado else 'wb') as f:
+                    for chunk in resp.iter_content(self.TAMANHO_CHUNK):
+                        f.write(chunk)
+            else:
+                print(f"[ERRO IMG] HTTP {resp.status_code} ao baixar {destino.name}")
+                return False
+
+        tamanho = parcial.stat().st_size
+        if tamanho_esperado is not None and tamanho < tamanho_esperado:
+            # Conexão caiu no meio: o .part fica para ser retomado na próxima vez
+            print(f"[AVISO IMG] Download incompleto de {destino.name} ({tamanho}/{tamanho_esperado} bytes).")
+            return False
+
+        if (tamanho_esperado is not None and tamanho > tamanho_esperado) or not self.imagem_valida(parcial):
+            print(f"[ERRO IMG] Arquivo inválido para {destino.name}, descartando.")
+            parcial.unlink(missing_ok=True)
+            return False
+
+        os.replace(parcial, destino)
+        return True
+
+    @staticmethod
+    def _tamanho_total(resp, inicio: int):
+        """Tamanho do arquivo inteiro segundo Content-Range / Content-Length (None se o servidor não disser)."""
+        faixa = resp.headers.get("Content-Range", "")
+        if "/" in faixa and not faixa.endswith("/*"):
+            return int(faixa.rsplit("/", 1)[1])
+        comprimento = resp.headers.get("Content-Length")
+        return inicio + int(comprimento) if comprimento and comprimento.isdigit() else None
+
+    @staticmethod
+    def imagem_valida(caminho) -> bool:
+        """Confere se o arquivo é uma imagem inteira (JPEG com marcador de fim e decodificável)."""
+        # pygame só é carregado aqui: o simulador headless importa este módulo sem abrir janela
+        import pygame
+
+        caminho = Path(caminho)
+        try:
+            with open(caminho, 'rb') as f:
+                inicio = f.read(2)
+                if not inicio:
+                    return False
+                if inicio == b"\xff\xd8":
+                    # JPEG cortado ainda decodifica (com cinza no fim); o EOI denuncia
+                    f.seek(max(0, caminho.stat().st_size - 1024))
+                    if b"\xff\xd9" not in f.read():
+                        return False
+            pygame.image.load(str(caminho))
+            return True
+        except Exception:
+            return False
+
+    def reparar_cache(self, ao_progredir=None) -> dict:
+        """
+        Varre assets/cards atrás de artes corrompidas ou truncadas, apaga-as
+        e baixa de novo a partir do JSON da carta (que guarda a image_url).
+        :return: {"verificadas", "corrompidas", "recuperadas", "sem_origem"}
+        """
+        relatorio = {"verificadas": 0, "corrompidas": 0, "recuperadas": 0, "sem_origem": []}
+        fila = []
+
+        for caminho in sorted(self.base_img_path.glob("*/*.jpg")):
+            relatorio["verificadas"] += 1
+            if self.imagem_valida(caminho):
+                continue
+
+            relatorio["corrompidas"] += 1
+            caminho.unlink(missing_ok=True)
+
+            carta = self._dados_da_imagem(caminho)
+            if carta and carta.get("image_url"):
+                fila.append(carta)
+            else:
+                relatorio["sem_origem"].append(caminho.as_posix())
+
+        if fila:
+            print(f"[REPARO] {len(fila)} artes corrompidas voltaram para a fila de download.")
+            for carta, resultado in zip(fila, self.garantir_lote(fila, ao_progredir)):
+                if resultado and Path(resultado["ref_image"]).exists():
+                    relatorio["recuperadas"] += 1
+        return relatorio
+
+    def _dados_da_imagem(self, caminho_imagem: Path):
+        """JSON da carta dona da arte: mesma categoria/nome em data/cards, ou pelo índice."""
+        caminho_json = self.base_data_path / caminho_imagem.parent.name / f"{caminho_imagem.stem}.json"
+        if not caminho_json.exists():
+            caminho_json = self.indice.obter(caminho_imagem.stem)
+        if not caminho_json:
+            return None
+        try:
+            with open(caminho_json, 'r', encoding='utf-8') as f:
+                carta = json.load(f)
+        except Exception as e:
+            print(f"[ERRO JSON] Falha ao ler {caminho_json}: {e}")
+            return None
+        # A arte volta para a mesma pasta de onde saiu
+        carta["categoria"] = caminho_imagem.parent.name
+        return carta
 
     def garantir_imagem_e_dados(self, carta_data):
         """
@@ -42,16 +202,13 @@ class ImageDownloader:
         caminho_img_final = caminho_imagem.as_posix() # Formata com barras seguras (/)
 
         if url and not caminho_imagem.exists():
+            # O .jpg final só existe depois de baixado por inteiro e verificado
             try:
-                headers = {'User-Agent': 'MTK-Simulador/1.0'}
-                time.sleep(0.1) # Respeito ao limite da API da Scryfall
-                resp = requests.get(url, headers=headers, stream=True, timeout=10)
-                if resp.status_code == 200:
-                    with open(caminho_imagem, 'wb') as f:
-                        for chunk in resp.iter_content(1024):
-                            f.write(chunk)
+                baixou = self._baixar_imagem(url, caminho_imagem)
             except Exception as e:
                 print(f"[ERRO IMG] Falha ao baixar arte de {nome_limpo}: {e}")
+                baixou = False
+            if not baixou:
                 caminho_img_final = url # Fallback de segurança para a URL da web
         elif not url:
             caminho_img_final = "" # Sem imagem disponível
@@ -71,6 +228,11 @@ class ImageDownloader:
             except Exception as e:
                 print(f"[ERRO JSON] Falha ao salvar dados de {nome_limpo}: {e}")
 
+        # Mantém o índice de nomes em dia (o CardRepository não precisa varrer as pastas)
+        if caminho_json.exists():
+            with self._lock_indice:
+                self.indice.registrar(carta_data.get("name", "unk_card"), caminho_json)
+
         # Retorna as referências limpas para o DeckModel
         return {
             "name": carta_data["name"],
@@ -1,33 +1,180 @@
 # APP/infrastructure/services/scryfall_service.py
 
-import requests
-import time
+import gzip
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from APP.infrastructure.storage.response_cache import CacheRespostas
+from .http_client import LimitadorTaxa, criar_sessao, requisitar
+
+# Campos que o simulador precisa; cartas locais sem eles são buscadas de novo na API
+CAMPOS_SIMULADOR = ("type_line", "mana_cost", "cmc", "produced_mana", "color_identity")
+
+# Objetos do bulk data que não são cartas jogáveis
+LAYOUTS_IGNORADOS = {"token", "double_faced_token", "emblem", "art_series"}
+
+_SEPARADORES = re.compile(r"[\s,]*")
+
+def ler_bulk_json(caminho, tamanho_bloco: int = 1 << 20):
+    """
+    Percorre o array JSON de um arquivo de bulk data da Scryfall (centenas de MB)
+    devolvendo um objeto por vez, lendo o arquivo em blocos: a memória usada é
+    a de um bloco + uma carta, nunca a do arquivo inteiro. Aceita '.json.gz'.
+    """
+    decodificador = json.JSONDecoder()
+    abrir = gzip.open if str(caminho).endswith(".gz") else open
+
+    with abrir(caminho, 'rt', encoding='utf-8') as f:
+        buffer = f.read(tamanho_bloco)
+        pos = _SEPARADORES.match(buffer).end()
+        if buffer[pos:pos + 1] != "[":
+            raise ValueError("O arquivo de bulk data deve ser um array JSON.")
+        pos += 1
+
+        while True:
+            # Pula vírgulas e espaços entre os objetos
+            pos = _SEPARADORES.match(buffer, pos).end()
+            if buffer[pos:pos + 1] == "]":
+                return
+
+            try:
+                if pos == len(buffer):
+                    raise json.JSONDecodeError("Fim do bloco", buffer, pos)
+                objeto, pos = decodificador.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Objeto cortado no fim do bloco: descarta o que já foi lido e traz mais
+                bloco = f.read(tamanho_bloco)
+                if not bloco:
+                    raise ValueError("Bulk data terminou antes do ']'.")
+                buffer = buffer[pos:] + bloco
+                pos = 0
+                continue
+
+            yield objeto
+
 
 class ScryfallService:
-    def __init__(self):
+    # Máximo de identificadores aceitos por chamada do /cards/collection
+    TAMANHO_LOTE = 75
+
+    def __init__(self, card_repo=None, cache: CacheRespostas = None, sessao=None,
+                 workers: int = 4, requisicoes_por_segundo: float = 8.0):
+        """
+        :param card_repo: CardRepository opcional; quando presente, as cartas já
+                          no acervo local (ex: importadas do bulk data) não vão para a API.
+        :param cache: Cache em disco das respostas (padrão: data/cache/scryfall.jsonl).
+        :param sessao: Session já configurada (ex: apontando para um servidor local de teste).
+
+        Uma única Session com pool de conexões; os lotes vão em paralelo sob
+        o limitador de taxa (a Scryfall pede no máximo ~10 requisições/s).
+        """
         self.base_url = "https://api.scryfall.com"
         self.headers = {'User-Agent': 'MTK-Simulador/1.0 (Machete-Dev)'}
+        self.card_repo = card_repo
+        self.cache = cache if cache is not None else CacheRespostas()
 
-    def buscar_lote_cartas(self, lista_nomes):
+        self.workers = max(1, workers)
+        self.limitador = LimitadorTaxa(requisicoes_por_segundo, capacidade=self.workers)
+        self.sessao = sessao or criar_sessao(self.workers, self.headers['User-Agent'])
+
+    def buscar_lote_cartas(self, lista_nomes, ao_progredir=None):
+        """
+        Resolve uma lista de nomes: acervo local -> cache em disco -> API.
+        Só os nomes desconhecidos viram chamadas, em lotes de 75 enviados em paralelo.
+        :param ao_progredir: Callback (lotes_concluidos, total_lotes) a cada lote da API.
+        :return: Dados formatados das cartas encontradas, na ordem pedida.
+        """
         if not lista_nomes: return []
+        nomes = list(dict.fromkeys(n.strip() for n in lista_nomes if n.strip()))
+
+        encontrados = self._buscar_locais(nomes)
+        for nome in nomes:
+            if nome not in encontrados:
+                cru = self.cache.obter(nome)
+                if cru is not None:
+                    encontrados[nome] = self._formatar_dados(cru)
+
+        faltando = [n for n in nomes if n not in encontrados]
+        lotes = [faltando[i:i + self.TAMANHO_LOTE] for i in range(0, len(faltando), self.TAMANHO_LOTE)]
+        if lotes:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(lotes)), thread_name_prefix="scryfall") as pool:
+                futuros = [pool.submit(self._buscar_colecao, lote) for lote in lotes]
+                for concluidos, futuro in enumerate(as_completed(futuros), start=1):
+                    respostas = futuro.result()
+                    self.cache.salvar_varios(respostas)
+                    for nome, cru in respostas.items():
+                        encontrados[nome] = self._formatar_dados(cru)
+                    if ao_progredir:
+                        ao_progredir(concluidos, len(lotes))
+
+        # Grafias diferentes da mesma carta viram uma entrada só
+        cartas, vistos = [], set()
+        for nome in nomes:
+            carta = encontrados.get(nome)
+            if carta and carta.get("name") not in vistos:
+                vistos.add(carta.get("name"))
+                cartas.append(carta)
+        return cartas
+
+    def _buscar_colecao(self, lote) -> dict:
+        """Um POST no /cards/collection: {nome_pedido: carta_crua} das encontradas."""
         url = f"{self.base_url}/cards/collection"
-        identificadores = [{"name": n.strip()} for n in lista_nomes if n.strip()]
-        payload = {"identifiers": identificadores}
+        payload = {"identifiers": [{"name": n} for n in lote]}
         try:
-            resp = requests.post(url, json=payload, headers=self.headers, timeout=10)
-            if resp.status_code == 200:
-                resultado = resp.json()
-                return [self._formatar_dados(carta) for carta in resultado.get('data', []) if carta.get('object') != 'error']
+            resp = requisitar(self.sessao, "POST", url, self.limitador, json=payload, timeout=10)
+            if resp.status_code != 200:
+                print(f"[ERRO BATCH] HTTP {resp.status_code} no /cards/collection")
+                return {}
+            resultado = resp.json()
         except Exception as e:
             print(f"[ERRO BATCH] Falha na conexão: {e}")
-        return []
+            return {}
+
+        # A resposta não diz qual identificador gerou cada carta: casa pelo nome
+        # completo e pelos nomes das faces ("Delver of Secrets" -> "Delver of Secrets // Insectile Aberration")
+        por_chave = {}
+        for carta in resultado.get('data', []):
+            if carta.get('object') == 'error':
+                continue
+            nomes_carta = [carta.get("name", "")] + [f.get("name", "") for f in carta.get("card_faces") or []]
+            for nome_carta in nomes_carta:
+                por_chave.setdefault(CacheRespostas.chave(nome_carta), carta)
+
+        respostas = {}
+        for nome in lote:
+            carta = por_chave.get(CacheRespostas.chave(nome))
+            if carta is not None:
+                respostas[nome] = carta
+        return respostas
+
+    def _buscar_locais(self, nomes) -> dict:
+        """{nome: dados} das cartas do acervo local que já têm tudo o que o simulador usa."""
+        if self.card_repo is None:
+            return {}
+        try:
+            encontrados = self.card_repo.buscar_cartas_locais(nomes)
+        except Exception as e:
+            print(f"[AVISO SCRYFALL] Acervo local indisponível: {e}")
+            return {}
+        return {
+            nome: dados for nome, dados in encontrados.items()
+            if all(campo in dados for campo in CAMPOS_SIMULADOR)
+            # Planeswalkers gravados antes de a lealdade ser importada também voltam para a API
+            and ("loyalty" in dados or "planeswalker" not in (dados.get("type_line") or "").lower())
+        }
 
     def buscar_carta(self, nome_input):
-        url_named = f"{self.base_url}/cards/named?exact={nome_input}"
+        cru = self.cache.obter(nome_input)
+        if cru is not None:
+            return self._formatar_dados(cru)
+
+        url_named = f"{self.base_url}/cards/named"
         try:
-            resp = requests.get(url_named, headers=self.headers, timeout=5)
+            resp = requisitar(self.sessao, "GET", url_named, self.limitador, params={"exact": nome_input}, timeout=5)
             if resp.status_code == 200:
-                return self._formatar_dados(resp.json())
+                cru = resp.json()
+                self.cache.salvar(nome_input, cru)
+                return self._formatar_dados(cru)
         except Exception as e:
             print(f"[ERRO API] {nome_input}: {e}")
         return None
@@ -47,9 +194,12 @@ class ScryfallService:
     def _formatar_dados(self, data):
         if not data: return None
         
+        # Cartas de duas faces guardam imagem, custo e P/T na primeira face
+        primeira_face = (data.get("card_faces") or [{}])[0]
+
         img_url = data.get("image_uris", {}).get("normal")
         if not img_url and "card_faces" in data:
-            img_url = data["card_faces"][0].get("image_uris", {}).get("normal")
+            img_url = primeira_face.get("image_uris", {}).get("normal")
 
         type_line = data.get("type_line", "")
         
@@ -59,9 +209,39 @@ class ScryfallService:
             "printed_name": data.get("printed_name", data.get("name")),
             "type_line": type_line,
             "categoria": self._determinar_categoria(type_line), # Classificação Automática
-            "mana_cost": data.get("mana_cost", ""),
-            "colors": data.get("colors", []),
+            "mana_cost": data.get("mana_cost", primeira_face.get("mana_cost", "")),
+            "cmc": data.get("cmc", 0),
+            "colors": data.get("colors", primeira_face.get("colors", [])),
+            "color_identity": data.get("color_identity", []),
+            "produced_mana": data.get("produced_mana", []),
+            "power": data.get("power", primeira_face.get("power")),
+            "toughness": data.get("toughness", primeira_face.get("toughness")),
+            "loyalty": data.get("loyalty", primeira_face.get("loyalty")),
             "image_url": img_url, 
-            "oracle_text": data.get("oracle_text", ""),
+            "oracle_text": data.get("oracle_text", primeira_face.get("oracle_text", "")),
             "rarity": data.get("rarity", "common")
-        }
\ No newline at end of file
+        }
+
+    # =========================================================
+    # IMPORTAÇÃO OFFLINE (Bulk data da Scryfall)
+    # =========================================================
+    def importar_bulk(self, caminho_arquivo, card_store, ao_progredir=None) -> int:
+        """
+        Importa um arquivo de bulk data (ex: 'oracle-cards-*.json') para o CardStore
+        em streaming, gravando em lotes. Reimportar só atualiza as cartas (upsert).
+        :param ao_progredir: Callback (objetos_lidos) chamado a cada lote lido do arquivo.
+        :return: Quantidade de cartas gravadas.
+        """
+        def cartas():
+            for lidas, carta in enumerate(ler_bulk_json(caminho_arquivo), start=1):
+                if carta.get("object") != "card" or carta.get("layout") in LAYOUTS_IGNORADOS:
+                    continue
+                if carta.get("lang", "en") != "en":
+                    continue
+                if ao_progredir and lidas % card_store.TAMANHO_LOTE == 0:
+                    ao_progredir(lidas)
+                yield self._formatar_dados(carta)
+
+        total = card_store.salvar_lote(cartas())
+        print(f"[SCRYFALL] Bulk data importado: {total} cartas gravadas no acervo local.")
+        return total
@@ -0,0 +1,94 @@
+import hashlib
+import queue
+import threading
+import pygame
+from pathlib import Path
+
+class ThumbnailLoader:
+    """
+    Miniaturas das capas da galeria, produzidas fora da thread de desenho.
+
+    Uma thread de fundo lê a miniatura já salva em disco (ou gera a partir da
+    arte completa e salva para as próximas vezes) e devolve a Surface numa fila.
+    A tela só faz o convert_alpha() (precisa da thread principal) e o blit;
+    enquanto a miniatura não chega, desenha um placeholder.
+    """
+
+    def __init__(self, tamanho=(160, 220), pasta_miniaturas="assets/thumbs"):
+        self.tamanho = tuple(tamanho)
+        self.pasta = Path(pasta_miniaturas)
+
+        self.prontas = {}          # {caminho_original: Surface convertida}
+        self._pendentes = set()    # Já pedidos e ainda não entregues (uma falha sai daqui e pode ser pedida de novo)
+        self._avisados = set()     # Capas cuja falha já foi impressa (usado só pela thread de fundo)
+        self._pedidos = queue.Queue()
+        self._entregues = queue.Queue()
+
+        self._thread = threading.Thread(target=self._trabalhar, daemon=True)
+        self._thread.start()
+
+    # =========================================================
+    # LADO DA TELA (Thread principal)
+    # =========================================================
+    def solicitar(self, caminhos):
+        """Enfileira as capas na ordem pedida (página atual antes da próxima)."""
+        for caminho in caminhos:
+            if caminho and caminho not in self.prontas and caminho not in self._pendentes:
+                self._pendentes.add(caminho)
+                self._pedidos.put(caminho)
+
+    def obter(self, caminho):
+        """Surface pronta para blit, ou None enquanto a miniatura não chegou."""
+        self._receber_prontas()
+        return self.prontas.get(caminho)
+
+    def _receber_prontas(self):
+        while True:
+            try:
+                caminho, surface = self._entregues.get_nowait()
+            except queue.Empty:
+                return
+            self._pendentes.discard(caminho)
+            if surface is not None:
+                # convert_alpha só é permitido na thread que tem o display
+                self.prontas[caminho] = surface.convert_alpha()
+
+    # =========================================================
+    # LADO DA THREAD DE FUNDO
+    # =========================================================
+    def _trabalhar(self):
+        while True:
+            caminho = self._pedidos.get()
+            try:
+                surface = self._carregar_miniatura(caminho)
+            except Exception as e:
+                # A tela pede de novo as capas que falharam: o aviso sai uma vez por capa
+                if caminho not in self._avisados:
+                    self._avisados.add(caminho)
+                    print(f"[AVISO THUMB] Falha ao preparar capa {caminho}: {e}")
+                surface = None
+            self._entregues.put((caminho, surface))
+
+    def caminho_miniatura(self, caminho_original) -> Path:
+        """Nome estável por arte + tamanho (a mesma capa serve para vários decks)."""
+        chave = f"{Path(caminho_original).as_posix()}|{self.tamanho[0]}x{self.tamanho[1]}"
+        resumo = hashlib.sha1(chave.encode("utf-8")).hexdigest()[:16]
+        return self.pasta / f"{resumo}_{self.tamanho[0]}x{self.tamanho[1]}.png"
+
+    def _carregar_miniatura(self, caminho_original):
+        original = Path(caminho_original)
+        if not original.exists():
+            return None
+
+        miniatura = self.caminho_miniatura(original)
+        if miniatura.exists() and miniatura.stat().st_mtime >= original.stat().st_mtime:
+            return pygame.image.load(str(miniatura))
+
+        # Primeira vez desta arte: reduz a imagem grande e guarda no disco
+        surface = pygame.transform.smoothscale(pygame.image.load(str(original)), self.tamanho)
+        try:
+            self.pasta.mkdir(parents=True, exist_ok=True)
+            pygame.image.save(surface, str(miniatura))
+        except Exception as e:
+            print(f"[AVISO THUMB] Não foi possível salvar a miniatura de {original.name}: {e}")
+        return surface
@@ -0,0 +1,122 @@
+import re
+from pathlib import Path
+
+class CardIndex:
+    """
+    Índice persistente nome -> JSON da carta (data/cards/<categoria>/<nome>.json).
+    Substitui a varredura de todas as pastas de categoria por uma consulta
+    de dicionário. Fica em disco como um log de linhas "nome<TAB>caminho":
+    cada carta nova é só uma linha anexada (a última linha de um nome vence).
+    """
+
+    ARQUIVO = ".indice_nomes.tsv"
+
+    # Um índice por pasta de dados, compartilhado pelo processo inteiro
+    # (CardRepository e ImageDownloader enxergam as mesmas entradas)
+    _instancias = {}
+
+    def __init__(self, base_data_path):
+        self.base_data_path = Path(base_data_path)
+        self.caminho_indice = self.base_data_path / self.ARQUIVO
+        self._entradas = None  # Carregado no primeiro uso
+
+    @classmethod
+    def para(cls, base_data_path="data/cards") -> "CardIndex":
+        chave = Path(base_data_path).resolve()
+        indice = cls._instancias.get(chave)
+        if indice is None:
+            indice = cls._instancias[chave] = cls(base_data_path)
+        return indice
+
+    @staticmethod
+    def normalizar(nome_bruto: str) -> str:
+        """Mesma limpeza do ImageDownloader: 'Krenko, Mob Boss' -> 'krenko_mob_boss'."""
+        nome_min = nome_bruto.strip().lower().replace(" ", "_")
+        return re.sub(r'[^a-z0-9_]', '', nome_min)
+
+    # =========================================================
+    # CONSULTA E ATUALIZAÇÃO
+    # =========================================================
+    def obter(self, nome_carta: str):
+        """Retorna o Path do JSON da carta, ou None se ela não está no acervo."""
+        entradas = self._carregar()
+        relativo = entradas.get(self.normalizar(nome_carta))
+        if relativo is None:
+            return None
+
+        caminho = self.base_data_path / relativo
+        if not caminho.exists():
+            # Arquivo apagado/movido por fora: o índice se corrige sozinho
+            self.reconstruir()
+            relativo = self._entradas.get(self.normalizar(nome_carta))
+            return self.base_data_path / relativo if relativo else None
+        return caminho
+
+    def registrar(self, nome_carta: str, caminho_json):
+        """Anota (ou atualiza) o local do JSON de uma carta recém-salva."""
+        entradas = self._carregar()
+        nome = self.normalizar(nome_carta)
+        relativo = self._relativo(caminho_json)
+        if entradas.get(nome) == relativo:
+            return
+
+        entradas[nome] = relativo
+        try:
+            self.caminho_indice.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.caminho_indice, 'a', encoding='utf-8') as f:
+                f.write(f"{nome}\t{relativo}\n")
+        except Exception as e:
+            print(f"[ERRO INDICE] Falha ao anotar {nome}: {e}")
+
+    def reconstruir(self):
+        """Varre as pastas de categoria uma única vez e regrava o índice compactado."""
+        entradas = {}
+        if self.base_data_path.exists():
+            for caminho in self.base_data_path.glob("*/*.json"):
+                entradas[caminho.stem] = self._relativo(caminho)
+        self._entradas = entradas
+
+        try:
+            self.base_data_path.mkdir(parents=True, exist_ok=True)
+            linhas = "".join(f"{nome}\t{rel}\n" for nome, rel in entradas.items())
+            with open(self.caminho_indice, 'w', encoding='utf-8') as f:
+                f.write(linhas)
+        except Exception as e:
+            print(f"[ERRO INDICE] Falha ao gravar o índice: {e}")
+        return entradas
+
+    def __len__(self):
+        return len(self._carregar())
+
+    # =========================================================
+    # INTERNOS
+    # =========================================================
+    def _carregar(self) -> dict:
+        if self._entradas is not None:
+            return self._entradas
+
+        if not self.caminho_indice.exists():
+            # Primeiro uso: monta a partir das pastas que já existem
+            return self.reconstruir()
+
+        entradas = {}
+        try:
+            with open(self.caminho_indice, 'r', encoding='utf-8') as f:
+                for linha in f:
+                    nome, sep, relativo = linha.rstrip("\n").partition("\t")
+                    if sep:
+                        entradas[nome] = relativo
+        except Exception as e:
+            print(f"[ERRO INDICE] Índice ilegível, reconstruindo: {e}")
+            return self.reconstruir()
+
+        self._entradas = entradas
+        return entradas
+
+    def _relativo(self, caminho_json) -> str:
+        """Guarda o caminho relativo à pasta de dados, sempre com barras '/'."""
+        caminho = Path(caminho_json)
+        try:
+            return caminho.relative_to(self.base_data_path).as_posix()
+        except ValueError:
+            return caminho.as_posix()
@@ -1,51 +1,81 @@
 import os
-import re
 from pathlib import Path
 from .file_manager import FileManager
+from .card_index import CardIndex
+from .card_store import CardStore
 
 class CardRepository:
-    def __init__(self):
+    def __init__(self, store: CardStore = None):
         """
         Gerencia o banco de dados local de cartas individuais.
-        Busca e salva metadados de forma dinâmica na infraestrutura de pastas.
+        O acervo vive no SQLite (CardStore); a árvore antiga de JSONs em
+        data/cards é migrada uma vez e continua como reserva de leitura.
         """
         self.base_data_path = Path("data/cards")
         self.base_img_path = Path("assets/cards")
+        self._store = store
+
+        # Índice nome -> JSON (montado no primeiro uso e mantido a cada salvamento)
+        self.indice = CardIndex.para(self.base_data_path)
+
+    @property
+    def store(self) -> CardStore:
+        """Abre o banco só quando alguém realmente consulta (e migra os JSONs antigos)."""
+        if self._store is None:
+            self._store = CardStore()
+            self._store.migrar_json(self.base_data_path)
+        return self._store
 
     def _limpar_nome(self, nome_bruto):
         """
         Padroniza o nome do arquivo EXATAMENTE como o ImageDownloader faz.
         Garante que o repositório consiga achar o arquivo que o downloader criou.
         """
-        nome_min = nome_bruto.strip().lower().replace(" ", "_")
-        return re.sub(r'[^a-z0-9_]', '', nome_min)
+        return CardIndex.normalizar(nome_bruto)
 
     def buscar_carta_local(self, nome_carta):
         """
-        Procura o JSON da carta varrendo TODAS as pastas de categorias.
+        Procura a carta no SQLite (uma consulta pelo nome normalizado).
         Retorna os dados se encontrar, ou None se precisar baixar.
         """
-        nome_arquivo = f"{self._limpar_nome(nome_carta)}.json"
-        
-        # Previne erro se a pasta data/cards ainda não existir
-        if not self.base_data_path.exists():
+        dados = self.store.obter(nome_carta)
+        if dados is None:
+            dados = self._buscar_json_legado(nome_carta)
+        return dados
+
+    def buscar_cartas_locais(self, nomes) -> dict:
+        """Resolve uma lista inteira (ex: um deck) com uma consulta: {nome: dados}."""
+        encontrados = self.store.obter_varios(nomes)
+        for nome in nomes:
+            if nome not in encontrados:
+                dados = self._buscar_json_legado(nome)
+                if dados is not None:
+                    encontrados[nome] = dados
+        return encontrados
+
+    def _buscar_json_legado(self, nome_carta):
+        """JSON salvo depois da migração (ex: pelo ImageDownloader): lê e passa para o banco."""
+        caminho = self.indice.obter(nome_carta)
+        if caminho is None:
             return None
-            
-        # Busca Dinâmica: Olha em todas as pastas que existirem no HD
-        for pasta_categoria in self.base_data_path.iterdir():
-            if pasta_categoria.is_dir():
-                caminho = pasta_categoria / nome_arquivo
-                if caminho.exists():
-                    return FileManager.carregar_json(caminho)
-                    
-        return None
+        dados = FileManager.carregar_json(caminho)
+        if dados:
+            dados.setdefault("categoria", caminho.parent.name)
+            self.store.salvar(dados)
+        return dados
 
     def salvar_carta_local(self, card_data, categoria="Outros"):
         """Salva os metadados da carta para uso futuro (Offline)."""
-        nome_limpo = self._limpar_nome(card_data.get("name", "unk_card"))
-        caminho = self.base_data_path / categoria / f"{nome_limpo}.json"
-        
-        return FileManager.salvar_json(caminho, card_data)
+        try:
+            self.store.salvar({**card_data, "categoria": card_data.get("categoria") or categoria})
+            return True
+        except Exception as e:
+            print(f"[ERRO CARD_REPO] Falha ao salvar {card_data.get('name')}: {e}")
+            return False
+
+    def salvar_cartas_locais(self, cartas) -> int:
+        """Grava um lote de cartas em transações agrupadas (importações grandes)."""
+        return self.store.salvar_lote(cartas)
 
     def obter_caminho_imagem(self, nome_carta, categoria="Outros"):
         """Retorna o caminho do asset .jpg local com formatação multiplataforma."""
@@ -0,0 +1,267 @@
+import itertools
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from APP.domain.models.card_definition import calcular_tipos
+from .card_index import CardIndex
+
+# Ordem canônica das cores na identidade ("BR", nunca "RB")
+ORDEM_CORES = "WUBRG"
+
+class CardStore:
+    """
+    Acervo local de cartas em um único arquivo SQLite (data/cards.db).
+    Uma linha por carta, indexada pelo nome normalizado e por identidade de
+    cor + tipo; o dicionário completo da carta fica na coluna 'dados' (JSON).
+    Montar um deck offline vira UMA consulta em vez de centenas de arquivos.
+    """
+
+    TAMANHO_LOTE = 1000
+
+    # O SQLite limita o número de '?' por consulta; os IN (...) vão em fatias
+    FATIA_CONSULTA = 500
+
+    def __init__(self, caminho_db="data/cards.db"):
+        self.caminho_db = Path(caminho_db)
+        self.caminho_db.parent.mkdir(parents=True, exist_ok=True)
+
+        # As telas de cadastro salvam em threads; o lock serializa o uso da conexão
+        self._lock = threading.RLock()
+        self.conexao = sqlite3.connect(str(self.caminho_db), check_same_thread=False)
+        self._configurar()
+
+    def _configurar(self):
+        with self._lock, self.conexao:
+            # WAL: leituras não bloqueiam a escrita (importação em segundo plano)
+            self.conexao.execute("PRAGMA journal_mode=WAL")
+            self.conexao.execute("PRAGMA synchronous=NORMAL")
+            self.conexao.executescript("""
+                CREATE TABLE IF NOT EXISTS cartas (
+                    id INTEGER PRIMARY KEY,
+                    nome_normalizado TEXT NOT NULL UNIQUE,
+                    name TEXT NOT NULL,
+                    categoria TEXT NOT NULL DEFAULT '',
+                    type_line TEXT NOT NULL DEFAULT '',
+                    tipos INTEGER NOT NULL DEFAULT 0,
+                    identidade TEXT NOT NULL DEFAULT '',
+                    cmc REAL NOT NULL DEFAULT 0,
+                    dados TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_cartas_identidade_tipos ON cartas(identidade, tipos);
+                CREATE INDEX IF NOT EXISTS idx_cartas_categoria ON cartas(categoria);
+                CREATE TABLE IF NOT EXISTS meta (
+                    chave TEXT PRIMARY KEY,
+                    valor TEXT
+                );
+            """)
+
+    def fechar(self):
+        with self._lock:
+            self.conexao.close()
+
+    # =========================================================
+    # NORMALIZAÇÃO
+    # =========================================================
+    @staticmethod
+    def normalizar_nome(nome: str) -> str:
+        """Mesma chave usada nos nomes de arquivo ('Krenko, Mob Boss' -> 'krenko_mob_boss')."""
+        return CardIndex.normalizar(nome or "")
+
+    @staticmethod
+    def normalizar_identidade(cores) -> str:
+        """['R', 'B'] -> 'BR' (ordem WUBRG, sem repetição)."""
+        cores = set(cores or ())
+        return "".join(c for c in ORDEM_CORES if c in cores)
+
+    def _linha(self, dados: dict) -> tuple:
+        nome = dados.get("name") or "unk_card"
+        return (
+            self.normalizar_nome(nome),
+            nome,
+            dados.get("categoria") or "",
+            dados.get("type_line") or "",
+            calcular_tipos(dados.get("type_line"), dados.get("categoria")),
+            self.normalizar_identidade(dados.get("color_identity")),
+            float(dados.get("cmc") or 0.0),
+            json.dumps(dados, ensure_ascii=False, separators=(",", ":"))
+        )
+
+    # =========================================================
+    # ESCRITA (Upsert: o id de uma carta nunca muda)
+    # =========================================================
+    _SQL_UPSERT = """
+        INSERT INTO cartas (nome_normalizado, name, categoria, type_line, tipos, identidade, cmc, dados)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(nome_normalizado) DO UPDATE SET
+            name = excluded.name,
+            categoria = excluded.categoria,
+            type_line = excluded.type_line,
+            tipos = excluded.tipos,
+            identidade = excluded.identidade,
+            cmc = excluded.cmc,
+            dados = excluded.dados
+    """
+
+    def salvar(self, dados: dict) -> int:
+        """Insere ou atualiza uma carta e devolve o seu id."""
+        linha = self._linha(dados)
+        with self._lock, self.conexao:
+            self.conexao.execute(self._SQL_UPSERT, linha)
+            cursor = self.conexao.execute("SELECT id FROM cartas WHERE nome_normalizado = ?", (linha[0],))
+            return cursor.fetchone()[0]
+
+    def salvar_lote(self, cartas, tamanho_lote: int = TAMANHO_LOTE) -> int:
+        """
+        Grava muitas cartas com executemany, uma transação por lote.
+        Aceita qualquer iterável (inclusive geradores), sem montar tudo na RAM.
+        :return: Quantidade de cartas gravadas.
+        """
+        total = 0
+        iterador = iter(cartas)
+        while True:
+            lote = [self._linha(c) for c in itertools.islice(iterador, tamanho_lote) if c]
+            if not lote:
+                break
+            with self._lock, self.conexao:
+                self.conexao.executemany(self._SQL_UPSERT, lote)
+            total += len(lote)
+        return total
+
+    # =========================================================
+    # LEITURA
+    # =========================================================
+    def obter(self, nome: str):
+        """Dados completos de uma carta pelo nome (qualquer grafia), ou None."""
+        with self._lock:
+            linha = self.conexao.execute(
+                "SELECT dados FROM cartas WHERE nome_normalizado = ?", (self.normalizar_nome(nome),)
+            ).fetchone()
+        return json.loads(linha[0]) if linha else None
+
+    def obter_varios(self, nomes) -> dict:
+        """
+        Busca várias cartas de uma vez (ex: o deck inteiro).
+        :return: {nome_pedido: dados} apenas para as cartas encontradas.
+        """
+        return {nome: json.loads(dados) for nome, dados in self._consultar_por_nomes("dados", nomes).items()}
+
+    def obter_ids(self, nomes) -> dict:
+        """{nome_pedido: id} das cartas encontradas (referência estável para os decks)."""
+        return self._consultar_por_nomes("id", nomes)
+
+    def _consultar_por_nomes(self, coluna: str, nomes) -> dict:
+        """Lê uma coluna para vários nomes com IN (...) em fatias: {nome_pedido: valor}."""
+        pedidos = {}
+        for nome in nomes:
+            pedidos.setdefault(self.normalizar_nome(nome), []).append(nome)
+
+        valores = {}
+        chaves = list(pedidos)
+        for i in range(0, len(chaves), self.FATIA_CONSULTA):
+            fatia = chaves[i:i + self.FATIA_CONSULTA]
+            marcadores = ",".join("?" * len(fatia))
+            with self._lock:
+                linhas = self.conexao.execute(
+                    f"SELECT nome_normalizado, {coluna} FROM cartas WHERE nome_normalizado IN ({marcadores})", fatia
+                ).fetchall()
+            for chave, valor in linhas:
+                for nome in pedidos[chave]:
+                    valores[nome] = valor
+        return valores
+
+    def obter_por_ids(self, ids) -> dict:
+        """{id: dados} numa consulta só (usado pelos decks binários)."""
+        ids = list(set(ids))
+        encontrados = {}
+        for i in range(0, len(ids), self.FATIA_CONSULTA):
+            fatia = ids[i:i + self.FATIA_CONSULTA]
+            marcadores = ",".join("?" * len(fatia))
+            with self._lock:
+                linhas = self.conexao.execute(
+                    f"SELECT id, dados FROM cartas WHERE id IN ({marcadores})", fatia
+                ).fetchall()
+            for card_id, dados in linhas:
+                encontrados[card_id] = json.loads(dados)
+        return encontrados
+
+    def buscar(self, identidade_comandante=None, tipos: int = 0, limite: int = None) -> list:
+        """
+        Cartas legais para um comandante (identidade contida na dele) e/ou de
+        um tipo (máscara TIPO_* do CardDefinition). Usa o índice (identidade, tipos):
+        a identidade do comandante vira a lista dos seus subconjuntos (no máximo 32).
+        """
+        condicoes, parametros = [], []
+
+        if identidade_comandante is not None:
+            cores = self.normalizar_identidade(identidade_comandante)
+            subconjuntos = [
+                "".join(combo)
+                for n in range(len(cores) + 1)
+                for combo in itertools.combinations(cores, n)
+            ]
+            condicoes.append(f"identidade IN ({','.join('?' * len(subconjuntos))})")
+            parametros.extend(subconjuntos)
+
+        if tipos:
+            condicoes.append("(tipos & ?) != 0")
+            parametros.append(tipos)
+
+        sql = "SELECT dados FROM cartas"
+        if condicoes:
+            sql += " WHERE " + " AND ".join(condicoes)
+        sql += " ORDER BY name"
+        if limite:
+            sql += " LIMIT ?"
+            parametros.append(limite)
+
+        with self._lock:
+            linhas = self.conexao.execute(sql, parametros).fetchall()
+        return [json.loads(d) for (d,) in linhas]
+
+    def contar(self) -> int:
+        with self._lock:
+            return self.conexao.execute("SELECT COUNT(*) FROM cartas").fetchone()[0]
+
+    # =========================================================
+    # MIGRAÇÃO (data/cards/<categoria>/<nome>.json -> SQLite)
+    # =========================================================
+    def _meta(self, chave: str):
+        with self._lock:
+            linha = self.conexao.execute("SELECT valor FROM meta WHERE chave = ?", (chave,)).fetchone()
+        return linha[0] if linha else None
+
+    def _definir_meta(self, chave: str, valor: str):
+        with self._lock, self.conexao:
+            self.conexao.execute(
+                "INSERT INTO meta (chave, valor) VALUES (?, ?) ON CONFLICT(chave) DO UPDATE SET valor = excluded.valor",
+                (chave, valor)
+            )
+
+    def migrar_json(self, base_data_path="data/cards", forcar: bool = False) -> int:
+        """
+        Importa a árvore antiga de JSONs uma única vez (fica marcado na tabela meta).
+        :return: Quantidade de cartas importadas (0 se a migração já tinha sido feita).
+        """
+        if not forcar and self._meta("migracao_json"):
+            return 0
+
+        base = Path(base_data_path)
+
+        def ler_cartas():
+            for caminho in sorted(base.glob("*/*.json")):
+                try:
+                    with open(caminho, 'r', encoding='utf-8') as f:
+                        dados = json.load(f)
+                except Exception as e:
+                    print(f"[AVISO CARD_STORE] Ignorando {caminho}: {e}")
+                    continue
+                if isinstance(dados, dict) and dados.get("name"):
+                    # A pasta de origem é a categoria quando o JSON não a tem
+                    dados.setdefault("categoria", caminho.parent.name)
+                    yield dados
+
+        total = self.salvar_lote(ler_cartas()) if base.exists() else 0
+        self._definir_meta("migracao_json", str(total))
+        print(f"[CARD_STORE] Migração concluída: {total} cartas importadas de {base}.")
+        return total
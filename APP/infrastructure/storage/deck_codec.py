@@ -0,0 +1,131 @@
+import json
+import struct
+from collections.abc import Sequence
+
+class DeckCodec:
+    """
+    Formato binário compacto dos decks (.mtkd).
+
+    Layout (little-endian):
+        cabeçalho    : 'MTKD' | versão u8 | reservado u8 | nº de entradas u16
+                       | tamanho do meta u32 | tamanho das sobrescritas u32 | tamanho dos nomes u32
+        meta         : JSON UTF-8 com os campos do deck que não são cartas (nome, comandante...)
+        entradas     : tabela de (id da carta no CardStore u32, quantidade u16)
+        sobrescritas : JSON UTF-8 {posição: campos} com o que o deck diz de cada carta
+                       e o acervo não diz igual (produced_mana, ref_image...)
+        nomes        : nome normalizado de cada entrada, um por linha (UTF-8)
+
+    Os ids são do CardStore que gravou o deck; os nomes permitem conferir, na
+    leitura, que o acervo atual ainda tem as mesmas cartas nesses ids (um
+    cards.db recriado numera tudo de novo).
+
+    Um deck de 100 cartas em dia com o acervo cabe em poucos KB (mais os
+    caminhos das artes) e é lido de uma vez.
+    """
+
+    MAGICO = b"MTKD"
+    VERSAO = 3
+    CABECALHO = struct.Struct("<4sBBHIII")
+    ENTRADA = struct.Struct("<IH")
+
+    @classmethod
+    def codificar(cls, deck_data: dict, entradas, nomes, sobrescritas: dict = None) -> bytes:
+        """
+        :param deck_data: O dicionário do deck (a chave 'cards' é ignorada).
+        :param entradas: Lista de (card_id, quantidade) na ordem do deck.
+        :param nomes: Nome normalizado da carta de cada entrada (mesma ordem).
+        :param sobrescritas: {posição da entrada: campos do deck que vencem o acervo}.
+        """
+        if len(nomes) != len(entradas):
+            raise ValueError("Cada entrada do deck precisa do nome da sua carta.")
+
+        meta = {k: v for k, v in deck_data.items() if k != "cards"}
+        meta_bytes = cls._json(meta)
+        sobrescritas_bytes = cls._json({str(i): campos for i, campos in (sobrescritas or {}).items() if campos})
+        nomes_bytes = "\n".join(nomes).encode("utf-8")
+
+        partes = [
+            cls.CABECALHO.pack(cls.MAGICO, cls.VERSAO, 0, len(entradas),
+                               len(meta_bytes), len(sobrescritas_bytes), len(nomes_bytes)),
+            meta_bytes
+        ]
+        partes.extend(cls.ENTRADA.pack(card_id, quantidade) for card_id, quantidade in entradas)
+        partes.append(sobrescritas_bytes)
+        partes.append(nomes_bytes)
+        return b"".join(partes)
+
+    @classmethod
+    def decodificar(cls, conteudo: bytes):
+        """
+        :return: (meta, [(card_id, quantidade), ...], [nome normalizado, ...], {posição: campos})
+        :raises ValueError: Se o arquivo não for um deck .mtkd válido (ou for de uma versão antiga).
+        """
+        if len(conteudo) < cls.CABECALHO.size:
+            raise ValueError("Arquivo de deck truncado.")
+
+        magico, versao, _, qtd_entradas, tam_meta, tam_sobrescritas, tam_nomes = cls.CABECALHO.unpack_from(conteudo)
+        if magico != cls.MAGICO or versao != cls.VERSAO:
+            raise ValueError("Formato de deck desconhecido.")
+
+        inicio_tabela = cls.CABECALHO.size + tam_meta
+        fim_tabela = inicio_tabela + qtd_entradas * cls.ENTRADA.size
+        fim_sobrescritas = fim_tabela + tam_sobrescritas
+        if len(conteudo) < fim_sobrescritas + tam_nomes:
+            raise ValueError("Arquivo de deck truncado.")
+
+        meta = json.loads(conteudo[cls.CABECALHO.size:inicio_tabela].decode("utf-8"))
+        entradas = list(cls.ENTRADA.iter_unpack(conteudo[inicio_tabela:fim_tabela]))
+        sobrescritas = json.loads(conteudo[fim_tabela:fim_sobrescritas].decode("utf-8"))
+        nomes = conteudo[fim_sobrescritas:fim_sobrescritas + tam_nomes].decode("utf-8").split("\n") if qtd_entradas else []
+        if len(nomes) != qtd_entradas:
+            raise ValueError("Arquivo de deck sem o nome de alguma carta.")
+        return meta, entradas, nomes, {int(i): campos for i, campos in sobrescritas.items()}
+
+    @staticmethod
+    def _json(dados) -> bytes:
+        return json.dumps(dados, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class CartasPreguicosas(Sequence):
+    """
+    Lista de cartas de um deck binário, resolvida no CardStore numa consulta
+    só para o deck inteiro (na primeira leitura, ou antes com resolver()).
+    Cada item sai no mesmo formato do JSON do deck: dados da carta, os campos
+    que o deck sobrescreve e 'quantity'.
+    """
+
+    def __init__(self, entradas, card_store, nomes=None, sobrescritas: dict = None):
+        self.entradas = entradas
+        self.nomes = nomes
+        self.sobrescritas = sobrescritas or {}
+        self._store = card_store
+        self._cartas = None
+
+    def resolver(self):
+        """
+        :raises KeyError: Se o acervo não tiver mais alguma das cartas do deck.
+        :raises ValueError: Se um id do deck agora aponta para outra carta (acervo recriado).
+        """
+        if self._cartas is None:
+            acervo = self._store.obter_por_ids([card_id for card_id, _ in self.entradas])
+            faltando = [card_id for card_id, _ in self.entradas if card_id not in acervo]
+            if faltando:
+                raise KeyError(f"Cartas do deck ausentes no CardStore (ids {faltando}).")
+            if self.nomes is not None:
+                trocadas = [
+                    nome for nome, (card_id, _) in zip(self.nomes, self.entradas)
+                    if self._store.normalizar_nome(acervo[card_id].get("name")) != nome
+                ]
+                if trocadas:
+                    raise ValueError(f"Ids do deck apontam para outras cartas no CardStore ({trocadas}).")
+            self._cartas = [
+                {**acervo[card_id], **self.sobrescritas.get(i, {}), "quantity": quantidade, "card_id": card_id}
+                for i, (card_id, quantidade) in enumerate(self.entradas)
+            ]
+        return self._cartas
+
+    def __getitem__(self, index):
+        return self.resolver()[index]
+
+    def __len__(self):
+        return len(self.entradas)
@@ -1,15 +1,34 @@
 import json
 import re
 from pathlib import Path
+from .card_repository import CardRepository
+from .deck_codec import DeckCodec, CartasPreguicosas
 
 class DeckRepository:
-    def __init__(self, pasta_decks="data/decks"):
+    def __init__(self, pasta_decks="data/decks", card_repo: CardRepository = None):
         """
         Repositório especializado apenas na persistência física de decks.
         Focado em ler e escrever arquivos JSON na pasta data/decks.
         """
         self.path_decks = Path(pasta_decks)
         self.path_decks.mkdir(parents=True, exist_ok=True)
+        self.card_repo = card_repo
+
+        # Grava também o binário compacto (.mtkd) sempre que um deck é salvo
+        self.converter_ao_salvar = True
+
+        # Índice da galeria: {nome_arquivo: {name, commander, cover_image_path, total_cards, mtime, tamanho}}
+        self.path_galeria = self.path_decks / ".galeria.json"
+        self._galeria = None
+
+    def _nome_arquivo(self, nome_deck):
+        nome_bruto = nome_deck.strip().lower().replace(" ", "_")
+        return re.sub(r'[^a-z0-9_]', '', nome_bruto)
+
+    def _repo_cartas(self) -> CardRepository:
+        if self.card_repo is None:
+            self.card_repo = CardRepository()
+        return self.card_repo
 
     def salvar_deck_físico(self, deck_data):
         """
@@ -25,27 +44,102 @@ class DeckRepository:
             
             with open(caminho_final, 'w', encoding='utf-8') as f:
                 json.dump(deck_data, f, ensure_ascii=False, indent=4)
-            return True
         except Exception as e:
             print(f"[ERRO DECK_REPO] Falha ao salvar arquivo físico: {e}")
             return False
 
+        if self.converter_ao_salvar:
+            # O JSON continua sendo a fonte; sem o binário, a leitura só fica mais lenta
+            self.converter_para_binario(deck_data)
+        return True
+
     def carregar_deck_completo(self, nome_deck):
-        """Lê um deck específico do disco pelo seu nome exato."""
+        """
+        Lê um deck específico do disco pelo seu nome exato.
+        Prefere o binário compacto (.mtkd) quando ele está em dia com o JSON;
+        senão lê o JSON. Só lê: o binário é gravado por salvar_deck_físico.
+        """
+        nome_limpo = self._nome_arquivo(nome_deck)
+        caminho = self.path_decks / f"{nome_limpo}.json"
+        caminho_bin = self.path_decks / f"{nome_limpo}.mtkd"
+
+        if caminho_bin.exists() and (not caminho.exists() or caminho_bin.stat().st_mtime >= caminho.stat().st_mtime):
+            deck = self._carregar_binario(caminho_bin)
+            if deck is not None:
+                return deck
+
         try:
-            nome_bruto = nome_deck.strip().lower().replace(" ", "_")
-            nome_limpo = re.sub(r'[^a-z0-9_]', '', nome_bruto)
-            caminho = self.path_decks / f"{nome_limpo}.json"
-            
             if caminho.exists():
                 with open(caminho, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    deck = json.load(f)
             else:
                 print(f"[AVISO] Arquivo de deck não encontrado: {caminho}")
                 return None
         except Exception as e:
             print(f"[ERRO DECK_REPO] Falha ao ler arquivo físico: {e}")
             return None
+        return deck
+
+    def _carregar_binario(self, caminho_bin):
+        """
+        Uma leitura do arquivo e uma consulta ao CardStore para o deck inteiro.
+        Os ids são conferidos pelo nome aqui mesmo: se o acervo foi recriado
+        (ou perdeu cartas), devolve None e quem chamou lê o JSON.
+        """
+        try:
+            meta, entradas, nomes, sobrescritas = DeckCodec.decodificar(caminho_bin.read_bytes())
+            cartas = CartasPreguicosas(entradas, self._repo_cartas().store, nomes, sobrescritas)
+            cartas.resolver()
+        except Exception as e:
+            print(f"[AVISO DECK_REPO] Binário inválido ({caminho_bin.name}), usando o JSON: {e}")
+            return None
+        return {**meta, "cards": cartas}
+
+    def converter_para_binario(self, deck_data):
+        """
+        Grava o .mtkd do deck: garante que cada carta está no CardStore
+        (completando com o ref_json quando preciso) e guarda id + quantidade,
+        mais os campos em que o deck discorda do acervo (ex: uma entrada antiga
+        sem produced_mana). Assim o binário joga exatamente como o JSON.
+        """
+        try:
+            store = self._repo_cartas().store
+            refs = [ref for ref in deck_data.get("cards", []) if ref.get("name")]
+
+            # Cartas que o acervo ainda não conhece entram agora, com o que o deck sabe delas
+            conhecidas = store.obter_ids(ref["name"] for ref in refs)
+            novas = []
+            for ref in refs:
+                if ref["name"] not in conhecidas:
+                    dados = {**self.obter_dados_carta_individual(ref), **ref}
+                    if ref.get("ref_image"):
+                        dados.setdefault("local_image_path", ref["ref_image"])
+                    for chave in ("quantity", "ref_json", "ref_image", "card_id"):
+                        dados.pop(chave, None)
+                    novas.append(dados)
+            if novas:
+                store.salvar_lote(novas)
+                conhecidas = store.obter_ids(ref["name"] for ref in refs)
+
+            entradas = [(conhecidas[ref["name"]], int(ref.get("quantity", 1))) for ref in refs]
+            acervo = store.obter_por_ids([card_id for card_id, _ in entradas])
+            sobrescritas = {}
+            for i, (ref, (card_id, _)) in enumerate(zip(refs, entradas)):
+                dados_acervo = acervo.get(card_id, {})
+                campos = {
+                    chave: valor for chave, valor in ref.items()
+                    if chave not in ("quantity", "card_id") and dados_acervo.get(chave) != valor
+                }
+                if campos:
+                    sobrescritas[i] = campos
+
+            caminho_bin = self.path_decks / f"{self._nome_arquivo(deck_data.get('name', 'novo_deck'))}.mtkd"
+            nomes = [store.normalizar_nome(ref["name"]) for ref in refs]
+            caminho_bin.write_bytes(DeckCodec.codificar(deck_data, entradas, nomes, sobrescritas))
+            return True
+        except Exception as e:
+            print(f"[ERRO DECK_REPO] Falha ao gerar o deck binário: {e}")
+            return False
 
     def obter_dados_carta_individual(self, card_ref):
         """Lê o JSON individual de uma carta na pasta data/cards/... se existir."""
@@ -60,6 +154,94 @@ class DeckRepository:
                     print(f"Erro ao ler JSON da carta: {e}")
         return card_ref # Fallback: devolve os dados básicos se falhar
 
+    def obter_dados_cartas(self, card_refs):
+        """
+        Completa todas as cartas do deck de uma vez pelo acervo SQLite
+        (uma consulta). O ref_json de cada carta continua como reserva.
+        """
+        # Cartas de um deck binário já vieram completas do CardStore
+        if isinstance(card_refs, CartasPreguicosas):
+            return list(card_refs)
+
+        acervo = self._repo_cartas().buscar_cartas_locais([ref.get("name") for ref in card_refs if ref.get("name")])
+        return [acervo.get(ref.get("name")) or self.obter_dados_carta_individual(ref) for ref in card_refs]
+
+    # =========================================================
+    # ÍNDICE DA GALERIA (Capa e contagem sem abrir cada deck)
+    # =========================================================
+    def resumos_galeria(self, nomes_decks):
+        """
+        Metadados de capa de cada deck, na mesma ordem dos nomes pedidos.
+        Só relê (e faz o parse de) um deck quando o arquivo dele mudou;
+        os outros custam um stat() e uma consulta de dicionário.
+        """
+        galeria = self._carregar_galeria()
+        mudou = False
+        resumos = []
+
+        for nome_deck in nomes_decks:
+            nome_limpo = self._nome_arquivo(nome_deck)
+            caminho = self.path_decks / f"{nome_limpo}.json"
+            try:
+                info = caminho.stat()
+            except OSError:
+                resumos.append(None)
+                continue
+
+            resumo = galeria.get(nome_limpo)
+            if not resumo or resumo.get("mtime") != info.st_mtime or resumo.get("tamanho") != info.st_size:
+                resumo = self._resumir_deck(caminho, info)
+                if resumo is None:
+                    resumos.append(None)
+                    continue
+                galeria[nome_limpo] = resumo
+                mudou = True
+            resumos.append(resumo)
+
+        if mudou:
+            try:
+                with open(self.path_galeria, 'w', encoding='utf-8') as f:
+                    json.dump(galeria, f, ensure_ascii=False, separators=(",", ":"))
+            except Exception as e:
+                print(f"[AVISO DECK_REPO] Não foi possível gravar o índice da galeria: {e}")
+        return resumos
+
+    def _carregar_galeria(self) -> dict:
+        if self._galeria is None:
+            self._galeria = {}
+            if self.path_galeria.exists():
+                try:
+                    with open(self.path_galeria, 'r', encoding='utf-8') as f:
+                        self._galeria = json.load(f)
+                except Exception as e:
+                    print(f"[AVISO DECK_REPO] Índice da galeria ilegível, recriando: {e}")
+        return self._galeria
+
+    def _resumir_deck(self, caminho, info):
+        """Faz o parse do deck uma vez e guarda só o que a galeria mostra."""
+        try:
+            with open(caminho, 'r', encoding='utf-8') as f:
+                deck = json.load(f)
+        except Exception as e:
+            print(f"Erro ao carregar capa de {caminho.stem}: {e}")
+            return None
+
+        comandante = deck.get("commander", "Desconhecido")
+        capa = ""
+        for carta in deck.get("cards", []):
+            if carta.get("name") == comandante:
+                capa = carta.get("ref_image", "")
+                break
+
+        return {
+            "name": deck.get("name", caminho.stem),
+            "commander": comandante,
+            "cover_image_path": capa,
+            "total_cards": sum(int(c.get("quantity", 1)) for c in deck.get("cards", [])),
+            "mtime": info.st_mtime,
+            "tamanho": info.st_size
+        }
+
     def listar_todos_os_arquivos_deck(self):
         """Retorna uma lista com o caminho de todos os JSONs na pasta decks."""
         return list(self.path_decks.glob("*.json"))
\ No newline at end of file
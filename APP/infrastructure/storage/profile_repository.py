@@ -1,35 +1,63 @@
+import copy
 import json
+import os
 import datetime
 from pathlib import Path
 
 class ProfileRepository:
+    # Quantas alterações o log acumula antes de ser incorporado ao profiler.json
+    LIMITE_LOG = 200
+
+    # O histórico de partidas guarda só as mais recentes
+    LIMITE_HISTORICO = 500
+
+    # Chave reservada no profiler.json: até qual alteração do log ele já incorpora.
+    # Só existe no disco; quem lê o perfil nunca a vê.
+    CHAVE_SEQ = "_seq_log"
+
     def __init__(self, caminho_padrao="data/profiles/profiler.json"):
         """
         Gerencia a persistência do perfil e o índice global de decks.
         Focado apenas em ler e escrever no profiler.json.
+
+        O perfil fica em memória e só é relido quando o arquivo muda no disco.
+        Alterações frequentes (vitórias, histórico de partidas) vão para um log
+        de linhas JSON ao lado do perfil (profiler.log), que é incorporado ao
+        profiler.json de tempos em tempos. Toda gravação do perfil é atômica:
+        escreve num temporário e só então troca pelo arquivo real.
         """
         self.path = Path(caminho_padrao)
+        self.path_log = self.path.with_suffix(".log")
         self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._perfil = None        # Perfil já com o log aplicado
+        self._assinatura = None    # (mtime_ns, tamanho) do profiler.json e do log
+        self._seq_log = 0          # Número da última alteração registrada
+        self._linhas_log = 0       # Alterações ainda fora do profiler.json
+
         self._inicializar_estrutura_se_vazio()
 
     def _inicializar_estrutura_se_vazio(self):
         """Cria o arquivo com campos vazios para forçar o primeiro acesso."""
         if not self.path.exists():
-            dados_vazios = {
-                "player_info": {
-                    "nickname": "", 
-                    "created_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "vitorias": 0
-                },
-                "decks_info": {
-                    "decks": []
-                },
-                "config": {
-                    "volume": 70,
-                    "fullscreen": False
-                }
+            self.salvar_perfil(self._perfil_padrao())
+
+    @staticmethod
+    def _perfil_padrao():
+        return {
+            "player_info": {
+                "nickname": "",
+                "created_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "vitorias": 0
+            },
+            "decks_info": {
+                "decks": []
+            },
+            "config": {
+                "volume": 70,
+                "fullscreen": False
             }
-            self.salvar_perfil(dados_vazios)
+        }
 
     def inicializar_perfil_usuario(self, nickname):
         """Método chamado pelo WelcomeView/Controller para definir o nome real."""
@@ -41,48 +69,187 @@ class ProfileRepository:
         """
         Lê os dados do disco. Substitui o antigo 'carregar_perfil'.
         Possui blindagem contra corrupção de arquivo.
+        Devolve uma cópia: quem quiser alterar o perfil deve chamar salvar_perfil().
         """
-        try:
-            if self.path.exists():
-                with open(self.path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception as e:
-            print(f"[AVISO] Perfil corrompido ou ausente: {e}. Recriando padrão.")
-            self._inicializar_estrutura_se_vazio()
-            
-        # Retorna o arquivo recém-criado em caso de falha anterior
-        with open(self.path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return copy.deepcopy(self._perfil_em_memoria())
 
     def salvar_perfil(self, dados):
-        """Salva os dados de forma segura no disco."""
+        """
+        Salva os dados de forma segura no disco (já incorporando o log pendente).
+        O perfil em memória só é trocado depois que a gravação deu certo.
+        """
+        dados = copy.deepcopy(dados)
+        dados.pop(self.CHAVE_SEQ, None)
         try:
-            with open(self.path, 'w', encoding='utf-8') as f:
-                json.dump(dados, f, ensure_ascii=False, indent=4)
-            return True
+            self._escrever_atomico(self.path, {**dados, self.CHAVE_SEQ: self._seq_log})
+            self._descartar_log()
         except Exception as e:
             print(f"[ERRO PROFILE] Falha ao salvar: {e}")
             return False
 
+        self._perfil = dados
+        self._linhas_log = 0
+        self._assinatura = self._assinatura_disco()
+        return True
+
     def adicionar_referencia_deck(self, deck_data):
         """Registra os metadados de um novo deck na galeria."""
+        # Altera uma cópia: se a gravação falhar, o perfil em memória fica como estava
         perfil = self.ler_perfil()
-        
+
         # Garante que a estrutura exista antes de dar append
         if "decks_info" not in perfil:
             perfil["decks_info"] = {"decks": []}
         elif "decks" not in perfil["decks_info"]:
             perfil["decks_info"]["decks"] = []
-            
+
         novo_id = len(perfil['decks_info']['decks']) + 1
-        
+
         referencia = {
             "id": novo_id,
             "name": deck_data.get('name', 'Sem Nome'),
             "commander": deck_data.get('commander', 'Desconhecido'),
             "created_at": datetime.date.today().isoformat()
         }
-        
+
         perfil['decks_info']['decks'].append(referencia)
-        self.salvar_perfil(perfil)
-        return novo_id
\ No newline at end of file
+        if not self.salvar_perfil(perfil):
+            return None
+        return novo_id
+
+    # =========================================================
+    # ALTERAÇÕES FREQUENTES (Log incremental)
+    # =========================================================
+    def registrar_vitoria(self, quantidade: int = 1):
+        """Soma vitórias ao contador do jogador sem regravar o perfil inteiro."""
+        self._registrar({"op": "somar", "campo": ["player_info", "vitorias"], "valor": quantidade})
+
+    def registrar_partida(self, resultado: dict):
+        """
+        Anexa uma partida ao histórico (ex: deck, oponente, vencedor, turnos).
+        Se 'venceu' for verdadeiro no resultado, também conta a vitória.
+        """
+        entrada = dict(resultado)
+        entrada.setdefault("data", datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        self._registrar({"op": "anexar", "campo": ["historico_partidas"], "valor": entrada})
+        if entrada.get("venceu"):
+            self.registrar_vitoria()
+
+    def compactar(self):
+        """Incorpora o log ao profiler.json (gravação atômica) e zera o log."""
+        return self.salvar_perfil(self._perfil_em_memoria())
+
+    def _registrar(self, alteracao: dict):
+        perfil = self._perfil_em_memoria()
+
+        self._seq_log += 1
+        alteracao = {"seq": self._seq_log, **alteracao}
+        try:
+            with open(self.path_log, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(alteracao, ensure_ascii=False, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            print(f"[ERRO PROFILE] Falha ao registrar alteração: {e}")
+            self._seq_log -= 1
+            return False
+
+        self._aplicar(perfil, alteracao)
+        self._linhas_log += 1
+        self._assinatura = self._assinatura_disco()
+
+        if self._linhas_log >= self.LIMITE_LOG:
+            self.compactar()
+        return True
+
+    def _aplicar(self, perfil: dict, alteracao: dict):
+        """Reaplica uma linha do log sobre o perfil em memória."""
+        *caminho, campo = alteracao["campo"]
+        destino = perfil
+        for chave in caminho:
+            destino = destino.setdefault(chave, {})
+
+        if alteracao["op"] == "somar":
+            destino[campo] = destino.get(campo, 0) + alteracao["valor"]
+        elif alteracao["op"] == "anexar":
+            lista = destino.setdefault(campo, [])
+            lista.append(alteracao["valor"])
+            if len(lista) > self.LIMITE_HISTORICO:
+                del lista[:len(lista) - self.LIMITE_HISTORICO]
+
+    # =========================================================
+    # INTERNOS (Cache por mtime e gravação atômica)
+    # =========================================================
+    def _assinatura_disco(self):
+        def estado(caminho):
+            try:
+                st = caminho.stat()
+                return (st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                return None
+        return (estado(self.path), estado(self.path_log))
+
+    def _perfil_em_memoria(self) -> dict:
+        """Perfil atual (com o log aplicado); só relê o disco se algo mudou por fora."""
+        if self._perfil is not None and self._assinatura == self._assinatura_disco():
+            return self._perfil
+
+        perfil = self._ler_arquivo()
+        self._seq_log = perfil.pop(self.CHAVE_SEQ, 0)
+        self._linhas_log = 0
+
+        # Reaplica só o que ainda não entrou no profiler.json (a compactação
+        # pode ter sido interrompida depois de gravar o perfil e antes de zerar o log)
+        for alteracao in self._ler_log():
+            if alteracao.get("seq", 0) > self._seq_log:
+                self._aplicar(perfil, alteracao)
+                self._seq_log = alteracao["seq"]
+                self._linhas_log += 1
+
+        self._perfil = perfil
+        self._assinatura = self._assinatura_disco()
+        return perfil
+
+    def _ler_arquivo(self) -> dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[AVISO] Perfil corrompido ou ausente: {e}. Recriando padrão.")
+
+        # Guarda o arquivo ilegível para inspeção em vez de sobrescrevê-lo.
+        # O log é mantido: vitórias e partidas registradas voltam por cima do padrão.
+        if self.path.exists():
+            os.replace(self.path, self.path.with_suffix(".corrompido.json"))
+        padrao = self._perfil_padrao()
+        self._escrever_atomico(self.path, padrao)
+        return padrao
+
+    def _ler_log(self):
+        if not self.path_log.exists():
+            return []
+        alteracoes = []
+        with open(self.path_log, 'r', encoding='utf-8') as f:
+            for linha in f:
+                try:
+                    alteracoes.append(json.loads(linha))
+                except json.JSONDecodeError:
+                    # Última linha cortada por uma queda no meio da escrita
+                    continue
+        return alteracoes
+
+    def _descartar_log(self):
+        try:
+            self.path_log.unlink()
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _escrever_atomico(caminho: Path, dados):
+        """Grava num .tmp da mesma pasta, força para o disco e troca com os.replace."""
+        temporario = caminho.with_name(caminho.name + ".tmp")
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
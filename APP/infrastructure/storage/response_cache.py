@@ -0,0 +1,97 @@
+import json
+import os
+import threading
+from pathlib import Path
+from .card_index import CardIndex
+
+class CacheRespostas:
+    """
+    Cache em disco das respostas da Scryfall, por nome normalizado da carta.
+    Fica num log de linhas JSON {"chave": ..., "dados": ...}: cada carta nova
+    é uma linha anexada (a última linha de uma chave vence) e o arquivo é
+    regravado compactado quando as linhas repetidas passam das válidas.
+    Guarda o objeto cru da API, então mudanças no formatador valem para o cache.
+    """
+
+    def __init__(self, caminho="data/cache/scryfall.jsonl"):
+        self.caminho = Path(caminho)
+        self._entradas = None  # Carregado no primeiro uso
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def chave(nome: str) -> str:
+        return CardIndex.normalizar(nome or "")
+
+    # =========================================================
+    # CONSULTA E ATUALIZAÇÃO
+    # =========================================================
+    def obter(self, nome: str):
+        """Resposta crua guardada para o nome, ou None."""
+        with self._lock:
+            return self._carregar().get(self.chave(nome))
+
+    def salvar(self, nome: str, dados: dict):
+        self.salvar_varios({nome: dados})
+
+    def salvar_varios(self, respostas: dict):
+        """Anota {nome: resposta_crua} de uma vez (uma escrita para o lote inteiro)."""
+        with self._lock:
+            entradas = self._carregar()
+            linhas = []
+            for nome, dados in respostas.items():
+                chave = self.chave(nome)
+                if not chave or entradas.get(chave) == dados:
+                    continue
+                entradas[chave] = dados
+                linhas.append(json.dumps({"chave": chave, "dados": dados}, ensure_ascii=False, separators=(",", ":")))
+            if not linhas:
+                return
+
+            try:
+                self.caminho.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.caminho, 'a', encoding='utf-8') as f:
+                    f.write("\n".join(linhas) + "\n")
+            except Exception as e:
+                print(f"[ERRO CACHE] Falha ao gravar respostas da Scryfall: {e}")
+
+    def __len__(self):
+        with self._lock:
+            return len(self._carregar())
+
+    # =========================================================
+    # INTERNOS
+    # =========================================================
+    def _carregar(self) -> dict:
+        if self._entradas is not None:
+            return self._entradas
+
+        entradas, total_linhas = {}, 0
+        if self.caminho.exists():
+            try:
+                with open(self.caminho, 'r', encoding='utf-8') as f:
+                    for linha in f:
+                        try:
+                            registro = json.loads(linha)
+                        except json.JSONDecodeError:
+                            continue  # Linha cortada por uma queda no meio da escrita
+                        entradas[registro["chave"]] = registro["dados"]
+                        total_linhas += 1
+            except Exception as e:
+                print(f"[ERRO CACHE] Cache da Scryfall ilegível, começando vazio: {e}")
+                entradas = {}
+
+        self._entradas = entradas
+        if total_linhas > 2 * len(entradas):
+            self._compactar()
+        return entradas
+
+    def _compactar(self):
+        """Regrava só a última resposta de cada chave (temporário + rename)."""
+        temporario = self.caminho.with_name(self.caminho.name + ".tmp")
+        try:
+            with open(temporario, 'w', encoding='utf-8') as f:
+                for chave, dados in self._entradas.items():
+                    f.write(json.dumps({"chave": chave, "dados": dados}, ensure_ascii=False, separators=(",", ":")) + "\n")
+            os.replace(temporario, self.caminho)
+        except Exception as e:
+            print(f"[ERRO CACHE] Falha ao compactar o cache da Scryfall: {e}")
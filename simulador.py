@@ -0,0 +1,182 @@
+# simulador.py
+import argparse
+import time
+from APP.core.headless_engine import HeadlessEngine
+from APP.core.monte_carlo import MonteCarloRunner
+from APP.infrastructure.storage.profile_repository import ProfileRepository
+from APP.infrastructure.storage.card_store import CardStore
+from APP.domain.services.goldfish_simulator import GoldfishSimulator
+from APP.domain.services.bot_ai_service import BotAIService
+
+
+def comando_partida(args):
+    engine = HeadlessEngine(max_turnos=args.max_turnos, silencioso=not args.verbose)
+    deck_p1 = engine.carregar_deck(args.deck_p1)
+    deck_p2 = engine.carregar_deck(args.deck_p2) if args.deck_p2 else None
+
+    if not deck_p1 or (args.deck_p2 and not deck_p2):
+        print("[ERRO] Deck não encontrado em data/decks.")
+        return
+
+    # Cada lado em --bot decide por MCTS; os outros seguem a política gulosa
+    bots = {
+        player_id: BotAIService(tempo_por_decisao=args.tempo_bot, max_iteracoes=args.iteracoes_bot,
+                                seed=args.seed, workers=args.workers_bot)
+        for player_id in args.bot
+    }
+    for bot in bots.values():
+        bot.aquecer()
+    try:
+        resultado = engine.jogar_partida(deck_p1, deck_p2, seed=args.seed, bots=bots)
+    finally:
+        for bot in bots.values():
+            bot.encerrar()
+    vencedor = resultado.vencedor or "EMPATE"
+    print(f"[SIMULADOR] Vencedor: {vencedor} | Turnos: {resultado.turnos} | "
+          f"Vida P1: {resultado.vida_p1} | Vida P2: {resultado.vida_p2}")
+
+    if args.registrar:
+        # Vai para o log do perfil: não regrava o profiler.json a cada partida
+        ProfileRepository().registrar_partida({
+            "deck": args.deck_p1,
+            "oponente": args.deck_p2 or args.deck_p1,
+            "vencedor": resultado.vencedor,
+            "turnos": resultado.turnos,
+            "venceu": resultado.vencedor == "P1"
+        })
+
+
+def comando_monte_carlo(args):
+    engine = HeadlessEngine()
+    deck_p1 = engine.carregar_deck(args.deck_p1)
+    deck_p2 = engine.carregar_deck(args.deck_p2)
+
+    if not deck_p1 or not deck_p2:
+        print("[ERRO] Deck não encontrado em data/decks.")
+        return
+
+    runner = MonteCarloRunner(workers=args.workers, max_turnos=args.max_turnos)
+    inicio = time.perf_counter()
+    resultados = runner.executar(deck_p1, deck_p2, args.partidas, seed=args.seed)
+    duracao = time.perf_counter() - inicio
+
+    resumo = MonteCarloRunner.resumir(resultados)
+    print(f"[MONTE CARLO] {resumo['partidas']} partidas em {duracao:.2f}s "
+          f"({runner.workers} workers, {resumo['partidas'] / duracao:.0f} partidas/s)")
+    print(f"  P1 ({args.deck_p1}): {resumo['taxa_vitoria_p1']:.1%} | "
+          f"P2 ({args.deck_p2}): {resumo['taxa_vitoria_p2']:.1%} | "
+          f"Empates: {resumo['empates']} | Turnos médios: {resumo['turnos_medios']:.1f}")
+
+
+def comando_goldfish(args):
+    engine = HeadlessEngine()
+    deck = engine.carregar_deck(args.deck)
+    if not deck:
+        print("[ERRO] Deck não encontrado em data/decks.")
+        return
+
+    simulador = GoldfishSimulator(deck, seed=args.seed)
+    try:
+        relatorio = simulador.simular(
+            total_maos=args.maos, turnos=args.turnos, na_jogada=not args.na_compra,
+            terrenos_min=args.terrenos_min, terrenos_max=args.terrenos_max
+        )
+    except ValueError as e:
+        print(f"[ERRO] {e}")
+        return
+
+    print(f"[GOLDFISH] {relatorio['maos']} mãos em {relatorio['segundos']:.2f}s")
+    print("  Terrenos na mão inicial:")
+    for qtd, prob in relatorio["distribuicao_terrenos"].items():
+        print(f"    {qtd}: {prob:6.1%}")
+    print(f"  Taxa de manter ({args.terrenos_min}-{args.terrenos_max} terrenos): {relatorio['taxa_manter']:.1%}")
+    for linha in relatorio["por_turno"]:
+        print(f"  Turno {linha['turno']}: terreno na curva {linha['terreno_na_curva']:6.1%} | "
+              f"jogada na curva {linha['jogada_na_curva']:6.1%}")
+
+
+def comando_reparar_imagens(args):
+    # Importado aqui: o downloader valida as artes com pygame, que o resto do simulador não usa
+    from APP.infrastructure.services.image_downloader import ImageDownloader
+    downloader = ImageDownloader(workers=args.workers)
+    relatorio = downloader.reparar_cache()
+    print(f"[REPARO] {relatorio['verificadas']} artes verificadas | {relatorio['corrompidas']} corrompidas | "
+          f"{relatorio['recuperadas']} baixadas de novo")
+    for caminho in relatorio["sem_origem"]:
+        print(f"  Sem JSON de origem (apagada, baixe o deck de novo): {caminho}")
+
+
+def comando_importar_bulk(args):
+    # Importado aqui: só este comando fala com a Scryfall (requests)
+    from APP.infrastructure.services.scryfall_service import ScryfallService
+    store = CardStore(args.db)
+    inicio = time.perf_counter()
+    ScryfallService().importar_bulk(
+        args.arquivo, store,
+        ao_progredir=lambda lidas: print(f"  {lidas} objetos lidos...", end="\r")
+    )
+    print(f"[BULK] Acervo com {store.contar()} cartas ({time.perf_counter() - inicio:.1f}s).")
+    store.fechar()
+
+
+def inteiro_positivo(valor: str) -> int:
+    numero = int(valor)
+    if numero < 1:
+        raise argparse.ArgumentTypeError(f"precisa ser pelo menos 1 (recebido: {numero})")
+    return numero
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulador de partidas sem interface gráfica.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p_partida = sub.add_parser("partida", help="Joga uma partida entre dois decks salvos.")
+    p_partida.add_argument("deck_p1")
+    p_partida.add_argument("deck_p2", nargs="?", help="Se omitido, joga o espelho do deck_p1.")
+    p_partida.add_argument("--seed", type=int, default=None)
+    p_partida.add_argument("--max-turnos", type=int, default=40)
+    p_partida.add_argument("--verbose", action="store_true", help="Mostra os logs da mesa.")
+    p_partida.add_argument("--registrar", action="store_true", help="Anota a partida no histórico do perfil.")
+    p_partida.add_argument("--bot", action="append", choices=["P1", "P2"], default=[],
+                           help="Lado controlado pelo bot MCTS (repita para bot contra bot).")
+    p_partida.add_argument("--tempo-bot", type=float, default=0.2, help="Segundos de busca por jogada do bot.")
+    p_partida.add_argument("--iteracoes-bot", type=int, default=None,
+                           help="Teto de simulações por jogada (com --seed, torna o bot reproduzível).")
+    p_partida.add_argument("--workers-bot", type=int, default=1,
+                           help="Processos por bot, cada um com a sua árvore de busca (paralelismo na raiz).")
+    p_partida.set_defaults(func=comando_partida)
+
+    p_mc = sub.add_parser("monte-carlo", help="Joga N partidas em paralelo entre dois decks.")
+    p_mc.add_argument("deck_p1")
+    p_mc.add_argument("deck_p2")
+    p_mc.add_argument("-n", "--partidas", type=inteiro_positivo, default=10000)
+    p_mc.add_argument("--workers", type=int, default=None, help="Padrão: todos os núcleos.")
+    p_mc.add_argument("--seed", type=int, default=0)
+    p_mc.add_argument("--max-turnos", type=int, default=40)
+    p_mc.set_defaults(func=comando_monte_carlo)
+
+    p_gf = sub.add_parser("goldfish", help="Sorteia mãos iniciais e mede a consistência de mana.")
+    p_gf.add_argument("deck")
+    p_gf.add_argument("-n", "--maos", type=inteiro_positivo, default=1_000_000)
+    p_gf.add_argument("--turnos", type=inteiro_positivo, default=5)
+    p_gf.add_argument("--na-compra", action="store_true", help="Simula começando na compra.")
+    p_gf.add_argument("--terrenos-min", type=int, default=2)
+    p_gf.add_argument("--terrenos-max", type=int, default=5)
+    p_gf.add_argument("--seed", type=int, default=None)
+    p_gf.set_defaults(func=comando_goldfish)
+
+    p_rep = sub.add_parser("reparar-imagens", help="Procura artes corrompidas em assets/cards e baixa de novo.")
+    p_rep.add_argument("--workers", type=int, default=8)
+    p_rep.set_defaults(func=comando_reparar_imagens)
+
+    p_bulk = sub.add_parser("importar-bulk", help="Importa um arquivo de bulk data da Scryfall para o acervo local.")
+    p_bulk.add_argument("arquivo", help="JSON (ou .json.gz) baixado de scryfall.com/docs/api/bulk-data.")
+    p_bulk.add_argument("--db", default="data/cards.db")
+    p_bulk.set_defaults(func=comando_importar_bulk)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# Os testes importam o pacote APP direto da raiz do repositório (não há instalação)
+RAIZ = Path(__file__).resolve().parent.parent
+if str(RAIZ) not in sys.path:
+    sys.path.insert(0, str(RAIZ))
@@ -0,0 +1,176 @@
+import pytest
+
+from APP.infrastructure.storage.card_repository import CardRepository
+from APP.infrastructure.storage.card_store import CardStore
+from APP.infrastructure.storage.deck_codec import CartasPreguicosas, DeckCodec
+from APP.infrastructure.storage.deck_repository import DeckRepository
+
+
+# =========================================================
+# CODEC
+# =========================================================
+def test_codificar_e_decodificar_preservam_tudo():
+    deck = {"name": "Goblins", "commander": "Krenko, Mob Boss", "cards": [{"name": "ignorado"}]}
+    entradas = [(7, 1), (3, 30), (70000, 2)]
+    nomes = ["krenko_mob_boss", "mountain", "goblin_guide"]
+    sobrescritas = {1: {"produced_mana": ["R"], "ref_image": "assets/cards/mountain.jpg"}, 2: {}}
+
+    meta, lidas, lidos_nomes, lidas_sobrescritas = DeckCodec.decodificar(
+        DeckCodec.codificar(deck, entradas, nomes, sobrescritas)
+    )
+
+    assert meta == {"name": "Goblins", "commander": "Krenko, Mob Boss"}
+    assert lidas == entradas
+    assert lidos_nomes == nomes
+    assert lidas_sobrescritas == {1: sobrescritas[1]}
+
+
+def test_deck_vazio():
+    assert DeckCodec.decodificar(DeckCodec.codificar({"name": "Vazio"}, [], [])) == ({"name": "Vazio"}, [], [], {})
+
+
+def test_arquivo_truncado_ou_de_outra_versao_e_rejeitado():
+    conteudo = DeckCodec.codificar({"name": "X"}, [(1, 1)], ["mountain"], {0: {"ref_image": "a.jpg"}})
+
+    with pytest.raises(ValueError):
+        DeckCodec.decodificar(conteudo[:-1])
+    with pytest.raises(ValueError):
+        DeckCodec.decodificar(conteudo[:5])
+
+    # Versões antigas (sem sobrescritas ou sem nomes): o repositório volta para o JSON
+    antigo = bytearray(conteudo)
+    for versao in (1, 2):
+        antigo[4] = versao
+        with pytest.raises(ValueError):
+            DeckCodec.decodificar(bytes(antigo))
+
+
+class _StoreFalso:
+    normalizar_nome = staticmethod(CardStore.normalizar_nome)
+
+    def __init__(self, cartas):
+        self.cartas = cartas
+        self.consultas = 0
+
+    def obter_por_ids(self, ids):
+        self.consultas += 1
+        return {i: dict(self.cartas[i]) for i in ids if i in self.cartas}
+
+
+def test_cartas_preguicosas_resolvem_numa_consulta_com_sobrescritas():
+    store = _StoreFalso({1: {"name": "Mountain", "produced_mana": []}, 2: {"name": "Goblin Guide"}})
+    cartas = CartasPreguicosas([(1, 30), (2, 1)], store, ["mountain", "goblin_guide"], {0: {"produced_mana": ["R"]}})
+
+    assert len(cartas) == 2 and store.consultas == 0
+    assert cartas[0] == {"name": "Mountain", "produced_mana": ["R"], "quantity": 30, "card_id": 1}
+    assert cartas[1]["quantity"] == 1
+    assert store.consultas == 1
+
+
+def test_cartas_preguicosas_acusam_id_ausente():
+    cartas = CartasPreguicosas([(1, 1), (99, 1)], _StoreFalso({1: {"name": "Mountain"}}))
+    with pytest.raises(KeyError, match="99"):
+        cartas[0]
+
+
+def test_cartas_preguicosas_acusam_id_que_virou_outra_carta():
+    cartas = CartasPreguicosas([(1, 1)], _StoreFalso({1: {"name": "Time Walk"}}), ["goblin_guide"])
+    with pytest.raises(ValueError, match="goblin_guide"):
+        cartas.resolver()
+
+
+# =========================================================
+# REPOSITÓRIO
+# =========================================================
+def _repositorio(tmp_path, caminho_db):
+    return DeckRepository(pasta_decks=tmp_path / "decks", card_repo=CardRepository(CardStore(caminho_db)))
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    repositorio = _repositorio(tmp_path, tmp_path / "cards.db")
+    yield repositorio
+    repositorio.card_repo.store.fechar()
+
+
+def _deck():
+    return {
+        "name": "Teste Mono R",
+        "commander": "Goblin Guide",
+        "cards": [
+            {"name": "Goblin Guide", "quantity": 1, "type_line": "Creature - Goblin", "mana_cost": "{R}"},
+            {"name": "Mountain", "quantity": 30, "type_line": "Basic Land - Mountain",
+             "produced_mana": ["R"], "ref_image": "assets/cards/mountain.jpg"},
+        ]
+    }
+
+
+def _normalizar(cartas):
+    return [{k: v for k, v in c.items() if k != "card_id"} for c in cartas]
+
+
+def test_binario_joga_igual_ao_json_mesmo_com_acervo_desatualizado(repo):
+    store = repo.card_repo.store
+    # Entrada antiga no acervo: sem produced_mana e sem arte
+    store.salvar({"name": "Mountain", "type_line": "Basic Land - Mountain"})
+
+    assert repo.salvar_deck_físico(_deck())
+    assert (repo.path_decks / "teste_mono_r.mtkd").exists()
+
+    deck = repo.carregar_deck_completo("Teste Mono R")
+    assert isinstance(deck["cards"], CartasPreguicosas)
+    assert deck["commander"] == "Goblin Guide"
+
+    cartas = repo.obter_dados_cartas(deck["cards"])
+    montanha = next(c for c in cartas if c["name"] == "Mountain")
+    assert montanha["produced_mana"] == ["R"]
+    assert montanha["ref_image"] == "assets/cards/mountain.jpg"
+    assert montanha["quantity"] == 30
+
+    # Sem o binário, o JSON tem que dar as mesmas cartas
+    (repo.path_decks / "teste_mono_r.mtkd").unlink()
+    deck_json = repo.carregar_deck_completo("Teste Mono R")
+    por_nome = {c["name"]: c for c in _normalizar(cartas)}
+    for ref in deck_json["cards"]:
+        assert {k: v for k, v in ref.items() if k in por_nome[ref["name"]]} == ref
+
+
+def test_carregar_nao_grava_nada(repo):
+    repo.converter_ao_salvar = False
+    repo.salvar_deck_físico(_deck())
+    antes = sorted(p.name for p in repo.path_decks.iterdir())
+
+    assert repo.carregar_deck_completo("Teste Mono R")["name"] == "Teste Mono R"
+    assert sorted(p.name for p in repo.path_decks.iterdir()) == antes
+    assert repo.card_repo.store.contar() == 0
+
+
+def test_binario_invalido_cai_para_o_json(repo):
+    repo.salvar_deck_físico(_deck())
+    (repo.path_decks / "teste_mono_r.mtkd").write_bytes(b"MTKD\x01")
+
+    deck = repo.carregar_deck_completo("Teste Mono R")
+    assert isinstance(deck["cards"], list)
+    assert len(deck["cards"]) == 2
+
+
+def _nomes_e_quantidades(deck):
+    return sorted((c["name"], int(c.get("quantity", 1))) for c in deck["cards"])
+
+
+@pytest.mark.parametrize("outras_cartas", [["Ancestral Recall", "Time Walk"], []])
+def test_acervo_recriado_cai_para_o_json(repo, tmp_path, outras_cartas):
+    repo.salvar_deck_físico(_deck())
+    repo.card_repo.store.fechar()
+
+    # cards.db apagado e refeito com outras cartas (ou vazio): os ids antigos não valem mais
+    (tmp_path / "cards.db").unlink()
+    outro = _repositorio(tmp_path, tmp_path / "cards.db")
+    outro.card_repo.store.salvar_lote({"name": nome, "type_line": "Sorcery"} for nome in outras_cartas)
+
+    deck = outro.carregar_deck_completo("Teste Mono R")
+
+    assert isinstance(deck["cards"], list)
+    assert _nomes_e_quantidades(deck) == [("Goblin Guide", 1), ("Mountain", 30)]
+    repo.card_repo = outro.card_repo  # O fixture fecha este
@@ -0,0 +1,40 @@
+import pytest
+
+from APP.domain.services.goldfish_simulator import GoldfishSimulator
+
+
+def _deck(terrenos: int, magicas: int) -> dict:
+    cartas = []
+    if terrenos:
+        cartas.append({"name": "Mountain", "type_line": "Basic Land - Mountain", "quantity": terrenos})
+    if magicas:
+        cartas.append({"name": "Goblin Guide", "type_line": "Creature - Goblin",
+                       "mana_cost": "{R}", "cmc": 1, "quantity": magicas})
+    return {"name": "Teste", "cards": cartas}
+
+
+def test_probabilidades_de_um_deck_so_de_terrenos():
+    relatorio = GoldfishSimulator(_deck(40, 0), seed=1).simular(total_maos=2000, turnos=3)
+
+    assert relatorio["distribuicao_terrenos"][7] == 1.0
+    assert relatorio["taxa_manter"] == 0.0  # 7 terrenos passam do máximo padrão (5)
+    assert [t["terreno_na_curva"] for t in relatorio["por_turno"]] == [1.0, 1.0, 1.0]
+    assert [t["jogada_na_curva"] for t in relatorio["por_turno"]] == [0.0, 0.0, 0.0]
+
+
+def test_distribuicao_soma_um():
+    relatorio = GoldfishSimulator(_deck(24, 36), seed=2).simular(total_maos=5000, turnos=4, tamanho_lote=777)
+    assert sum(relatorio["distribuicao_terrenos"].values()) == pytest.approx(1.0)
+    assert relatorio["maos"] == 5000
+
+
+@pytest.mark.parametrize("terrenos, magicas", [(0, 0), (3, 3)])
+def test_grimorio_menor_que_a_mao_inicial_e_rejeitado(terrenos, magicas):
+    with pytest.raises(ValueError):
+        GoldfishSimulator(_deck(terrenos, magicas)).simular(total_maos=10)
+
+
+@pytest.mark.parametrize("maos, turnos", [(0, 5), (10, 0)])
+def test_sem_maos_ou_turnos_e_rejeitado(maos, turnos):
+    with pytest.raises(ValueError):
+        GoldfishSimulator(_deck(20, 20)).simular(total_maos=maos, turnos=turnos)
@@ -0,0 +1,218 @@
+import io
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pygame
+import pytest
+
+from APP.infrastructure.services.http_client import criar_sessao
+from APP.infrastructure.services.image_downloader import ImageDownloader
+
+
+def _jpeg(seed: int = 0) -> bytes:
+    """JPEG de verdade, de ruído: maior que um chunk, como as artes da Scryfall."""
+    rng = random.Random(seed)
+    lado = 480
+    superficie = pygame.image.frombuffer(rng.randbytes(lado * lado * 3), (lado, lado), "RGB")
+    buffer = io.BytesIO()
+    pygame.image.save(superficie, buffer, "arte.jpg")
+    return buffer.getvalue()
+
+
+# =========================================================
+# SERVIDOR LOCAL (faz o papel da Scryfall)
+# =========================================================
+class _Handler(BaseHTTPRequestHandler):
+    arquivos = {}       # caminho -> bytes
+    modo = "normal"     # normal | ignorar_range | cortar
+    ranges = []         # Cabeçalhos Range recebidos, na ordem
+
+    def do_GET(self):
+        conteudo = self.arquivos.get(self.path)
+        faixa = self.headers.get("Range")
+        self.ranges.append(faixa)
+        if conteudo is None:
+            self.send_error(404)
+            return
+
+        inicio = int(faixa[len("bytes="):].rstrip("-")) if faixa and self.modo != "ignorar_range" else 0
+        if inicio >= len(conteudo):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(conteudo)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        corpo = conteudo[inicio:]
+        self.send_response(206 if inicio else 200)
+        if inicio:
+            self.send_header("Content-Range", f"bytes {inicio}-{len(conteudo) - 1}/{len(conteudo)}")
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+
+        if self.modo == "cortar":
+            # A conexão cai no meio do corpo
+            self.wfile.write(corpo[:len(corpo) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servidor():
+    _Handler.arquivos, _Handler.modo, _Handler.ranges = {}, "normal", []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield _Handler, f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def downloader(tmp_path):
+    sessao = criar_sessao(2)
+    sessao.trust_env = False  # Sem proxy do ambiente para o 127.0.0.1
+    yield ImageDownloader(base_assets=tmp_path / "assets", base_data=tmp_path / "data",
+                          workers=2, requisicoes_por_segundo=1000, sessao=sessao)
+    sessao.close()
+
+
+ARTE = _jpeg()
+
+
+def _carta(url):
+    return {"name": "Goblin Guide", "categoria": "criaturas", "image_url": url}
+
+
+def _destino(downloader):
+    return downloader.base_img_path / "criaturas" / "goblin_guide.jpg"
+
+
+def _parcial(downloader):
+    destino = _destino(downloader)
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    return destino.with_name(destino.name + ".part")
+
+
+# =========================================================
+# DOWNLOAD
+# =========================================================
+def test_download_completo(servidor, downloader):
+    assert len(ARTE) > 2 * ImageDownloader.TAMANHO_CHUNK
+    handler, base = servidor
+    handler.arquivos["/goblin.jpg"] = ARTE
+
+    ref = downloader.garantir_imagem_e_dados(_carta(base + "/goblin.jpg"))
+
+    destino = _destino(downloader)
+    assert ref["ref_image"] == destino.as_posix()
+    assert destino.read_bytes() == ARTE
+    assert not _parcial(downloader).exists()
+    with open(ref["ref_json"], encoding="utf-8") as f:
+        assert json.load(f)["local_image_path"] == destino.as_posix()
+    assert handler.ranges == [None]
+
+
+def test_retoma_do_part_com_range(servidor, downloader):
+    handler, base = servidor
+    handler.arquivos["/goblin.jpg"] = ARTE
+    _parcial(downloader).write_bytes(ARTE[:1000])
+
+    ref = downloader.garantir_imagem_e_dados(_carta(base + "/goblin.jpg"))
+
+    assert handler.ranges == ["bytes=1000-"]
+    assert ref["ref_image"] == _destino(downloader).as_posix()
+    assert _destino(downloader).read_bytes() == ARTE
+
+
+def test_416_com_part_completo_so_renomeia(servidor, downloader):
+    handler, base = servidor
+    handler.arquivos["/goblin.jpg"] = ARTE
+    _parcial(downloader).write_bytes(ARTE)
+
+    downloader.garantir_imagem_e_dados(_carta(base + "/goblin.jpg"))
+
+    assert handler.ranges == [f"bytes={len(ARTE)}-"]
+    assert _destino(downloader).read_bytes() == ARTE
+    assert not _parcial(downloader).exists()
+
+
+def test_servidor_que_ignora_range_recomeca_do_zero(servidor, downloader):
+    handler, base = servidor
+    handler.arquivos["/goblin.jpg"] = ARTE
+    handler.modo = "ignorar_range"
+    _parcial(downloader).write_bytes(b"\x00" * 500)
+
+    downloader.garantir_imagem_e_dados(_carta(base + "/goblin.jpg"))
+
+    assert handler.ranges == ["bytes=500-"]
+    assert _destino(downloader).read_bytes() == ARTE
+
+
+def test_queda_no_meio_guarda_o_part_e_retoma_depois(servidor, downloader):
+    handler, base = servidor
+    handler.arquivos["/goblin.jpg"] = ARTE
+    handler.modo = "cortar"
+    url = base + "/goblin.jpg"
+
+    ref = downloader.garantir_imagem_e_dados(_carta(url))
+
+    assert ref["ref_image"] == url  # Sem arte local ainda: cai para a URL
+    assert not _destino(downloader).exists()
+    # Os chunks que chegaram inteiros ficam no .part
+    recebidos = _parcial(downloader).stat().st_size
+    assert ImageDownloader.TAMANHO_CHUNK <= recebidos < len(ARTE)
+
+    handler.modo = "normal"
+    ref = downloader.garantir_imagem_e_dados(_carta(url))
+
+    assert handler.ranges[-1] == f"bytes={recebidos}-"
+    assert ref["ref_image"] == _destino(downloader).as_posix()
+    assert _destino(downloader).read_bytes() == ARTE
+
+
+def test_404_cai_para_a_url(servidor, downloader):
+    _, base = servidor
+    url = base + "/nao_existe.jpg"
+
+    ref = downloader.garantir_imagem_e_dados(_carta(url))
+
+    assert ref["ref_image"] == url
+    assert not _destino(downloader).exists()
+    assert not _parcial(downloader).exists()
+
+
+# =========================================================
+# REPARO DO CACHE
+# =========================================================
+def test_reparar_cache_baixa_de_novo_o_que_tem_origem(servidor, downloader):
+    handler, base = servidor
+    handler.arquivos["/goblin.jpg"] = ARTE
+
+    pasta_img = downloader.base_img_path / "criaturas"
+    pasta_json = downloader.base_data_path / "criaturas"
+    pasta_img.mkdir(parents=True)
+    pasta_json.mkdir(parents=True)
+
+    # Arte truncada com JSON (que guarda a image_url) e arte truncada órfã
+    (pasta_img / "goblin_guide.jpg").write_bytes(ARTE[:len(ARTE) // 2])
+    with open(pasta_json / "goblin_guide.json", "w", encoding="utf-8") as f:
+        json.dump(_carta(base + "/goblin.jpg"), f)
+    orfa = pasta_img / "orfa.jpg"
+    orfa.write_bytes(b"nao e jpeg")
+    (pasta_img / "inteira.jpg").write_bytes(_jpeg(1))
+
+    relatorio = downloader.reparar_cache()
+
+    assert relatorio == {
+        "verificadas": 3, "corrompidas": 2, "recuperadas": 1, "sem_origem": [orfa.as_posix()]
+    }
+    assert (pasta_img / "goblin_guide.jpg").read_bytes() == ARTE
+    assert not orfa.exists()
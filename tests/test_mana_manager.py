@@ -0,0 +1,190 @@
+import itertools
+import random
+from typing import NamedTuple, Tuple
+
+import pytest
+
+from APP.domain.models.card_definition import CardDefinition, analisar_custo
+from APP.domain.models.card_model import CardModel
+from APP.domain.models.deck_model import DeckModel
+from APP.domain.models.player_model import PlayerModel
+from APP.domain.services.mana_manager import CORES_MANA, ManaManager
+
+
+class Terreno(NamedTuple):
+    produced_mana: Tuple[str, ...]
+
+
+# =========================================================
+# REFERÊNCIA POR FORÇA BRUTA
+# =========================================================
+def _exigencias_possiveis(custo, vida_disponivel):
+    """Todas as listas de exigências (cores aceitas por símbolo) que pagam o custo."""
+    qualquer = frozenset(CORES_MANA)
+    for escolha_bif in itertools.product((True, False), repeat=len(custo.bifurcados)):
+        for escolha_phy in itertools.product((True, False), repeat=len(custo.phyrexian)):
+            vida = 2 * escolha_phy.count(False)
+            if vida > vida_disponivel:
+                continue
+            exigencias = list(custo.simbolos)
+            generico = custo.generico
+            for (cores, n), colorido in zip(custo.bifurcados, escolha_bif):
+                if colorido:
+                    exigencias.append(cores)
+                else:
+                    generico += n
+            exigencias += [cores for cores, com_mana in zip(custo.phyrexian, escolha_phy) if com_mana]
+            exigencias += [qualquer] * generico
+            yield exigencias, vida
+
+
+def _paga(exigencias, fontes) -> bool:
+    """Existe uma fonte distinta, de cor aceita, para cada exigência?"""
+    if len(exigencias) > len(fontes):
+        return False
+    for ordem in itertools.permutations(range(len(fontes)), len(exigencias)):
+        if all(fontes[i] & aceitas for i, aceitas in zip(ordem, exigencias)):
+            return True
+    return False
+
+
+def _viavel_forca_bruta(custo, pool, terrenos, vida_disponivel) -> bool:
+    fontes = [frozenset((cor,)) for cor, qtd in pool.items() for _ in range(qtd)]
+    fontes += [frozenset(t.produced_mana) for t in terrenos]
+    return any(_paga(exigencias, fontes) for exigencias, _ in _exigencias_possiveis(custo, vida_disponivel))
+
+
+def _plano_cobre(custo, pool, terrenos, plano) -> bool:
+    """O plano usa só recursos existentes e a mana escolhida paga o custo com a vida declarada."""
+    if any(qtd > pool.get(cor, 0) for cor, qtd in plano.da_pool.items()):
+        return False
+    virados = [t for t, _ in plano.terrenos]
+    if len(set(map(id, virados))) != len(virados) or any(all(t is not o for o in terrenos) for t in virados):
+        return False
+    if any(cor not in t.produced_mana for t, cor in plano.terrenos):
+        return False
+
+    fontes = [frozenset((cor,)) for cor, qtd in plano.da_pool.items() for _ in range(qtd)]
+    fontes += [frozenset((cor,)) for _, cor in plano.terrenos]
+    return any(
+        vida == plano.vida and _paga(exigencias, fontes)
+        for exigencias, vida in _exigencias_possiveis(custo, plano.vida)
+    )
+
+
+_SIMBOLOS = ["{W}", "{U}", "{B}", "{R}", "{G}", "{C}", "{1}", "{2}",
+             "{W/U}", "{B/G}", "{R/W}", "{G/P}", "{U/P}", "{2/W}", "{2/B}", "{X}"]
+_TERRENOS = [("W",), ("U",), ("B",), ("R",), ("G",), ("C",), ("W", "U"), ("B", "R", "G"), ()]
+
+
+def _caso_aleatorio(rng: random.Random):
+    mana_cost = "".join(rng.choice(_SIMBOLOS) for _ in range(rng.randint(0, 4)))
+    pool = {cor: 0 for cor in CORES_MANA}
+    for _ in range(rng.randint(0, 2)):
+        pool[rng.choice(CORES_MANA)] += 1
+    terrenos = [Terreno(rng.choice(_TERRENOS)) for _ in range(rng.randint(0, 4))]
+    return mana_cost, pool, terrenos, rng.choice((0, 1, 2, 4, 39))
+
+
+# =========================================================
+# SOLUCIONADOR
+# =========================================================
+@pytest.mark.parametrize("seed", range(6))
+def test_resolver_concorda_com_forca_bruta(seed):
+    rng = random.Random(seed)
+    for _ in range(500):
+        mana_cost, pool, terrenos, vida = _caso_aleatorio(rng)
+        custo = analisar_custo(mana_cost)
+        # Terrenos sem produced_mana geram incolor (mesma regra do gerar_mana)
+        terrenos_ref = [Terreno(t.produced_mana or ("C",)) for t in terrenos]
+
+        plano = ManaManager.resolver(custo, pool, terrenos, vida)
+
+        assert plano.viavel == _viavel_forca_bruta(custo, pool, terrenos_ref, vida), mana_cost
+        if plano.viavel:
+            mapa = dict(zip(map(id, terrenos), terrenos_ref))
+            plano_ref = plano._replace(terrenos=tuple((mapa[id(t)], cor) for t, cor in plano.terrenos))
+            assert _plano_cobre(custo, pool, terrenos_ref, plano_ref), mana_cost
+
+
+def test_analisar_custo_separa_os_tipos_de_simbolo():
+    custo = analisar_custo("{2}{W/U}{G/P}{R}{2/B}{X}")
+    assert custo.simbolos == (frozenset("WU"), frozenset("R"))
+    assert custo.phyrexian == (frozenset("G"),)
+    assert custo.bifurcados == ((frozenset("B"), 2),)
+    assert custo.generico == 2
+
+
+def test_mana_cost_map_continua_disponivel_e_somente_leitura():
+    carta = _carta("{2}{W}{W}{W/U}{2/B}{G/P}")
+    assert carta.mana_cost_map == {"Generic": 2, "W": 2, "W/U": 1, "2/B": 1, "G/P": 1}
+    assert carta.mana_cost_map is carta.definicao.mana_cost_map
+    with pytest.raises(TypeError):
+        carta.mana_cost_map["W"] = 0
+
+
+def test_reserva_vem_antes_dos_terrenos():
+    pool = {cor: 0 for cor in CORES_MANA}
+    pool["R"] = 1
+    plano = ManaManager.resolver(analisar_custo("{R}"), pool, [Terreno(("R",))], 0)
+    assert plano.viavel and plano.da_pool == {"R": 1} and plano.terrenos == ()
+
+
+def test_guarda_o_terreno_flexivel():
+    basico, dual = Terreno(("W",)), Terreno(("W", "U"))
+    plano = ManaManager.resolver(analisar_custo("{1}"), {}, [dual, basico], 0)
+    assert [t for t, _ in plano.terrenos] == [basico]
+
+
+def test_hibrido_nao_queima_a_cor_que_falta():
+    # {W/U}{W}: o híbrido tem que sair do Island, senão o {W} fica sem fonte
+    planicie, ilha = Terreno(("W",)), Terreno(("U",))
+    plano = ManaManager.resolver(analisar_custo("{W/U}{W}"), {}, [planicie, ilha], 0)
+    assert plano.viavel
+    assert sorted(cor for _, cor in plano.terrenos) == ["U", "W"]
+
+
+def test_phyrexiano_paga_com_vida_so_se_houver_vida():
+    custo = analisar_custo("{G/P}")
+    plano = ManaManager.resolver(custo, {}, [], 2)
+    assert plano.viavel and plano.vida == 2
+    assert not ManaManager.resolver(custo, {}, [], 1).viavel
+
+
+# =========================================================
+# INTEGRAÇÃO COM O JOGADOR
+# =========================================================
+def _jogador(terrenos, vida=40):
+    player = PlayerModel(player_id="P1", name="Teste", deck=DeckModel(), starting_life=vida)
+    for cores in terrenos:
+        player.battlefield_lands.append(
+            CardModel(CardDefinition(name=f"Terreno {cores}", type_line="Land", produced_mana=cores))
+        )
+    return player
+
+
+def _carta(mana_cost):
+    return CardModel(CardDefinition(name=f"Carta {mana_cost}", type_line="Creature", mana_cost=mana_cost))
+
+
+def test_castavel_concorda_com_o_plano():
+    rng = random.Random(42)
+    for _ in range(300):
+        mana_cost, _, terrenos, vida = _caso_aleatorio(rng)
+        player = _jogador([t.produced_mana for t in terrenos], vida=vida + 1)
+        if terrenos:
+            player.battlefield_lands[0].tap()
+        carta = _carta(mana_cost)
+        assert ManaManager.castavel(player, carta) == ManaManager.planejar_pagamento(player, carta).viavel
+
+
+def test_virar_terrenos_e_descontar_deixam_a_reserva_vazia():
+    player = _jogador([("R",), ("R",), ("W", "U")])
+    carta = _carta("{1}{R}")
+    plano = ManaManager.planejar_pagamento(player, carta)
+
+    ManaManager.virar_terrenos(player, plano)
+    assert ManaManager.descontar_custo(player, carta)
+
+    assert sum(player.mana_pool.values()) == 0
+    assert [t.is_tapped for t in player.battlefield_lands] == [True, True, False]
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from APP.infrastructure.services.scryfall_service import ScryfallService
+from APP.infrastructure.storage.card_store import CardStore
+from APP.infrastructure.storage.response_cache import CacheRespostas
+
+# Campos que o formatador antigo (por carta, via /cards/named) já entregava
+CAMPOS_ANTIGOS = {"name", "printed_name", "type_line", "categoria", "mana_cost",
+                  "colors", "image_url", "oracle_text", "rarity"}
+
+PLANESWALKER = {
+    "object": "card", "name": "Chandra, Torch of Defiance", "lang": "en", "layout": "normal",
+    "type_line": "Legendary Planeswalker — Chandra", "mana_cost": "{2}{R}{R}", "cmc": 4,
+    "colors": ["R"], "color_identity": ["R"], "loyalty": "4",
+    "image_uris": {"normal": "https://img/chandra.jpg"}, "rarity": "mythic"
+}
+DUPLA_FACE = {
+    "object": "card", "name": "Valki, God of Lies // Tibalt, Cosmic Impostor", "lang": "en",
+    "layout": "modal_dfc", "type_line": "Legendary Creature — God // Legendary Planeswalker — Tibalt",
+    "cmc": 2, "color_identity": ["B", "R"],
+    "card_faces": [
+        {"name": "Valki, God of Lies", "mana_cost": "{1}{B}", "power": "2", "toughness": "1",
+         "colors": ["B"], "image_uris": {"normal": "https://img/valki.jpg"}},
+        {"name": "Tibalt, Cosmic Impostor", "mana_cost": "{5}{B}{R}", "loyalty": "5", "colors": ["B", "R"]}
+    ]
+}
+TOKEN = {"object": "card", "name": "Goblin", "layout": "token", "type_line": "Token Creature — Goblin"}
+
+
+@pytest.fixture
+def servico(tmp_path):
+    return ScryfallService(cache=CacheRespostas(tmp_path / "cache.jsonl"))
+
+
+def test_formatador_mantem_os_campos_antigos_e_a_lealdade(servico):
+    carta = servico._formatar_dados(PLANESWALKER)
+    assert CAMPOS_ANTIGOS <= carta.keys()
+    assert carta["loyalty"] == "4"
+    assert carta["categoria"] == "Planeswalkers"
+
+
+def test_bulk_grava_a_lealdade_no_acervo(servico, tmp_path):
+    arquivo = tmp_path / "oracle-cards.json"
+    arquivo.write_text(json.dumps([PLANESWALKER, DUPLA_FACE, TOKEN]), encoding="utf-8")
+    store = CardStore(tmp_path / "cards.db")
+
+    assert servico.importar_bulk(arquivo, store) == 2
+
+    assert store.obter("Chandra, Torch of Defiance")["loyalty"] == "4"
+    valki = store.obter("Valki, God of Lies // Tibalt, Cosmic Impostor")
+    assert valki["mana_cost"] == "{1}{B}" and valki["power"] == "2"
+    assert store.obter("Goblin") is None
+    store.fechar()
+
+
+class _RepoFalso:
+    def __init__(self, cartas):
+        self.cartas = cartas
+
+    def buscar_cartas_locais(self, nomes):
+        return {n: self.cartas[n] for n in nomes if n in self.cartas}
+
+
+def test_planeswalker_local_sem_lealdade_volta_para_a_api(tmp_path):
+    completo = {"type_line": "", "mana_cost": "", "cmc": 0, "produced_mana": [], "color_identity": []}
+    repo = _RepoFalso({
+        "Antigo": {**completo, "type_line": "Legendary Planeswalker — Chandra"},
+        "Novo": {**completo, "type_line": "Legendary Planeswalker — Chandra", "loyalty": "4"},
+        "Montanha": {**completo, "type_line": "Basic Land — Mountain"},
+    })
+    servico = ScryfallService(card_repo=repo, cache=CacheRespostas(tmp_path / "cache.jsonl"))
+
+    assert set(servico._buscar_locais(["Antigo", "Novo", "Montanha"])) == {"Novo", "Montanha"}